@@ -0,0 +1,128 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content-addressed, on-disk cache for the intermediate results of the conversion pipeline.
+
+Each entry is identified by the hash of all the inputs and configuration determining it, so a
+changed input results in a new entry instead of requiring any invalidation.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from importlib import metadata
+from typing import Any, Callable, Optional, Union
+
+# Increase this when the format of the cached entries changes
+CACHE_FORMAT_VERSION = 5
+
+# The packages whose version affects the cached conversion results
+TOOLCHAIN_PACKAGES = ("as2fm_common", "scxml_converter", "jani_generator")
+
+
+def _get_toolchain_version() -> str:
+    """Get a string identifying the version of the toolchain and of the Python interpreter."""
+    versions = [f"python-{sys.version_info.major}.{sys.version_info.minor}"]
+    for package in TOOLCHAIN_PACKAGES:
+        try:
+            versions.append(f"{package}-{metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}-unknown")
+    return ";".join(versions)
+
+
+class BuildCache:
+    """
+    On-disk cache, storing picklable objects by content-addressed keys.
+
+    Note: the entries are stored with pickle. Use only cache directories written by yourself.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the cache.
+
+        :param cache_dir: The directory storing the cache entries. Created if not existing.
+        """
+        self._cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self._toolchain_version = _get_toolchain_version()
+        self._hits = 0
+        self._misses = 0
+
+    def make_key(self, namespace: str, *parts: Union[str, bytes]) -> str:
+        """
+        Generate the key of a cache entry.
+
+        :param namespace: The kind of entry (e.g. the name of the conversion step).
+        :param parts: All the inputs and configuration determining the entry.
+        :return: The key of the entry.
+        """
+        hasher = hashlib.sha256()
+        for part in (str(CACHE_FORMAT_VERSION), self._toolchain_version, namespace) + parts:
+            part_bytes = part.encode("utf-8") if isinstance(part, str) else part
+            # Prefix each part with its length, to avoid ambiguous concatenations
+            hasher.update(len(part_bytes).to_bytes(8, "little"))
+            hasher.update(part_bytes)
+        return f"{namespace}-{hasher.hexdigest()}"
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{key}.pickle")
+
+    def load(self, key: str,
+             is_valid: Optional[Callable[[Any], bool]] = None) -> Optional[Any]:
+        """
+        Load an entry from the cache.
+
+        :param key: The key of the entry, generated with make_key.
+        :param is_valid: Check of the inputs that are not part of the key, if any. The entries
+            failing it are handled as missing.
+        :return: The stored object, None if the entry does not exist or is not valid.
+        """
+        entry_path = self._get_entry_path(key)
+        if not os.path.isfile(entry_path):
+            self._misses += 1
+            return None
+        with open(entry_path, "rb") as f:
+            entry = pickle.load(f)
+        if is_valid is not None and not is_valid(entry):
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry
+
+    def store(self, key: str, entry: Any) -> None:
+        """
+        Store an entry in the cache.
+
+        :param key: The key of the entry, generated with make_key.
+        :param entry: The object to store.
+        """
+        # Write to a temporary file first, so that concurrent runs never read partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._get_entry_path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def get_stats(self) -> str:
+        """Get a summary of the cache usage."""
+        return f"Build cache: {self._hits} hits, {self._misses} misses."
@@ -17,7 +17,8 @@
 Common functionalities used throughout the toolchain.
 """
 
-from typing import Union
+import re
+from typing import Optional, Tuple, Union
 
 ValidTypes = Union[bool, int, float]
 """We define the basic types that are supported by the Jani language:
@@ -54,6 +55,21 @@ def ros_type_name_to_python_type(type_str: str) -> type:
     raise NotImplementedError(f"Type {type_str} not supported.")
 
 
+def ros_type_name_to_bounds(type_str: str) -> Optional[Tuple[int, int]]:
+    """Get the range of values of a ROS integer type, from its bit width.
+
+    :param type_str: The string representing the type
+    :return: The lower and upper bounds (included), None if the type is not an integer
+    """
+    int_match = re.fullmatch(r"(u?)int(8|16|32|64)", type_str)
+    if int_match is None:
+        return None
+    n_bits = int(int_match.group(2))
+    if int_match.group(1) == "u":
+        return 0, 2 ** n_bits - 1
+    return -2 ** (n_bits - 1), 2 ** (n_bits - 1) - 1
+
+
 def remove_namespace(tag: str) -> str:
     """
     If a tag has a namespace, remove it.
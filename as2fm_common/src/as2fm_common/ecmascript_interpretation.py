@@ -17,12 +17,19 @@
 Module for interpreting ecmascript.
 """
 
-from typing import Dict, Optional
-
-import js2py
+from typing import TYPE_CHECKING, Dict, Optional, Type
 
 from as2fm_common.common import ValidTypes
 
+if TYPE_CHECKING:
+    # esprima and js2py are slow to import: they are imported at their first use
+    import esprima
+
+# Operators returning a boolean, independently from the type of their operands
+BOOLEAN_RESULT_OPERATORS = ("<", "<=", ">", ">=", "==", "!=", "===", "!==")
+# Arithmetic operators, returning an int if both operands are int, a float otherwise
+ARITHMETIC_OPERATORS = ("+", "-", "*", "%")
+
 
 def interpret_ecma_script_expr(
         expr: str, variables: Optional[Dict[str, ValidTypes]] = None) -> object:
@@ -31,8 +38,107 @@ def interpret_ecma_script_expr(
     :param expr: The ECMA script expression
     :return: The interpreted object
     """
+    import js2py
+
     if variables is None:
         variables = {}
     context = js2py.EvalJs(variables)
     context.execute("result = " + expr)
     return context.result
+
+
+def interpret_ecma_script_expr_type(
+        expr: str,
+        variable_types: Optional[Dict[str, Type[ValidTypes]]] = None) -> Type[ValidTypes]:
+    """Infer the type of an ECMA script expression, without executing it.
+
+    The type is derived statically from the esprima AST, using the provided variable types for
+    the identifiers (e.g. `battery_percent`) and member expressions (e.g. `_event.data`).
+
+    :param expr: The ECMA script expression
+    :param variable_types: The types of the variables that can be referenced in the expression
+    :raises ValueError: If the type cannot be inferred, or it is not supported by Jani
+    :return: The type of the expression result
+    """
+    if variable_types is None:
+        variable_types = {}
+    return _interpret_ast_type(_parse_ecma_script_expr(expr), variable_types)
+
+
+def _parse_ecma_script_expr(expr: str) -> "esprima.nodes.Node":
+    """Parse a string containing a single ECMA script expression, returning its AST."""
+    import esprima
+
+    try:
+        ast = esprima.parseScript(expr)
+    except esprima.Error as e:
+        raise ValueError(f"Cannot parse the expression '{expr}': {e}") from e
+    if len(ast.body) != 1 or ast.body[0].type != "ExpressionStatement":
+        raise ValueError(f"The ecmascript '{expr}' must contain exactly one expression.")
+    return ast.body[0].expression
+
+
+def _get_member_expression_name(ast: "esprima.nodes.Node") -> str:
+    """Get the name of a (nested) member expression in the form 'object.property'."""
+    if ast.type == "Identifier":
+        return ast.name
+    if ast.type == "MemberExpression" and not ast.computed:
+        return f"{_get_member_expression_name(ast.object)}.{ast.property.name}"
+    raise ValueError(f"Unsupported member expression of type {ast.type}.")
+
+
+def _merge_numeric_types(
+        left_type: Type[ValidTypes], right_type: Type[ValidTypes]) -> Type[ValidTypes]:
+    """Get the resulting type of a numeric operation: booleans are treated as integers."""
+    if float in (left_type, right_type):
+        return float
+    return int
+
+
+def _interpret_ast_type(
+        ast: "esprima.nodes.Node",
+        variable_types: Dict[str, Type[ValidTypes]]) -> Type[ValidTypes]:
+    """Recursively infer the type of an ECMA script AST node."""
+    if ast.type == "Literal":
+        if isinstance(ast.value, bool):
+            return bool
+        if isinstance(ast.value, int):
+            return int
+        if isinstance(ast.value, float):
+            # Same as in js2py, numbers without decimal part are considered integers
+            return int if ast.value.is_integer() else float
+        raise ValueError(f"Literal {ast.raw} has a type that is not supported by Jani.")
+    if ast.type in ("Identifier", "MemberExpression"):
+        var_name = _get_member_expression_name(ast)
+        if var_name not in variable_types:
+            raise ValueError(f"Cannot infer the type of the unknown variable '{var_name}'.")
+        return variable_types[var_name]
+    if ast.type == "UnaryExpression":
+        arg_type = _interpret_ast_type(ast.argument, variable_types)
+        if ast.operator == "!":
+            return bool
+        if ast.operator in ("-", "+"):
+            return _merge_numeric_types(arg_type, int)
+        raise ValueError(f"Unsupported unary operator '{ast.operator}'.")
+    if ast.type == "BinaryExpression":
+        left_type = _interpret_ast_type(ast.left, variable_types)
+        right_type = _interpret_ast_type(ast.right, variable_types)
+        if ast.operator in BOOLEAN_RESULT_OPERATORS:
+            return bool
+        if ast.operator in ARITHMETIC_OPERATORS:
+            return _merge_numeric_types(left_type, right_type)
+        if ast.operator == "/":
+            return float
+        raise ValueError(f"Unsupported binary operator '{ast.operator}'.")
+    if ast.type in ("LogicalExpression", "ConditionalExpression"):
+        if ast.type == "LogicalExpression":
+            left_type = _interpret_ast_type(ast.left, variable_types)
+            right_type = _interpret_ast_type(ast.right, variable_types)
+        else:
+            _interpret_ast_type(ast.test, variable_types)
+            left_type = _interpret_ast_type(ast.consequent, variable_types)
+            right_type = _interpret_ast_type(ast.alternate, variable_types)
+        if left_type == right_type:
+            return left_type
+        return _merge_numeric_types(left_type, right_type)
+    raise ValueError(f"Unsupported ecmascript type: {ast.type}.")
@@ -0,0 +1,66 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the content-addressed build cache."""
+
+import tempfile
+import unittest
+
+import pytest
+
+from as2fm_common.build_cache import BuildCache
+
+
+class TestBuildCache(unittest.TestCase):
+
+    def test_keys(self):
+        """Keys depend on the namespace and on every part of the content."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = BuildCache(cache_dir)
+            key = cache.make_key("step", "<scxml/>", b"data")
+            self.assertEqual(key, cache.make_key("step", "<scxml/>", b"data"))
+            self.assertNotEqual(key, cache.make_key("other_step", "<scxml/>", b"data"))
+            self.assertNotEqual(key, cache.make_key("step", "<scxml/>", b"other_data"))
+            self.assertNotEqual(cache.make_key("step", "ab", "c"),
+                                cache.make_key("step", "a", "bc"))
+
+    def test_store_and_load(self):
+        """Stored entries are available to other cache instances using the same directory."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = BuildCache(cache_dir)
+            key = cache.make_key("step", "input")
+            self.assertIsNone(cache.load(key))
+            cache.store(key, {"automaton": ["loc_a", "loc_b"]})
+            self.assertEqual(cache.load(key), {"automaton": ["loc_a", "loc_b"]})
+            self.assertEqual(cache.get_stats(), "Build cache: 1 hits, 1 misses.")
+            other_cache = BuildCache(cache_dir)
+            self.assertEqual(other_cache.load(key), {"automaton": ["loc_a", "loc_b"]})
+
+    def test_load_validation(self):
+        """Entries failing the validation check are handled as missing."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = BuildCache(cache_dir)
+            key = cache.make_key("step", "input")
+            cache.store(key, {"interfaces": {"msg": "int32 data"}})
+            self.assertIsNone(cache.load(
+                key, lambda entry: entry["interfaces"] == {"msg": "int64 data"}))
+            self.assertEqual(cache.load(
+                key, lambda entry: entry["interfaces"] == {"msg": "int32 data"}),
+                {"interfaces": {"msg": "int32 data"}})
+            self.assertEqual(cache.get_stats(), "Build cache: 1 hits, 1 misses.")
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
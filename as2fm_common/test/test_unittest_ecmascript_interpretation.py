@@ -0,0 +1,53 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the static type inference of ECMA script expressions."""
+
+import unittest
+
+import pytest
+
+from as2fm_common.ecmascript_interpretation import (
+    interpret_ecma_script_expr, interpret_ecma_script_expr_type)
+
+
+class TestEcmaScriptTypeInference(unittest.TestCase):
+
+    def test_literals(self):
+        """Literals get the same type js2py would return for them."""
+        for expr in ["true", "false", "0", "555", "1.0", "777.777"]:
+            self.assertEqual(interpret_ecma_script_expr_type(expr),
+                             type(interpret_ecma_script_expr(expr)))
+
+    def test_expressions_with_variables(self):
+        """The types of the variables are used to infer the expression type."""
+        variables = {"counter": int, "speed": float, "flag": bool, "_event.data": int}
+        self.assertEqual(interpret_ecma_script_expr_type("counter + 1", variables), int)
+        self.assertEqual(interpret_ecma_script_expr_type("counter * speed", variables), float)
+        self.assertEqual(interpret_ecma_script_expr_type("counter / 2", variables), float)
+        self.assertEqual(interpret_ecma_script_expr_type("_event.data < 30", variables), bool)
+        self.assertEqual(interpret_ecma_script_expr_type("!flag && counter > 0", variables), bool)
+        self.assertEqual(interpret_ecma_script_expr_type("-_event.data", variables), int)
+        self.assertEqual(interpret_ecma_script_expr_type("flag ? 1 : speed", variables), float)
+
+    def test_unsupported_expressions(self):
+        """Expressions that cannot be typed statically raise a ValueError."""
+        for expr in ["'a string'", "null", "undefined", "new Date()",
+                     "function() { return 1 }", "unknown_var + 1", "a; b"]:
+            self.assertRaises(ValueError, interpret_ecma_script_expr_type, expr)
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
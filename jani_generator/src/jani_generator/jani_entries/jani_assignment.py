@@ -22,6 +22,8 @@ from typing import Dict
 from jani_generator.jani_entries import JaniConstant, JaniExpression
 from jani_generator.jani_entries.jani_convince_expression_expansion import \
     expand_expression
+from jani_generator.jani_entries.jani_expression_simplifier import \
+    simplify_expression
 
 
 class JaniAssignment:
@@ -37,11 +39,26 @@ class JaniAssignment:
         if "index" in assignment_dict:
             self._index = assignment_dict["index"]
 
+    def get_target(self) -> str:
+        """Get the name of the assigned variable"""
+        return self._var_name
+
+    def get_expression(self) -> JaniExpression:
+        """Get the assigned expression"""
+        return self._value
+
+    def get_index(self) -> int:
+        """Get the index of the assignment"""
+        return self._index
+
+    def get_plain_expression(self, constants: Dict[str, JaniConstant]) -> JaniExpression:
+        """Get the assigned expression, with expanded CONVINCE operators and simplified"""
+        return simplify_expression(expand_expression(self._value, constants), constants)
+
     def as_dict(self, constants: Dict[str, JaniConstant]):
         """Transform the assignment to a dictionary"""
-        expanded_value = expand_expression(self._value, constants)
         return {
             "ref": self._var_name,
-            "value": expanded_value.as_dict(),
+            "value": self.get_plain_expression(constants).as_dict(),
             "index": self._index
         }
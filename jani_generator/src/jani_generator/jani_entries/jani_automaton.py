@@ -15,10 +15,30 @@
 
 """An automaton for jani."""
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
 
-from jani_generator.jani_entries import (JaniConstant, JaniEdge,
-                                         JaniExpression, JaniVariable)
+from jani_generator.jani_entries import (JaniAssignment, JaniConstant,
+                                         JaniEdge, JaniExpression,
+                                         JaniVariable)
+from jani_generator.jani_entries.jani_edge_compaction import (
+    are_guards_exhaustive, get_guard_after_assignments, get_guard_expression,
+    get_max_assignment_index, merge_consecutive_edges)
+from jani_generator.jani_entries.jani_expression import \
+    get_expression_identifiers
+from jani_generator.jani_entries.jani_expression_cse import (
+    count_expression_nodes, eliminate_common_subexpressions_in_assignments)
+
+
+def _count_assignments_nodes(
+        assignments: List[JaniAssignment], constants: Dict[str, JaniConstant]) -> int:
+    """Count the nodes of the expanded expressions in the provided assignments."""
+    return sum(count_expression_nodes(assignment.get_plain_expression(constants))
+               for assignment in assignments)
+
+
+def _is_deterministic_edge(edge: JaniEdge) -> bool:
+    """Check if an edge has a single destination, reached with probability one."""
+    return len(edge.destinations) == 1 and edge.destinations[0]["probability"] is None
 
 
 class JaniAutomaton:
@@ -26,7 +46,12 @@ class JaniAutomaton:
         self._locations: Set[str] = set()
         self._initial_locations: Set[str] = set()
         self._local_variables: Dict[str, JaniVariable] = {}
-        self._edges: List[JaniEdge] = []
+        # Edges by insertion id: removing one does not require to rebuild the whole container
+        self._edges: Dict[int, JaniEdge] = {}
+        self._next_edge_key = 0
+        # Indexes of the edges' insertion ids, by action name and by source location
+        self._edges_by_action: Dict[str, Set[int]] = {}
+        self._edges_by_location: Dict[str, Set[int]] = {}
         # Id to autogenerate edge action name if not provided
         self._edge_id = 0
         if automaton_dict is None:
@@ -48,6 +73,16 @@ class JaniAutomaton:
         if is_initial:
             self._initial_locations.add(location_name)
 
+    def get_locations(self) -> Set[str]:
+        return self._locations
+
+    def remove_location(self, location_name: str):
+        """Remove a location, that must not be the source of any edge."""
+        assert location_name not in self._edges_by_location, \
+            f"Location {location_name} still has outgoing edges."
+        self._locations.discard(location_name)
+        self._initial_locations.discard(location_name)
+
     def get_initial_locations(self) -> Set[str]:
         return self._initial_locations
 
@@ -70,21 +105,61 @@ class JaniAutomaton:
         return self._local_variables
 
     def add_edge(self, edge: JaniEdge):
-        if edge.get_action() is None:
-            edge.set_action(f"{self._name}_action_{self._edge_id}")
+        edge_action = edge.get_action()
+        if edge_action is None:
+            edge_action = f"{self._name}_action_{self._edge_id}"
+            edge.set_action(edge_action)
             self._edge_id += 1
-        self._edges.append(edge)
+        edge_key = self._next_edge_key
+        self._next_edge_key += 1
+        self._edges[edge_key] = edge
+        self._edges_by_action.setdefault(edge_action, set()).add(edge_key)
+        self._edges_by_location.setdefault(edge.location, set()).add(edge_key)
+
+    def _remove_edge(self, edge_key: int):
+        """Remove an edge from the automaton and from the indexes."""
+        edge = self._edges.pop(edge_key)
+        for index, index_key in [(self._edges_by_action, edge.get_action()),
+                                 (self._edges_by_location, edge.location)]:
+            index[index_key].discard(edge_key)
+            if len(index[index_key]) == 0:
+                del index[index_key]
+
+    def remove_edge(self, edge: JaniEdge):
+        """Remove the provided edge from the automaton."""
+        edge_keys = [edge_key for edge_key in self._edges_by_location.get(edge.location, ())
+                     if self._edges[edge_key] is edge]
+        assert len(edge_keys) == 1, f"Edge from {edge.location} not found in {self._name}."
+        self._remove_edge(edge_keys[0])
 
     def get_edges(self) -> List[JaniEdge]:
-        return self._edges
+        return list(self._edges.values())
+
+    def get_edges_with_action(self, action_name: str) -> List[JaniEdge]:
+        """Get the edges with the provided action name, in insertion order."""
+        return [self._edges[edge_key]
+                for edge_key in sorted(self._edges_by_action.get(action_name, ()))]
+
+    def get_edges_from_location(self, location_name: str) -> List[JaniEdge]:
+        """Get the edges starting from the provided location, in insertion order."""
+        return [self._edges[edge_key]
+                for edge_key in sorted(self._edges_by_location.get(location_name, ()))]
 
     def remove_edges_with_action_name(self, action_name: str):
         assert isinstance(action_name, str), "Action name must be a string"
-        self._edges = [edge for edge in self._edges if edge.get_action() != action_name]
+        for edge_key in list(self._edges_by_action.get(action_name, ())):
+            self._remove_edge(edge_key)
+
+    def remove_edges_with_action_names(self, action_names: Iterable[str]):
+        """Remove all the edges having one of the provided action names."""
+        for action_name in set(action_names).intersection(self._edges_by_action):
+            self.remove_edges_with_action_name(action_name)
 
     def remove_empty_self_loop_edges(self):
         """Remove all self-loop edges from the automaton."""
-        self._edges = [edge for edge in self._edges if not edge.is_empty_self_loop()]
+        for edge_key in [edge_key for edge_key, edge in self._edges.items()
+                         if edge.is_empty_self_loop()]:
+            self._remove_edge(edge_key)
 
     def _generate_locations(self, location_list: List[Dict[str, Any]], initial_locations: List[str]):
         for location in location_list:
@@ -101,8 +176,9 @@ class JaniAutomaton:
             if "transient" in variable:
                 is_transient = variable["transient"]
             var_type = JaniVariable.jani_type_from_string(variable["type"])
+            var_bounds = JaniVariable.jani_bounds_from_type(variable["type"])
             self._local_variables.update({variable["name"]: JaniVariable(
-                variable["name"], var_type, init_expr, is_transient)})
+                variable["name"], var_type, init_expr, is_transient, var_bounds)})
 
     def _generate_edges(self, edge_list: List[dict]):
         for edge in edge_list:
@@ -110,26 +186,118 @@ class JaniAutomaton:
             self.add_edge(jani_edge)
 
     def get_actions(self) -> Set[str]:
-        actions = set()
-        for edge in self._edges:
-            action = edge.get_action()
-            if action is not None:
-                actions.add(action)
-        return actions
+        """Get the actions of the automaton's edges. Every added edge has an action."""
+        return set(self._edges_by_action)
+
+    def has_action(self, action_name: str) -> bool:
+        """Check if any edge in the automaton has the provided action name."""
+        return action_name in self._edges_by_action
+
+    def eliminate_common_subexpressions(
+            self, constants: Dict[str, JaniConstant],
+            global_types: Dict[str, Type]) -> Tuple[int, int]:
+        """
+        Store the operations repeated in the assignments of each destination in local variables.
+
+        :param constants: The constants of the model, required for expanding the expressions.
+        :param global_types: The types of the global variables and constants.
+        :return: The amount of expression nodes in the assignments, before and after the process.
+        """
+        variable_types = {**global_types,
+                          **{name: var.get_type() for name, var in self._local_variables.items()}}
+        cse_variables: Dict[str, Type] = {}
+        nodes_before = 0
+        nodes_after = 0
+        for edge in self._edges.values():
+            for destination in edge.destinations:
+                assignments = destination["assignments"]
+                nodes_before += _count_assignments_nodes(assignments, constants)
+                assignments, new_variables = eliminate_common_subexpressions_in_assignments(
+                    assignments, constants, variable_types)
+                nodes_after += _count_assignments_nodes(assignments, constants)
+                destination["assignments"] = assignments
+                cse_variables.update(new_variables)
+        # The transient variables can be reused across edges
+        for var_name, var_type in cse_variables.items():
+            self.add_variable(JaniVariable(var_name, var_type, v_transient=True))
+        return nodes_before, nodes_after
+
+    def compact_edge_chains(self, local_actions: Set[str],
+                            partners_assignments: Dict[str, Tuple[Set[str], int]]) -> int:
+        """
+        Remove the locations only sequencing local edges, merging their incoming and outgoing edges.
+
+        A location is removed if it is not initial and all its outgoing edges are local, with
+        exhaustive guards not depending on the values assigned by the sync partners of the incoming
+        edges. Each pair of incoming and outgoing edges is replaced by a single edge, assigning the
+        values of the outgoing edge after the ones of the incoming edge (and of its partners).
+
+        :param local_actions: The actions that are not synchronized with other automata.
+        :param partners_assignments: For each synchronized action, the variables assigned by the
+            other automata in the same syncs and the highest index of their assignments.
+        :return: The amount of removed locations.
+        """
+        incoming_edges: Dict[str, Set[int]] = {}
+        for edge_key, edge in self._edges.items():
+            for destination in edge.destinations:
+                incoming_edges.setdefault(destination["location"], set()).add(edge_key)
+        removed_locations = 0
+        for location in sorted(self._locations - self._initial_locations):
+            in_keys = sorted(incoming_edges.get(location, ()))
+            out_keys = sorted(self._edges_by_location.get(location, ()))
+            if len(in_keys) == 0 or len(out_keys) == 0:
+                continue
+            in_edges = [self._edges[edge_key] for edge_key in in_keys]
+            out_edges = [self._edges[edge_key] for edge_key in out_keys]
+            if not all(_is_deterministic_edge(edge) and edge.location != location
+                       for edge in in_edges):
+                continue
+            if not all(_is_deterministic_edge(edge) and edge.get_action() in local_actions
+                       for edge in out_edges):
+                continue
+            out_guards = [get_guard_expression(edge) for edge in out_edges]
+            if not are_guards_exhaustive(out_guards):
+                continue
+            merged_edges: List[JaniEdge] = []
+            for in_edge in in_edges:
+                in_action = in_edge.get_action()
+                partners_variables, partners_max_index = (set(), -1) if in_action is None else \
+                    partners_assignments.get(in_action, (set(), -1))
+                # The merged guards are evaluated before the assignments of the sync partners
+                in_assignments = in_edge.destinations[0]["assignments"]
+                if any(not partners_variables.isdisjoint(get_expression_identifiers(
+                        get_guard_after_assignments(guard, in_assignments)))
+                       for guard in out_guards if guard is not None):
+                    break
+                index_shift = max(get_max_assignment_index(in_edge), partners_max_index) + 1
+                merged_edges.extend(merge_consecutive_edges(in_edge, out_edge, index_shift)
+                                    for out_edge in out_edges)
+            else:
+                for edge_key in in_keys + out_keys:
+                    for destination in self._edges[edge_key].destinations:
+                        incoming_edges[destination["location"]].discard(edge_key)
+                    self._remove_edge(edge_key)
+                self.remove_location(location)
+                for edge in merged_edges:
+                    incoming_edges[edge.destinations[0]["location"]].add(self._next_edge_key)
+                    self.add_edge(edge)
+                removed_locations += 1
+        return removed_locations
 
     def merge(self, other: 'JaniAutomaton'):
         assert self._name == other.get_name(), "Automaton names must match"
         self._locations.update(other._locations)
         self._initial_locations.update(other._initial_locations)
         self._local_variables.update(other._local_variables)
-        self._edges.extend(other._edges)
+        for edge in other._edges.values():
+            self.add_edge(edge)
 
     def as_dict(self, constant: Dict[str, JaniConstant]):
         automaton_dict = {
             "name": self._name,
             "locations": [{"name": location} for location in sorted(self._locations)],
             "initial-locations": sorted(list(self._initial_locations)),
-            "edges": [edge.as_dict(constant) for edge in self._edges]
+            "edges": [edge.as_dict(constant) for edge in self._edges.values()]
         }
         if len(self._local_variables) > 0:
             automaton_dict.update(
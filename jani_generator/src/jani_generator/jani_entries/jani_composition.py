@@ -11,100 +11,146 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
-# limitations under the License.from typing import List
+# limitations under the License.
 
 """This allows the composition of multiple automata in jani."""
 
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# A synchronization: the resulting action and the action executed by each participating element
+JaniSync = Tuple[Optional[str], Dict[str, str]]
 
 
 class JaniComposition:
+    """
+    Composition of the automata in a Jani model.
+
+    The syncs are stored sparsely, i.e. only the participating elements are stored for each sync.
+    The dense synchronise lists, containing one entry per element, are generated in as_dict.
+    """
     def __init__(self, composition_dict: Optional[Dict[str, Any]] = None):
+        self._elements: List[str] = []
+        self._element_to_id: Dict[str, int] = {}
+        # The syncs, indexed by an increasing id to keep their order when some are removed
+        self._syncs: Dict[int, JaniSync] = {}
+        self._next_sync_id = 0
+        # Per element, the amount of syncs in which it executes each action
+        self._element_actions: Dict[str, Counter[str]] = {}
+        # Per element and action, the ids of the syncs in which the element executes the action
+        self._element_action_syncs: Dict[Tuple[str, str], Set[int]] = {}
         if composition_dict is None:
-            self._elements = []
-            self._syncs = []
-            self._element_to_id = {}
             return
-        self._elements = self._generate_elements(composition_dict["elements"])
-        self._syncs = self._generate_syncs(composition_dict["syncs"])
-        self._element_to_id = {element: idx for idx,
-                               element in enumerate(self._elements)}
+        for element in self._generate_elements(composition_dict["elements"]):
+            self.add_element(element)
+        for sync_name, sync_participants in self._generate_syncs(composition_dict["syncs"]):
+            self.add_sync(sync_name, sync_participants)
         assert self.is_valid(), "Invalid composition from dict."
 
     def add_element(self, element: str):
         """Append a new automaton name in the composition."""
-        assert element not in self._elements, \
+        assert element not in self._element_to_id, \
             f"Element {element} already exists in the composition"
         self._elements.append(element)
         self._element_to_id[element] = len(self._elements) - 1
-        for sync in self._syncs:
-            assert len(sync["synchronise"]) == len(self._elements) - 1, \
-                "Unexpected number of syncs found in the composition during the update"
-            sync["synchronise"].append(None)
+        self._element_actions[element] = Counter()
 
     def get_elements(self):
         """Get the elements of the composition."""
         return self._elements
 
-    def add_sync(self, sync_name: str, syncs: Dict[str, str]):
+    def add_sync(self, sync_name: Optional[str], syncs: Dict[str, str]):
         """Add a new synchronization between the elements.
 
         :param sync_name: The name of the synchronization action
         :param syncs: A dictionary relating each automaton to the action to be executed in the sync
         """
-        # Generate the synchronize list
-        sync_list: List[Optional[str]] = [None] * len(self._elements)
+        sync_id = self._next_sync_id
+        self._next_sync_id += 1
         for automata, action in syncs.items():
             assert automata in self._element_to_id, \
                 f"Automaton {automata} does not exist in the composition"
-            sync_list[self._element_to_id[automata]] = action
-        self._syncs.append({
-            "result": sync_name,
-            "synchronise": sync_list
-        })
+            self._element_actions[automata][action] += 1
+            self._element_action_syncs.setdefault((automata, action), set()).add(sync_id)
+        self._syncs[sync_id] = (sync_name, dict(syncs))
+
+    def remove_element_syncs(self, element: str, actions: Iterable[str]):
+        """Remove the synchronizations in which an element executes one of the provided actions.
+
+        :param element: The element (=automaton) executing the actions.
+        :param actions: The actions whose syncs shall be removed.
+        """
+        removed_sync_ids: Set[int] = set()
+        for action in actions:
+            removed_sync_ids.update(self._element_action_syncs.get((element, action), ()))
+        for sync_id in removed_sync_ids:
+            _, sync_participants = self._syncs.pop(sync_id)
+            for automata, action in sync_participants.items():
+                self._element_actions[automata][action] -= 1
+                if self._element_actions[automata][action] == 0:
+                    del self._element_actions[automata][action]
+                action_syncs = self._element_action_syncs[(automata, action)]
+                action_syncs.discard(sync_id)
+                if len(action_syncs) == 0:
+                    del self._element_action_syncs[(automata, action)]
+
+    def get_syncs(self) -> List[JaniSync]:
+        """Get the synchronizations, with the action executed by each participating element."""
+        return list(self._syncs.values())
 
     def get_syncs_for_element(self, element: str) -> List[str]:
         """Get the existing syncs for a specific element (=automaton)."""
         assert element in self._element_to_id, \
             f"Element {element} does not exist in the composition"
-        syncs_w_none = [sync['synchronise'][self._element_to_id[element]]
-                        for sync in self._syncs]
-        return [sync for sync in syncs_w_none if sync is not None]
+        return list(self._element_actions[element].elements())
+
+    def has_sync_for_element(self, element: str, action: str) -> bool:
+        """Check if an element (=automaton) executes the provided action in any sync."""
+        assert element in self._element_to_id, \
+            f"Element {element} does not exist in the composition"
+        return action in self._element_actions[element]
 
     def is_valid(self) -> bool:
         if len(self._elements) == 0:
             print("Found empty elements (automata) list.")
             return False
-        for sync in self._syncs:
-            if len(sync["synchronise"]) != len(self._elements):
+        for _, sync_participants in self._syncs.values():
+            if not all(element in self._element_to_id for element in sync_participants):
                 print("Found invalid syncs entry.")
                 return False
         return True
 
-    def _generate_elements(self, elements_list):
+    def _generate_elements(self, elements_list) -> List[str]:
         elements = []
         for element in elements_list:
             elements.append(element["automaton"])
         return elements
 
-    def _generate_syncs(self, syncs_list):
+    def _generate_syncs(self, syncs_list) -> List[JaniSync]:
         generated_syncs = []
         for sync in syncs_list:
             assert len(self._elements) == len(
                 sync["synchronise"]), "The number of elements and synchronise should be the same"
-            sync_dict = {
-                "synchronise": sync["synchronise"],
-                "result": None
-            }
-            if "result" in sync:
-                sync_dict["result"] = sync["result"]
-            generated_syncs.append(sync_dict)
+            sync_participants = {
+                self._elements[idx]: action for idx, action in enumerate(sync["synchronise"])
+                if action is not None}
+            generated_syncs.append((sync.get("result"), sync_participants))
         return generated_syncs
 
+    def _get_dense_sync(self, sync: JaniSync) -> Dict[str, Any]:
+        sync_name, sync_participants = sync
+        sync_list: List[Optional[str]] = [None] * len(self._elements)
+        for element, action in sync_participants.items():
+            sync_list[self._element_to_id[element]] = action
+        return {
+            "result": sync_name,
+            "synchronise": sync_list
+        }
+
     def as_dict(self):
         # Sort the syncs before return
-        self._syncs = sorted(self._syncs, key=lambda x: x["result"])
+        sorted_syncs = sorted(self._syncs.values(), key=lambda x: x[0])
         return {
             "elements": [{"automaton": element} for element in self._elements],
-            "syncs": self._syncs
+            "syncs": [self._get_dense_sync(sync) for sync in sorted_syncs]
         }
@@ -0,0 +1,180 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cone of influence reduction of a Jani model, keeping only the parts that can affect a property.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from jani_generator.jani_entries import (JaniAutomaton, JaniComposition,
+                                         JaniEdge, JaniModel)
+from jani_generator.jani_entries.jani_expression import \
+    get_expression_identifiers
+
+# A variable in the model: the automaton it is local to (None for globals) and its name
+VariableKey = Tuple[Optional[str], str]
+
+
+def _get_variable_key(automaton: JaniAutomaton, identifier: str) -> VariableKey:
+    """Get the variable an identifier refers to, within an automaton."""
+    if identifier in automaton.get_variables():
+        return automaton.get_name(), identifier
+    return None, identifier
+
+
+def _get_edge_control_keys(automaton: JaniAutomaton, edge: JaniEdge) -> Set[VariableKey]:
+    """Get the variables deciding whether an edge is taken and where it leads to."""
+    control_identifiers: Set[str] = set()
+    if edge.guard is not None and edge.guard.expression is not None:
+        control_identifiers.update(get_expression_identifiers(edge.guard.expression))
+    for destination in edge.destinations:
+        if destination["probability"] is not None:
+            control_identifiers.update(get_expression_identifiers(destination["probability"]))
+    return {_get_variable_key(automaton, identifier) for identifier in control_identifiers}
+
+
+def _get_relevant_elements(jani_model: JaniModel, identifiers: Iterable[str]
+                           ) -> Tuple[Set[str], Set[VariableKey]]:
+    """
+    Find the automata and the variables that can affect the provided identifiers.
+
+    The relevant variables are the provided ones and the ones used to compute their values. The
+    relevant automata are the ones assigning relevant variables: the variables used in their guards
+    are relevant as well, as are the automata synchronizing with them.
+
+    :param jani_model: The model to explore.
+    :param identifiers: The global identifiers the property depends on.
+    :return: The names of the relevant automata and the relevant variables.
+    """
+    # For each variable, the automata assigning it and the variables used in the assigned values
+    assigners: Dict[VariableKey, List[Tuple[str, Set[VariableKey]]]] = {}
+    for automaton in jani_model.get_automata():
+        for edge in automaton.get_edges():
+            for destination in edge.destinations:
+                for assignment in destination["assignments"]:
+                    value_keys = {_get_variable_key(automaton, identifier) for identifier in
+                                  get_expression_identifiers(assignment.get_expression())}
+                    target_key = _get_variable_key(automaton, assignment.get_target())
+                    assigners.setdefault(target_key, []).append(
+                        (automaton.get_name(), value_keys))
+    # The automata taking part in the same syncs
+    sync_partners: Dict[str, Set[str]] = {}
+    system = jani_model.get_system()
+    assert system is not None, "The system composition is not set"
+    for _, sync_participants in system.get_syncs():
+        for participant in sync_participants:
+            sync_partners.setdefault(participant, set()).update(sync_participants)
+    relevant_automata: Set[str] = set()
+    relevant_variables: Set[VariableKey] = set()
+    automata_to_visit: List[str] = []
+    variables_to_visit: List[VariableKey] = [(None, identifier) for identifier in identifiers]
+    while len(automata_to_visit) > 0 or len(variables_to_visit) > 0:
+        if len(variables_to_visit) > 0:
+            variable_key = variables_to_visit.pop()
+            if variable_key in relevant_variables:
+                continue
+            relevant_variables.add(variable_key)
+            for automaton_name, value_keys in assigners.get(variable_key, []):
+                automata_to_visit.append(automaton_name)
+                variables_to_visit.extend(value_keys)
+        else:
+            automaton_name = automata_to_visit.pop()
+            if automaton_name in relevant_automata:
+                continue
+            relevant_automata.add(automaton_name)
+            relevant_automaton = jani_model.get_automaton(automaton_name)
+            assert relevant_automaton is not None, f"Automaton {automaton_name} not found"
+            for edge in relevant_automaton.get_edges():
+                variables_to_visit.extend(_get_edge_control_keys(relevant_automaton, edge))
+            automata_to_visit.extend(sync_partners.get(automaton_name, set()))
+    return relevant_automata, relevant_variables
+
+
+def _reduce_automaton(automaton: JaniAutomaton,
+                      relevant_variables: Set[VariableKey]) -> JaniAutomaton:
+    """Generate a copy of the automaton without the irrelevant local variables and assignments."""
+    reduced_automaton = JaniAutomaton()
+    reduced_automaton.set_name(automaton.get_name())
+    for location in automaton.get_locations():
+        reduced_automaton.add_location(location, location in automaton.get_initial_locations())
+    for variable_name, variable in automaton.get_variables().items():
+        if (automaton.get_name(), variable_name) in relevant_variables:
+            reduced_automaton.add_variable(variable)
+    for edge in automaton.get_edges():
+        if all(_get_variable_key(automaton, assignment.get_target()) in relevant_variables
+               for destination in edge.destinations for assignment in destination["assignments"]):
+            # Unchanged edges are shared with the original automaton
+            reduced_automaton.add_edge(edge)
+            continue
+        reduced_edge = JaniEdge({"location": edge.location, "action": edge.get_action(),
+                                 "destinations": []})
+        reduced_edge.guard = edge.guard
+        for destination in edge.destinations:
+            reduced_edge.destinations.append({
+                "location": destination["location"],
+                "probability": destination["probability"],
+                "assignments": [
+                    assignment for assignment in destination["assignments"]
+                    if _get_variable_key(automaton, assignment.get_target()) in relevant_variables]
+            })
+        reduced_automaton.add_edge(reduced_edge)
+    return reduced_automaton
+
+
+def get_cone_of_influence_model(jani_model: JaniModel, identifiers: Iterable[str]) -> JaniModel:
+    """
+    Generate a reduced model, containing only the elements that can affect the provided identifiers.
+
+    The automata that cannot affect the identifiers are removed, together with their edges and
+    with the variables and assignments not contributing to the identifiers' values. The input
+    model is not modified: the unchanged elements are shared with the reduced model.
+
+    The reduced model is equivalent for unbounded properties, assuming the relevant automata are
+    not starved by the removed ones. Step-bounded properties are not preserved, since the removed
+    automata take steps as well.
+
+    :param jani_model: The model to reduce, with its system composition.
+    :param identifiers: The global identifiers the property depends on.
+    :return: The reduced model, or the input one if no automaton can affect the identifiers.
+    """
+    model_variables = jani_model.get_variables()
+    property_variables = [identifier for identifier in identifiers
+                          if identifier in model_variables]
+    relevant_automata, relevant_variables = _get_relevant_elements(
+        jani_model, property_variables)
+    if len(relevant_automata) == 0:
+        # A Jani model needs at least one automaton
+        return jani_model
+    reduced_model = JaniModel()
+    reduced_model.set_name(jani_model.get_name())
+    for variable_name, variable in model_variables.items():
+        if (None, variable_name) in relevant_variables:
+            reduced_model.add_jani_variable(variable)
+    for constant in jani_model.get_constants().values():
+        reduced_model.add_jani_constant(constant)
+    reduced_system = JaniComposition()
+    for automaton in jani_model.get_automata():
+        if automaton.get_name() in relevant_automata:
+            reduced_model.add_jani_automaton(_reduce_automaton(automaton, relevant_variables))
+            reduced_system.add_element(automaton.get_name())
+    system = jani_model.get_system()
+    assert system is not None, "The system composition is not set"
+    for sync_name, sync_participants in system.get_syncs():
+        # Relevant automata only synchronize with relevant automata
+        if any(participant in relevant_automata for participant in sync_participants):
+            reduced_system.add_sync(sync_name, sync_participants)
+    reduced_model.add_system_sync(reduced_system)
+    return reduced_model
@@ -33,6 +33,13 @@ class JaniConstant:
     def name(self) -> str:
         return self._name
 
+    def get_type(self) -> Type[ValidTypes]:
+        return self._type
+
+    def has_value(self) -> bool:
+        """Check if the constant is defined by a value (and not by an expression)."""
+        return self._value.value is not None and self._value.value.is_valid()
+
     def value(self) -> ValidTypes:
         assert self._value is not None, "Value not set"
         jani_value = self._value.value
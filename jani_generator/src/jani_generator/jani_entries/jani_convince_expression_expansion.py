@@ -20,10 +20,11 @@ from typing import Dict, Union
 
 from jani_generator.jani_entries import JaniConstant, JaniExpression, JaniValue
 from jani_generator.jani_entries.jani_expression_generator import (
-    abs_operator, and_operator, divide_operator, equal_operator,
-    floor_operator, greater_equal_operator, if_operator, lower_operator,
-    max_operator, min_operator, minus_operator, modulo_operator,
-    multiply_operator, or_operator, plus_operator, pow_operator)
+    abs_operator, and_operator, balanced_max_operator, balanced_min_operator,
+    divide_operator, equal_operator, floor_operator, greater_equal_operator,
+    if_operator, lower_operator, max_operator, min_operator, minus_operator,
+    modulo_operator, multiply_operator, or_operator, plus_operator,
+    pow_operator)
 
 BASIC_EXPRESSIONS_MAPPING = {
     "-": "-",
@@ -55,7 +56,9 @@ BASIC_EXPRESSIONS_MAPPING = {
     "∧": "∧",
     "&&": "∧",
     "and": "∧",
+    "∨": "∨",
     "||": "∨",
+    "or": "∨",
     "ite": "ite",
     "⇒": "⇒",
     "=>": "⇒",
@@ -261,11 +264,9 @@ def __expression_interpolation_next_boundaries(
     n_vertices = jani_constants["boundaries.count"].value()
     assert isinstance(n_vertices, int) and n_vertices > 1, \
         f"The number of boundaries ({n_vertices}) must greater than 1"
-    if boundary_id >= n_vertices:
-        return JaniExpression(0.0)
-    return max_operator(
-        __expression_interpolation_single_boundary(jani_constants, robot_name, boundary_id),
-        __expression_interpolation_next_boundaries(jani_constants, robot_name, boundary_id + 1))
+    return balanced_max_operator(
+        [__expression_interpolation_single_boundary(jani_constants, robot_name, next_id)
+         for next_id in range(boundary_id, n_vertices)] + [JaniExpression(0.0)])
 
 
 def __expression_interpolation_next_obstacles(
@@ -334,11 +335,9 @@ def __expression_distance_next_boundaries(
     n_vertices = jani_constants["boundaries.count"].value()
     assert isinstance(n_vertices, int) and n_vertices > 1, \
         f"The number of boundaries ({n_vertices}) must greater than 1"
-    if boundary_id >= n_vertices:
-        return JaniExpression(True)
-    return min_operator(
-        __expression_distance_single_boundary(jani_constants, robot_name, boundary_id),
-        __expression_distance_next_boundaries(jani_constants, robot_name, boundary_id + 1))
+    return balanced_min_operator(
+        [__expression_distance_single_boundary(jani_constants, robot_name, next_id)
+         for next_id in range(boundary_id, n_vertices)] + [JaniExpression(True)])
 
 
 def __expression_distance_next_obstacles(jani_constants, robot_name, obstacle_id) -> JaniExpression:
@@ -386,8 +385,7 @@ def __substitute_expression_op(expression: JaniExpression) -> JaniExpression:
     assert isinstance(expression, JaniExpression), "The input must be a JaniExpression"
     assert expression.op in BASIC_EXPRESSIONS_MAPPING, \
         f"The operator {expression.op} is not supported"
-    expression.op = BASIC_EXPRESSIONS_MAPPING[expression.op]
-    return expression
+    return JaniExpression({"op": BASIC_EXPRESSIONS_MAPPING[expression.op], **expression.operands})
 
 
 def expand_expression(
@@ -407,8 +405,11 @@ def expand_expression(
     if expression.op == "distance_to_point":
         return __expression_distance_to_point(expression, jani_constants)
     # If the expressions is neither of the above, we expand the operands and return them
-    for key, value in expression.operands.items():
-        expression.operands[key] = expand_expression(value, jani_constants)
+    # Note: expressions are immutable, so we generate a new one instead of modifying it
+    expression = JaniExpression({
+        "op": expression.op,
+        **{key: expand_expression(value, jani_constants)
+           for key, value in expression.operands.items()}})
     if expression.op == "norm2d":
         return norm2d_operator(exp=expression)
     if expression.op == "cross2d":
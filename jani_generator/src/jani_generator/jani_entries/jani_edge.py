@@ -21,6 +21,8 @@ from jani_generator.jani_entries import (JaniAssignment, JaniConstant,
                                          JaniExpression, JaniGuard)
 from jani_generator.jani_entries.jani_convince_expression_expansion import \
     expand_expression
+from jani_generator.jani_entries.jani_expression_simplifier import \
+    simplify_expression
 
 
 class JaniEdge:
@@ -74,14 +76,15 @@ class JaniEdge:
         if self.guard is not None:
             extracted_guard = self.guard.as_dict(constants)
             if len(extracted_guard) > 0:
-                edge_dict.update({"guard": self.guard.as_dict(constants)})
+                edge_dict.update({"guard": extracted_guard})
         for dest in self.destinations:
             single_destination = {
                 "location": dest["location"],
             }
             if "probability" in dest:
                 if dest["probability"] is not None:
-                    prob_exp = expand_expression(dest["probability"], constants)
+                    prob_exp = simplify_expression(
+                        expand_expression(dest["probability"], constants), constants)
                     single_destination.update({"probability": {"exp": prob_exp.as_dict()}})
             if "assignments" in dest:
                 expanded_assignments = []
@@ -0,0 +1,182 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compaction of the edge chains in Jani automata.
+
+Two consecutive edges are merged in a single one, executing the assignments of the second edge
+after the ones of the first edge, by means of a higher assignment index.
+"""
+
+from itertools import product
+from typing import Callable, Dict, List, Optional, Set
+
+from jani_generator.jani_entries import (JaniAssignment, JaniEdge,
+                                         JaniExpression)
+from jani_generator.jani_entries.jani_expression import \
+    substitute_expression_identifiers
+from jani_generator.jani_entries.jani_expression_generator import and_operator
+
+# Boolean connectives evaluated when checking the guards, all other expressions are atoms
+BOOLEAN_CONNECTIVES: Dict[str, Callable[..., bool]] = {
+    "∧": lambda left, right: left and right,
+    "∨": lambda left, right: left or right,
+    "⇒": lambda left, right: not left or right,
+    "¬": lambda exp: not exp,
+}
+
+# Above this amount of atoms, the guards are not checked and considered not exhaustive
+MAX_EXHAUSTIVE_CHECK_ATOMS = 10
+
+
+def _get_boolean_nodes(expressions: List[JaniExpression]) -> List[JaniExpression]:
+    """
+    Get the nodes reachable from the provided expressions through boolean connectives.
+
+    :param expressions: The boolean expressions to explore.
+    :return: The distinct nodes, each one listed after all its operands.
+    """
+    visited = set()
+    boolean_nodes: List[JaniExpression] = []
+    for expression in expressions:
+        if expression in visited:
+            continue
+        visited.add(expression)
+        stack = [(expression, iter(expression.operands.values())
+                  if expression.op in BOOLEAN_CONNECTIVES else iter(()))]
+        while len(stack) > 0:
+            current_expression, operands_it = stack[-1]
+            next_operand = next(operands_it, None)
+            if next_operand is None:
+                stack.pop()
+                boolean_nodes.append(current_expression)
+            elif next_operand not in visited:
+                visited.add(next_operand)
+                stack.append((next_operand, iter(next_operand.operands.values())
+                              if next_operand.op in BOOLEAN_CONNECTIVES else iter(())))
+    return boolean_nodes
+
+
+def are_guards_exhaustive(guards: List[Optional[JaniExpression]]) -> bool:
+    """
+    Check if at least one of the provided guards holds, independently from the variables values.
+
+    The expressions that are not boolean connectives (e.g. comparisons) are handled as independent
+    atoms: this makes the check conservative, since related atoms (e.g. `x < 0` and `x >= 0`) are
+    not recognized as such.
+
+    :param guards: The guard expressions to check, None for a guard that always holds.
+    :return: True if the guards are exhaustive, False if they are not or they are too complex.
+    """
+    guard_expressions = [guard for guard in guards if guard is not None]
+    if len(guard_expressions) < len(guards):
+        return True
+    boolean_nodes = _get_boolean_nodes(guard_expressions)
+    atoms = [node for node in boolean_nodes
+             if node.op not in BOOLEAN_CONNECTIVES and
+             not (node.value is not None and isinstance(node.value.value(), bool))]
+    if len(atoms) > MAX_EXHAUSTIVE_CHECK_ATOMS:
+        return False
+    for atoms_values in product((False, True), repeat=len(atoms)):
+        node_values = dict(zip(atoms, atoms_values))
+        for node in boolean_nodes:
+            if node in node_values:
+                continue
+            if node.value is not None:
+                node_values[node] = bool(node.value.value())
+            else:
+                assert node.op is not None, "Boolean connective without operator"
+                node_values[node] = BOOLEAN_CONNECTIVES[node.op](
+                    *(node_values[operand] for operand in node.operands.values()))
+        if not any(node_values[guard] for guard in guard_expressions):
+            return False
+    return True
+
+
+def get_guard_after_assignments(guard: JaniExpression,
+                                assignments: List[JaniAssignment]) -> JaniExpression:
+    """
+    Get the expression evaluating a guard after the assignments, on the values before them.
+
+    :param guard: The guard expression, evaluated after the assignments.
+    :param assignments: The assignments to execute, at their assignment indices.
+    :return: The guard expression with the assigned variables replaced by the assigned values.
+    """
+    # Starting from the last assignments, the values computed at each index replace the variables
+    for index in sorted({assignment.get_index() for assignment in assignments}, reverse=True):
+        guard = substitute_expression_identifiers(guard, {
+            assignment.get_target(): assignment.get_expression() for assignment in assignments
+            if assignment.get_index() == index})
+    return guard
+
+
+def get_guard_expression(edge: JaniEdge) -> Optional[JaniExpression]:
+    """Get the guard expression of an edge, None if the edge is always enabled."""
+    return None if edge.guard is None else edge.guard.expression
+
+
+def get_assigned_variables(edge: JaniEdge) -> Set[str]:
+    """Get the variables assigned by any destination of an edge."""
+    return {assignment.get_target() for destination in edge.destinations
+            for assignment in destination["assignments"]}
+
+
+def get_max_assignment_index(edge: JaniEdge) -> int:
+    """Get the highest assignment index in an edge, -1 if it has no assignments."""
+    return max((assignment.get_index() for destination in edge.destinations
+                for assignment in destination["assignments"]), default=-1)
+
+
+def merge_consecutive_edges(first_edge: JaniEdge, second_edge: JaniEdge,
+                            index_shift: int) -> JaniEdge:
+    """
+    Generate an edge taking the first and then the second provided edge, in a single step.
+
+    The guard of the second edge is evaluated on the values assigned by the first edge.
+
+    :param first_edge: The edge taken first, with a single destination.
+    :param second_edge: The edge starting from the destination of the first edge.
+    :param index_shift: The value added to the assignment indices of the second edge.
+    :return: The merged edge, with the action of the first edge.
+    """
+    assert len(first_edge.destinations) == 1 and len(second_edge.destinations) == 1, \
+        "Only edges with a single destination can be merged."
+    assert first_edge.destinations[0]["location"] == second_edge.location, \
+        f"Edges from {first_edge.location} and {second_edge.location} are not consecutive."
+    first_guard = get_guard_expression(first_edge)
+    second_guard = get_guard_expression(second_edge)
+    if second_guard is not None:
+        second_guard = get_guard_after_assignments(
+            second_guard, first_edge.destinations[0]["assignments"])
+    if first_guard is None or second_guard is None:
+        merged_guard = second_guard if first_guard is None else first_guard
+    else:
+        merged_guard = and_operator(first_guard, second_guard)
+    merged_assignments = list(first_edge.destinations[0]["assignments"])
+    for assignment in second_edge.destinations[0]["assignments"]:
+        merged_assignments.append(JaniAssignment({
+            "ref": assignment.get_target(),
+            "value": assignment.get_expression(),
+            "index": assignment.get_index() + index_shift
+        }))
+    return JaniEdge({
+        "location": first_edge.location,
+        "action": first_edge.get_action(),
+        "guard": merged_guard,
+        "destinations": [{
+            "location": second_edge.destinations[0]["location"],
+            "assignments": merged_assignments
+        }]
+    })
@@ -17,7 +17,10 @@
 Expressions in Jani
 """
 
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import (Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple,
+                    Union)
+from weakref import WeakValueDictionary
 
 from jani_generator.jani_entries import JaniValue
 
@@ -35,40 +38,81 @@ class JaniExpression:
     or
     - op: a string representing an operator
     - operands: a dictionary of operands, related to the specified operator
+
+    Expressions are immutable and hash-consed: constructing an expression that is structurally
+    identical to an existing one returns the existing instance. Hence, a sub-expression occurring
+    many times is stored only once and two expressions are equal if and only if they are the same
+    object.
     """
-    def __init__(self, expression: Union[SupportedExp, 'JaniExpression', JaniValue]):
-        self.identifier: Optional[str] = None
-        self.value: Optional[JaniValue] = None
-        self.op: Optional[str] = None
-        self.operands: Dict[str, Union[JaniExpression, JaniValue]] = {}
+    __slots__ = ("identifier", "value", "op", "operands", "_hash", "__weakref__")
+
+    # All the existing expressions, indexed by their structure (see _make_key)
+    _pool: 'WeakValueDictionary[Tuple, JaniExpression]' = WeakValueDictionary()
+
+    identifier: Optional[str]
+    value: Optional[JaniValue]
+    op: Optional[str]
+    operands: Mapping[str, 'JaniExpression']
+    _hash: int
+
+    def __new__(cls, expression: Union[SupportedExp, 'JaniExpression', JaniValue]):
         if isinstance(expression, JaniExpression):
-            self.identifier = expression.identifier
-            self.value = expression.value
-            self.op = expression.op
-            self.operands = expression.operands
-        elif isinstance(expression, JaniValue):
-            self.value = expression
+            # Expressions are immutable, no need to copy them
+            return expression
+        identifier: Optional[str] = None
+        value: Optional[JaniValue] = None
+        op: Optional[str] = None
+        operands: Dict[str, JaniExpression] = {}
+        if isinstance(expression, JaniValue):
+            value = expression
         else:
             if (not isinstance(expression, SupportedExp)):  # type: ignore
                 raise RuntimeError(f"Unexpected expression type: {type(expression)} should be a dict or a base type.")
             if isinstance(expression, str):
                 # If it is a reference to a constant or variable, we do not need to expand further
-                self.identifier = expression
+                identifier = expression
             elif JaniValue(expression).is_valid():
                 # If it is a value, then we don't need to expand further
-                self.value = JaniValue(expression)
+                value = JaniValue(expression)
             else:
                 # If it isn't a value or an identifier, it must be a dictionary providing op and
                 # related operands
                 # Operands need to be expanded further, until we encounter a value expression
                 assert isinstance(expression, dict), "Expected a dictionary"
                 assert "op" in expression, "Expected either a value or an operator"
-                self.op = expression["op"]
-                self.operands = self._get_operands(expression)
+                op = expression["op"]
+                operands = cls._get_operands(op, expression)
+        key = cls._make_key(identifier, value, op, operands)
+        existing_expression = cls._pool.get(key)
+        if existing_expression is not None:
+            return existing_expression
+        new_expression = super().__new__(cls)
+        object.__setattr__(new_expression, "identifier", identifier)
+        object.__setattr__(new_expression, "value", value)
+        object.__setattr__(new_expression, "op", op)
+        object.__setattr__(new_expression, "operands", MappingProxyType(operands))
+        object.__setattr__(new_expression, "_hash", hash(key))
+        cls._pool[key] = new_expression
+        return new_expression
+
+    @staticmethod
+    def _make_key(identifier: Optional[str], value: Optional[JaniValue], op: Optional[str],
+                  operands: Dict[str, 'JaniExpression']) -> Tuple:
+        """Generate a key describing the structure of an expression.
 
-    def _get_operands(self, expression_dict: dict):
-        assert self.op is not None, "Operator not set"
-        if (self.op in ("intersect", "distance")):
+        The operands are already pooled, so their identity (and hash) represents their structure.
+        """
+        if identifier is not None:
+            return ("identifier", identifier)
+        if value is not None:
+            # The value type is needed to tell apart, e.g., 1, 1.0 and True
+            raw_value = value.as_dict()
+            return ("value", type(raw_value), repr(raw_value))
+        return ("op", op, tuple(operands.items()))
+
+    @staticmethod
+    def _get_operands(op: str, expression_dict: dict) -> Dict[str, 'JaniExpression']:
+        if (op in ("intersect", "distance")):
             # intersect: returns a value in [0.0, 1.0], indicating where on the robot trajectory
             # the intersection occurs.
             #            0.0 means no intersection occurs (destination reached), 1.0 means the
@@ -77,13 +121,13 @@ class JaniExpression:
             return {
                 "robot": JaniExpression(expression_dict["robot"]),
                 "barrier": JaniExpression(expression_dict["barrier"])}
-        if (self.op in ("distance_to_point")):
+        if (op in ("distance_to_point")):
             # distance between robot outer radius and point x-y coords
             return {
                 "robot": JaniExpression(expression_dict["robot"]),
                 "x": JaniExpression(expression_dict["x"]),
                 "y": JaniExpression(expression_dict["y"])}
-        if (self.op in (
+        if (op in (
                 "&&", "||", "and", "or", "∨", "∧",
                 "⇒", "=>", "=", "≠", "!=", "+", "-", "*", "%",
                 "pow", "log", "/", "min", "max",
@@ -91,65 +135,156 @@ class JaniExpression:
             return {
                 "left": JaniExpression(expression_dict["left"]),
                 "right": JaniExpression(expression_dict["right"])}
-        if (self.op in ("!", "¬", "sin", "cos", "floor", "ceil",
-                        "abs", "to_cm", "to_m", "to_deg", "to_rad")):
+        if (op in ("!", "¬", "sin", "cos", "floor", "ceil",
+                   "abs", "to_cm", "to_m", "to_deg", "to_rad")):
             return {
                 "exp": JaniExpression(expression_dict["exp"])}
-        if (self.op in ("ite")):
+        if (op in ("ite")):
             return {
                 "if": JaniExpression(expression_dict["if"]),
                 "then": JaniExpression(expression_dict["then"]),
                 "else": JaniExpression(expression_dict["else"])}
-        if (self.op in ("norm2d")):
+        if (op in ("norm2d")):
             return {
                 "x": JaniExpression(expression_dict["x"]),
                 "y": JaniExpression(expression_dict["y"])}
-        if (self.op in ("dot2d", "cross2d")):
+        if (op in ("dot2d", "cross2d")):
             return {
                 "x1": JaniExpression(expression_dict["x1"]),
                 "y1": JaniExpression(expression_dict["y1"]),
                 "x2": JaniExpression(expression_dict["x2"]),
                 "y2": JaniExpression(expression_dict["y2"])}
-        assert False, f"Unknown operator \"{self.op}\" found."
+        assert False, f"Unknown operator \"{op}\" found."
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"JaniExpression is immutable: cannot set '{name}'.")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"JaniExpression is immutable: cannot delete '{name}'.")
 
-    def replace_event(self, replacement):
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # Make sure unpickled (or copied) expressions end up in the pool as well
+        if self.identifier is not None:
+            return (JaniExpression, (self.identifier,))
+        if self.value is not None:
+            return (JaniExpression, (self.value,))
+        return (JaniExpression, ({"op": self.op, **self.operands},))
+
+    def replace_event(self, replacement) -> 'JaniExpression':
         """Replace `_event` with `replacement`.
 
         Within a transitions, scxml can access data of events from the `_event` variable. We
         have to replace this by the global variable where we stored the data from the received
         event.
 
+        The expression is not modified: the sub-expressions containing `_event` are re-created,
+        the unchanged ones are shared with the original expression.
+
         :param replacement: The string to replace `_event` with.
-        :return self: for the convenience of chain-ability
+        :return: The expression with the replaced identifiers, or self if nothing changed.
         """
         if replacement is None:
             # No replacement needed!
             return self
         if self.identifier is not None:
-            self.identifier = self.identifier.replace("_event", replacement)
-            return self
+            new_identifier = self.identifier.replace("_event", replacement)
+            if new_identifier == self.identifier:
+                return self
+            return JaniExpression(new_identifier)
         if self.value is not None:
             return self
-        for operand in self.operands.values():
-            if isinstance(operand, JaniExpression):
-                operand.replace_event(replacement)
-        return self
+        new_operands = {key: operand.replace_event(replacement)
+                        for key, operand in self.operands.items()}
+        if all(new_operands[key] is operand for key, operand in self.operands.items()):
+            return self
+        return JaniExpression({"op": self.op, **new_operands})
 
     def is_valid(self) -> bool:
         return self.identifier is not None or self.value is not None or self.op is not None
 
     def as_dict(self) -> Union[str, int, float, bool, dict]:
-        assert hasattr(self, "identifier"), f"Identifier not set for {self.__dict__}"
-        if self.identifier is not None:
-            return self.identifier
-        if self.value is not None:
-            return self.value.as_dict()
-        op_dict: Dict[str, Any] = {
-            "op": self.op,
-        }
-        for op_key, op_value in self.operands.items():
-            assert isinstance(op_value, JaniExpression), \
-                f"Expected an expression, found {type(op_value)} for {op_key}"
-            assert hasattr(op_value, "identifier"), f"Identifier not set for {op_key}"
-            op_dict.update({op_key: op_value.as_dict()})
-        return op_dict
+        # The expression is converted iteratively, to support arbitrarily deep expressions.
+        # Shared sub-expressions are converted only once.
+        converted_expressions: Dict[JaniExpression, Any] = {}
+        for sub_expression in get_unique_subexpressions([self]):
+            if sub_expression.identifier is not None:
+                converted_expressions[sub_expression] = sub_expression.identifier
+            elif sub_expression.value is not None:
+                converted_expressions[sub_expression] = sub_expression.value.as_dict()
+            else:
+                op_dict: Dict[str, Any] = {
+                    "op": sub_expression.op,
+                }
+                for op_key, op_value in sub_expression.operands.items():
+                    op_dict.update({op_key: converted_expressions[op_value]})
+                converted_expressions[sub_expression] = op_dict
+        return converted_expressions[self]
+
+
+def get_unique_subexpressions(expressions: Iterable[JaniExpression]) -> List[JaniExpression]:
+    """
+    Get all distinct (sub-)expressions contained in the provided ones, without recursion.
+
+    :param expressions: The expressions to explore.
+    :return: The distinct expressions, each one listed after all its operands.
+    """
+    visited = set()
+    unique_expressions: List[JaniExpression] = []
+    for expression in expressions:
+        if expression in visited:
+            continue
+        visited.add(expression)
+        # Each entry holds an expression and an iterator over its operands still to be visited
+        stack = [(expression, iter(expression.operands.values()))]
+        while len(stack) > 0:
+            current_expression, operands_it = stack[-1]
+            next_operand = next(operands_it, None)
+            if next_operand is None:
+                stack.pop()
+                unique_expressions.append(current_expression)
+            elif next_operand not in visited:
+                visited.add(next_operand)
+                stack.append((next_operand, iter(next_operand.operands.values())))
+    return unique_expressions
+
+
+def get_expression_identifiers(expression: JaniExpression) -> Set[str]:
+    """
+    Get the identifiers (variables and constants) referenced in an expression.
+
+    :param expression: The expression to explore.
+    :return: The names of the referenced identifiers.
+    """
+    return {sub_expression.identifier for sub_expression in get_unique_subexpressions([expression])
+            if sub_expression.identifier is not None}
+
+
+def substitute_expression_identifiers(expression: JaniExpression,
+                                      substitutions: Dict[str, JaniExpression]) -> JaniExpression:
+    """
+    Replace the identifiers in an expression, sharing the unchanged sub-expressions.
+
+    :param expression: The expression to process.
+    :param substitutions: The expression replacing each identifier, if any.
+    :return: The expression with the identifiers replaced.
+    """
+    new_expressions: Dict[JaniExpression, JaniExpression] = {}
+    for sub_expression in get_unique_subexpressions([expression]):
+        if sub_expression.identifier is not None:
+            new_expressions[sub_expression] = substitutions.get(
+                sub_expression.identifier, sub_expression)
+        elif sub_expression.value is not None:
+            new_expressions[sub_expression] = sub_expression
+        else:
+            new_operands = {key: new_expressions[operand]
+                            for key, operand in sub_expression.operands.items()}
+            if all(new_operands[key] is operand
+                   for key, operand in sub_expression.operands.items()):
+                new_expressions[sub_expression] = sub_expression
+            else:
+                new_expressions[sub_expression] = JaniExpression(
+                    {"op": sub_expression.op, **new_operands})
+    return new_expressions[expression]
@@ -0,0 +1,185 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Common subexpression elimination for Jani expressions.
+
+Operations occurring multiple times in the assignments of an edge destination are computed once,
+storing them in transient variables assigned at a lower assignment index.
+"""
+
+from typing import Dict, List, Tuple, Type
+
+from jani_generator.jani_entries import (JaniAssignment, JaniConstant,
+                                         JaniExpression, JaniVariable)
+from jani_generator.jani_entries.jani_expression import \
+    get_unique_subexpressions
+
+# Operators returning a specific type, independently from the type of their operands
+BOOLEAN_OPERATORS = ("∧", "∨", "¬", "⇒", "=", "≠", "<", "≤", ">", "≥")
+REAL_OPERATORS = ("/", "pow", "log", "sin", "cos")
+INTEGER_OPERATORS = ("floor", "ceil")
+
+# Prefix of the transient variables storing the common subexpressions
+CSE_VARIABLE_PREFIX = "cse"
+
+
+def count_expression_nodes(expression: JaniExpression) -> int:
+    """
+    Count the nodes of an expression, as it would be serialized.
+
+    :param expression: The expression to evaluate.
+    :return: The amount of nodes, counting shared sub-expressions at each of their occurrences.
+    """
+    sizes: Dict[JaniExpression, int] = {}
+    for sub_expression in get_unique_subexpressions([expression]):
+        sizes[sub_expression] = \
+            1 + sum(sizes[operand] for operand in sub_expression.operands.values())
+    return sizes[expression]
+
+
+def get_expression_type(
+        expression: JaniExpression, variable_types: Dict[str, Type]) -> Type:
+    """
+    Get the type resulting from the evaluation of a (plain) Jani expression.
+
+    :param expression: The expression to evaluate.
+    :param variable_types: The types of the variables and constants used in the expression.
+    :return: The type of the expression: bool, int or float.
+    """
+    types: Dict[JaniExpression, Type] = {}
+    for sub_expression in get_unique_subexpressions([expression]):
+        if sub_expression.identifier is not None:
+            assert sub_expression.identifier in variable_types, \
+                f"Unknown type for variable {sub_expression.identifier}."
+            expression_type = variable_types[sub_expression.identifier]
+        elif sub_expression.value is not None:
+            expression_type = type(sub_expression.value.value())
+        elif sub_expression.op in BOOLEAN_OPERATORS:
+            expression_type = bool
+        elif sub_expression.op in REAL_OPERATORS:
+            expression_type = float
+        elif sub_expression.op in INTEGER_OPERATORS:
+            expression_type = int
+        else:
+            operand_types = {types[operand] for key, operand in sub_expression.operands.items()
+                             if key != "if"}
+            if operand_types == {bool}:
+                expression_type = bool
+            elif float in operand_types:
+                expression_type = float
+            else:
+                expression_type = int
+        types[sub_expression] = expression_type
+    return types[expression]
+
+
+def find_common_subexpressions(expressions: List[JaniExpression]) -> Dict[JaniExpression, int]:
+    """
+    Find the operations that are used more than once in the provided expressions.
+
+    :param expressions: The expressions to analyze.
+    :return: The common operations and their level: an operation at level N depends only on
+        common operations at a level lower than N. Operations are ordered by dependency.
+    """
+    usages: Dict[JaniExpression, int] = {}
+    unique_expressions = get_unique_subexpressions(expressions)
+    for expression in unique_expressions:
+        for operand in expression.operands.values():
+            usages[operand] = usages.get(operand, 0) + 1
+    for expression in expressions:
+        usages[expression] = usages.get(expression, 0) + 1
+    # The level of the common operations each expression depends on (-1 if none)
+    dependency_levels: Dict[JaniExpression, int] = {}
+    common_expressions: Dict[JaniExpression, int] = {}
+    for expression in unique_expressions:
+        level = max((dependency_levels[operand] for operand in expression.operands.values()),
+                    default=-1)
+        if expression.op is not None and usages[expression] > 1:
+            level += 1
+            common_expressions[expression] = level
+        dependency_levels[expression] = level
+    return common_expressions
+
+
+def replace_subexpressions(
+        expression: JaniExpression,
+        replacements: Dict[JaniExpression, JaniExpression]) -> JaniExpression:
+    """
+    Substitute the sub-expressions of an expression.
+
+    :param expression: The expression to process. This is never replaced, only its operands.
+    :param replacements: The sub-expressions to replace, associated to their replacements.
+    :return: The expression with the replaced operands.
+    """
+    rebuilt_expressions: Dict[JaniExpression, JaniExpression] = {}
+    for sub_expression in get_unique_subexpressions([expression]):
+        if sub_expression.op is None:
+            rebuilt_expressions[sub_expression] = sub_expression
+            continue
+        new_operands = {
+            key: replacements.get(operand, rebuilt_expressions[operand])
+            for key, operand in sub_expression.operands.items()}
+        rebuilt_expressions[sub_expression] = \
+            JaniExpression({"op": sub_expression.op, **new_operands})
+    return rebuilt_expressions[expression]
+
+
+def eliminate_common_subexpressions_in_assignments(
+        assignments: List[JaniAssignment], constants: Dict[str, JaniConstant],
+        variable_types: Dict[str, Type]) -> Tuple[List[JaniAssignment], Dict[str, Type]]:
+    """
+    Store the operations repeated in the assignments of a destination in transient variables.
+
+    Only the assignments with the same index can share operations, since they read the same values.
+
+    :param assignments: The assignments of an edge destination.
+    :param constants: The constants of the model, required for expanding the expressions.
+    :param variable_types: The types of the variables and constants accessible from the edge.
+    :return: The new assignments and the transient variables they require.
+    """
+    new_assignments: List[JaniAssignment] = []
+    cse_variables: Dict[str, Type] = {}
+    next_index = 0
+    for index in sorted({assignment.get_index() for assignment in assignments}):
+        index_assignments = [
+            assignment for assignment in assignments if assignment.get_index() == index]
+        values = [assignment.get_plain_expression(constants) for assignment in index_assignments]
+        common_expressions = find_common_subexpressions(values)
+        replacements: Dict[JaniExpression, JaniExpression] = {}
+        for expression, level in common_expressions.items():
+            expression_type = get_expression_type(expression, variable_types)
+            type_str = JaniVariable.jani_type_to_string(expression_type)
+            variable_name = f"{CSE_VARIABLE_PREFIX}.{type_str}.{len(cse_variables)}"
+            cse_variables[variable_name] = expression_type
+            replacements[expression] = JaniExpression(variable_name)
+            new_assignments.append(JaniAssignment({
+                "ref": variable_name,
+                "value": replace_subexpressions(expression, replacements),
+                "index": next_index + level}))
+        next_index += max(common_expressions.values(), default=-1) + 1
+        for assignment, value in zip(index_assignments, values):
+            if value in replacements:
+                new_value = replacements[value]
+            else:
+                new_value = replace_subexpressions(value, replacements)
+            new_assignments.append(JaniAssignment({
+                "ref": assignment.get_target(),
+                "value": new_value,
+                "index": next_index}))
+        next_index += 1
+    if len(cse_variables) == 0:
+        return assignments, cse_variables
+    return new_assignments, cse_variables
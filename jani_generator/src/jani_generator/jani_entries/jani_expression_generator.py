@@ -17,6 +17,8 @@
 Generate full expressions in Jani
 """
 
+from typing import Callable, List
+
 from jani_generator.jani_entries import JaniExpression
 
 
@@ -112,3 +114,40 @@ def or_operator(left, right) -> JaniExpression:
 # if operator
 def if_operator(condition, true_value, false_value) -> JaniExpression:
     return JaniExpression({"op": "ite", "if": condition, "then": true_value, "else": false_value})
+
+
+# Associative operators over multiple operands
+def _balanced_operator(operator: Callable, operands: List) -> JaniExpression:
+    """
+    Combine multiple operands using an associative binary operator.
+
+    The operands are combined pairwise, generating a tree with logarithmic depth instead of a chain.
+
+    :param operator: The function generating the binary operator expression (e.g. max_operator).
+    :param operands: The operands to combine, at least one.
+    :return: The resulting expression.
+    """
+    assert len(operands) > 0, "Expected at least one operand"
+    while len(operands) > 1:
+        combined_operands = [operator(operands[i], operands[i + 1])
+                             for i in range(0, len(operands) - 1, 2)]
+        if len(operands) % 2 == 1:
+            combined_operands.append(operands[-1])
+        operands = combined_operands
+    return JaniExpression(operands[0])
+
+
+def balanced_max_operator(operands: List) -> JaniExpression:
+    return _balanced_operator(max_operator, operands)
+
+
+def balanced_min_operator(operands: List) -> JaniExpression:
+    return _balanced_operator(min_operator, operands)
+
+
+def balanced_and_operator(operands: List) -> JaniExpression:
+    return _balanced_operator(and_operator, operands)
+
+
+def balanced_or_operator(operands: List) -> JaniExpression:
+    return _balanced_operator(or_operator, operands)
@@ -0,0 +1,240 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Simplification of Jani expressions.
+
+The expressions are reduced before exporting them, so that the model checker has to evaluate
+smaller expressions at each step.
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Union
+
+from jani_generator.jani_entries import JaniConstant, JaniExpression
+from jani_generator.jani_entries.jani_expression import \
+    get_unique_subexpressions
+from jani_generator.jani_entries.jani_expression_generator import (
+    balanced_and_operator, balanced_max_operator, balanced_min_operator,
+    balanced_or_operator, not_operator)
+
+ConstantValue = Union[bool, int, float]
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _are_numbers(*values) -> bool:
+    return all(_is_number(value) for value in values)
+
+
+def _are_bools(*values) -> bool:
+    return all(isinstance(value, bool) for value in values)
+
+
+def _div(left, right):
+    # Jani divisions always return a real number
+    return left / right if right != 0 else None
+
+
+def _mod(left, right):
+    # Sign conventions differ among languages: fold only the non-ambiguous cases
+    return left % right if left >= 0 and right > 0 else None
+
+
+def _pow(left, right):
+    try:
+        return float(left ** right) if left != 0 or right >= 0 else None
+    except (OverflowError, TypeError):
+        return None
+
+
+# Operators that can be evaluated at conversion time: (check on the operands, evaluation function)
+CONSTANT_FOLDING_OPERATORS: Dict[str, tuple] = {
+    "+": (_are_numbers, lambda left, right: left + right),
+    "-": (_are_numbers, lambda left, right: left - right),
+    "*": (_are_numbers, lambda left, right: left * right),
+    "/": (_are_numbers, _div),
+    "%": (lambda left, right: isinstance(left, int) and isinstance(right, int)
+          and _are_numbers(left, right), _mod),
+    "pow": (_are_numbers, _pow),
+    "min": (_are_numbers, min),
+    "max": (_are_numbers, max),
+    "abs": (_are_numbers, abs),
+    "floor": (_are_numbers, math.floor),
+    "ceil": (_are_numbers, math.ceil),
+    "sin": (_are_numbers, math.sin),
+    "cos": (_are_numbers, math.cos),
+    "<": (_are_numbers, lambda left, right: left < right),
+    "≤": (_are_numbers, lambda left, right: left <= right),
+    ">": (_are_numbers, lambda left, right: left > right),
+    "≥": (_are_numbers, lambda left, right: left >= right),
+    "=": (lambda left, right: _are_numbers(left, right) or _are_bools(left, right),
+          lambda left, right: left == right),
+    "≠": (lambda left, right: _are_numbers(left, right) or _are_bools(left, right),
+          lambda left, right: left != right),
+    "∧": (_are_bools, lambda left, right: left and right),
+    "∨": (_are_bools, lambda left, right: left or right),
+    "⇒": (_are_bools, lambda left, right: not left or right),
+    "¬": (_are_bools, lambda exp: not exp),
+}
+
+# Associative operators, whose chains can be flattened without changing the result.
+# Note: + and * are not part of this, since reordering floating point operations changes results.
+ASSOCIATIVE_OPERATORS: Dict[str, Callable[[List], JaniExpression]] = {
+    "∧": balanced_and_operator,
+    "∨": balanced_or_operator,
+    "min": balanced_min_operator,
+    "max": balanced_max_operator,
+}
+
+
+def _get_constant_value(expression: JaniExpression) -> Optional[ConstantValue]:
+    """Get the value of a constant expression, None if the expression is not constant."""
+    if expression.value is None:
+        return None
+    return expression.value.value()
+
+
+def _make_value_expression(value: ConstantValue) -> Optional[JaniExpression]:
+    """Generate the expression for a folded value, None if the value is not representable."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return JaniExpression(value)
+
+
+def _simplify_associative_chain(op: str, operands: List[JaniExpression]) -> JaniExpression:
+    """Simplify the flattened operands of an associative (and commutative) operator."""
+    unique_operands: List[JaniExpression] = []
+    constant_values: List[ConstantValue] = []
+    for operand in operands:
+        value = _get_constant_value(operand)
+        if value is not None:
+            constant_values.append(value)
+        else:
+            unique_operands.append(operand)
+    # Remove duplicated operands (preserving their order)
+    unique_operands = list(dict.fromkeys(unique_operands))
+    if op in ("∧", "∨"):
+        if not _are_bools(*constant_values):
+            return ASSOCIATIVE_OPERATORS[op](operands)
+        absorbing_value = op == "∨"
+        if absorbing_value in constant_values:
+            return JaniExpression(absorbing_value)
+        if len(unique_operands) == 0:
+            return JaniExpression(not absorbing_value)
+        return ASSOCIATIVE_OPERATORS[op](unique_operands)
+    # min and max operators
+    if len(constant_values) > 0:
+        if not _are_numbers(*constant_values):
+            return ASSOCIATIVE_OPERATORS[op](operands)
+        folded_value = min(constant_values) if op == "min" else max(constant_values)
+        if any(isinstance(value, float) for value in constant_values):
+            folded_value = float(folded_value)
+        unique_operands.append(JaniExpression(folded_value))
+    return ASSOCIATIVE_OPERATORS[op](unique_operands)
+
+
+def _simplify_operation(op: str, operands: Dict[str, JaniExpression]) -> JaniExpression:
+    """Simplify an operation, given its (already simplified) operands."""
+    values = {key: _get_constant_value(operand) for key, operand in operands.items()}
+    if op in CONSTANT_FOLDING_OPERATORS and all(value is not None for value in values.values()):
+        check_function, eval_function = CONSTANT_FOLDING_OPERATORS[op]
+        if check_function(*values.values()):
+            folded_value = eval_function(*values.values())
+            if folded_value is not None:
+                folded_expression = _make_value_expression(folded_value)
+                if folded_expression is not None:
+                    return folded_expression
+    if op == "¬":
+        exp = operands["exp"]
+        if exp.op == "¬":
+            # Double negation
+            return exp.operands["exp"]
+    elif op == "⇒":
+        if values["left"] is True or values["right"] is True:
+            return operands["right"]
+        if values["left"] is False:
+            return JaniExpression(True)
+    elif op == "ite":
+        if isinstance(values["if"], bool):
+            return operands["then"] if values["if"] else operands["else"]
+        if operands["then"] is operands["else"]:
+            return operands["then"]
+        if values["then"] is True and values["else"] is False:
+            return operands["if"]
+        if values["then"] is False and values["else"] is True:
+            return not_operator(operands["if"])
+    elif op in ("+", "-") and values["right"] == 0 and isinstance(values["right"], int) \
+            and not isinstance(values["right"], bool):
+        return operands["left"]
+    elif op == "+" and values["left"] == 0 and isinstance(values["left"], int) \
+            and not isinstance(values["left"], bool):
+        return operands["right"]
+    return JaniExpression({"op": op, **operands})
+
+
+def simplify_expression(
+        expression: JaniExpression, constants: Dict[str, JaniConstant]) -> JaniExpression:
+    """
+    Simplify a (plain) Jani expression.
+
+    The following simplifications are applied:
+    - the identifiers of constants are replaced by their values, and constant operations are folded
+    - boolean identities, e.g. true ∧ x = x, false ∧ x = false, true ⇒ x = x
+    - removal of double negations and of if-then-else operators with a constant condition
+    - the chains of associative operators (∧, ∨, min, max) are flattened, removing duplicated
+      operands and merging the constant ones
+
+    :param expression: The expression to simplify, containing only standard Jani operators.
+    :param constants: The constants of the model, whose values can be substituted.
+    :return: The simplified expression.
+    """
+    simplified_expressions: Dict[JaniExpression, JaniExpression] = {}
+    # The flattened operands of the simplified associative operations
+    chain_operands: Dict[JaniExpression, List[JaniExpression]] = {}
+    for sub_expression in get_unique_subexpressions([expression]):
+        if sub_expression.identifier is not None:
+            simplified_expression = sub_expression
+            constant = constants.get(sub_expression.identifier)
+            if constant is not None and constant.has_value():
+                constant_value = constant.get_type()(constant.value())
+                simplified_expression = JaniExpression(constant_value)
+        elif sub_expression.value is not None:
+            simplified_expression = sub_expression
+            value = sub_expression.value.value()
+            if isinstance(sub_expression.value.as_dict(), dict):
+                # Jani constants as e and π
+                simplified_expression = _make_value_expression(value) or sub_expression
+        else:
+            assert sub_expression.op is not None, "Expected an operator expression."
+            operands = {key: simplified_expressions[operand]
+                        for key, operand in sub_expression.operands.items()}
+            if sub_expression.op in ASSOCIATIVE_OPERATORS:
+                flat_operands: List[JaniExpression] = []
+                for operand in operands.values():
+                    if operand.op == sub_expression.op and operand in chain_operands:
+                        flat_operands.extend(chain_operands[operand])
+                    else:
+                        flat_operands.append(operand)
+                simplified_expression = _simplify_associative_chain(
+                    sub_expression.op, flat_operands)
+                if simplified_expression.op == sub_expression.op:
+                    chain_operands[simplified_expression] = flat_operands
+            else:
+                simplified_expression = _simplify_operation(sub_expression.op, operands)
+        simplified_expressions[sub_expression] = simplified_expression
+    return simplified_expressions[expression]
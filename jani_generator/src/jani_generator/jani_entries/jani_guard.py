@@ -18,21 +18,27 @@ Guards in Jani
 """
 
 
-from typing import Optional
+from typing import Optional, Union
 
 from jani_generator.jani_entries.jani_expression import JaniExpression
+from jani_generator.jani_entries.jani_expression_simplifier import \
+    simplify_expression
 
 
 class JaniGuard:
-    def __init__(self, expression: Optional[JaniExpression]):
-        self.expression = expression
+    def __init__(self, expression: Optional[Union[JaniExpression, 'JaniGuard', dict]]):
+        self.expression: Optional[JaniExpression] = None
+        if isinstance(expression, JaniGuard):
+            self.expression = expression.expression
+        elif isinstance(expression, dict) and list(expression.keys()) == ['exp']:
+            # Guard as defined in a Jani file
+            self.expression = JaniExpression(expression['exp'])
+        elif expression is not None:
+            self.expression = JaniExpression(expression)
 
     def as_dict(self, constants: Optional[dict] = None):
         d = {}
-        if self.expression:
-            exp = self.expression.as_dict()
-            if (isinstance(exp, dict) and list(exp.keys()) == ['exp']):
-                d['exp'] = exp['exp']
-            else:
-                d['exp'] = exp
+        if self.expression is not None:
+            d['exp'] = simplify_expression(
+                self.expression, constants if constants is not None else {}).as_dict()
         return d
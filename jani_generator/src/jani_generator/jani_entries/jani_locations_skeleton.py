@@ -0,0 +1,133 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Exploration of the locations of a Jani model, ignoring the guards and the assignments.
+
+Since no guard is evaluated, the explored states over-approximate the reachable states of the model:
+if a sync cannot be taken in a location, it cannot be taken in the original model either.
+"""
+
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from jani_generator.jani_entries import JaniModel
+
+# Above this amount of explored states, the exploration is stopped
+MAX_EXPLORED_STATES = 10000
+
+# An automaton, one of its locations and an action, to be taken in a sync while in the location
+LocationAction = Tuple[str, str, str]
+
+
+class LocationsSkeleton:
+    """The locations and syncs of the automata in a Jani model, without guards and assignments."""
+
+    def __init__(self, jani_model: JaniModel):
+        self._initial_locations: Dict[str, List[str]] = {}
+        # For each automaton, the locations reachable from each location, using each action
+        self._next_locations: Dict[str, Dict[Tuple[str, str], Set[str]]] = {}
+        for automaton in jani_model.get_automata():
+            automaton_name = automaton.get_name()
+            self._initial_locations[automaton_name] = sorted(automaton.get_initial_locations())
+            next_locations = self._next_locations.setdefault(automaton_name, {})
+            for edge in automaton.get_edges():
+                edge_action = edge.get_action()
+                assert edge_action is not None, \
+                    f"Edge without action in automaton {automaton_name}."
+                next_locations.setdefault((edge.location, edge_action), set()).update(
+                    destination["location"] for destination in edge.destinations)
+        system = jani_model.get_system()
+        assert system is not None, "The system composition is not set"
+        self._syncs = [sync_participants for _, sync_participants in system.get_syncs()]
+
+    def has_location(self, automaton_name: str, location: str) -> bool:
+        """Check if an automaton has a location with outgoing edges."""
+        return any(location == edge_location
+                   for edge_location, _ in self._next_locations.get(automaton_name, {}))
+
+    def get_neighbors(self, automata: Iterable[str]) -> Set[str]:
+        """Get the automata synchronizing with the provided ones, including themselves."""
+        neighbors = set(automata)
+        for sync_participants in self._syncs:
+            if not neighbors.isdisjoint(sync_participants):
+                neighbors.update(sync_participants)
+        return neighbors.intersection(self._next_locations)
+
+    def get_enabled_location_actions(self, automata: Iterable[str],
+                                     location_actions: Iterable[LocationAction]
+                                     ) -> Optional[Set[LocationAction]]:
+        """
+        Find the actions that can be taken while an automaton is in a location, exploring a subset
+        of automata.
+
+        An action can be taken if a sync with it, from any participant, is enabled. The automata
+        outside of the subset are assumed to be always ready to synchronize.
+
+        :param automata: The automata to explore, including the ones in location_actions.
+        :param location_actions: The automata, locations and actions to check.
+        :return: The location actions that can be taken from a reachable state, or None if the
+            exploration is too large.
+        """
+        location_actions = set(location_actions)
+        automata = sorted(automata)
+        automata_ids = {automaton_name: idx for idx, automaton_name in enumerate(automata)}
+        syncs = [sync_participants for sync_participants in self._syncs
+                 if not automata_ids.keys().isdisjoint(sync_participants)]
+        # The syncs taking each location action
+        checked_syncs = [(location_action, automata_ids[location_action[0]], location_action[1], [
+            sync_idx for sync_idx, sync_participants in enumerate(syncs)
+            if location_action[2] in sync_participants.values()])
+            for location_action in sorted(location_actions)]
+        enabled_location_actions: Set[LocationAction] = set()
+        explored_states: Set[Tuple[str, ...]] = set(product(
+            *(self._initial_locations[automaton_name] for automaton_name in automata)))
+        states_to_explore = list(explored_states)
+        while len(states_to_explore) > 0:
+            state = states_to_explore.pop()
+            enabled_syncs: Dict[int, List[Tuple[int, Set[str]]]] = {}
+            for sync_idx, sync_participants in enumerate(syncs):
+                participants_next = []
+                for automaton_name, action in sync_participants.items():
+                    if automaton_name not in automata_ids:
+                        continue
+                    automaton_id = automata_ids[automaton_name]
+                    next_locations = self._next_locations[automaton_name].get(
+                        (state[automaton_id], action))
+                    if next_locations is None:
+                        break
+                    participants_next.append((automaton_id, next_locations))
+                else:
+                    enabled_syncs[sync_idx] = participants_next
+            for location_action, automaton_id, location, sync_ids in checked_syncs:
+                if state[automaton_id] == location and \
+                        any(sync_idx in enabled_syncs for sync_idx in sync_ids):
+                    enabled_location_actions.add(location_action)
+            if enabled_location_actions == location_actions:
+                return enabled_location_actions
+            for participants_next in enabled_syncs.values():
+                automata_next = [automaton_id for automaton_id, _ in participants_next]
+                for locations_next in product(*(sorted(next_locations)
+                                                for _, next_locations in participants_next)):
+                    next_locations_list = list(state)
+                    for automaton_id, location in zip(automata_next, locations_next):
+                        next_locations_list[automaton_id] = location
+                    next_state = tuple(next_locations_list)
+                    if next_state not in explored_states:
+                        if len(explored_states) >= MAX_EXPLORED_STATES:
+                            return None
+                        explored_states.add(next_state)
+                        states_to_explore.append(next_state)
+        return enabled_location_actions
@@ -18,11 +18,17 @@ Complete Jani Model
 """
 
 
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
-from jani_generator.jani_entries import (JaniAutomaton, JaniComposition,
-                                         JaniConstant, JaniExpression,
-                                         JaniProperty, JaniValue, JaniVariable)
+from jani_generator.jani_entries import (JaniAssignment, JaniAutomaton,
+                                         JaniComposition, JaniConstant,
+                                         JaniExpression, JaniProperty,
+                                         JaniValue, JaniVariable)
+from jani_generator.jani_entries.jani_edge_compaction import (
+    get_assigned_variables, get_max_assignment_index)
+from jani_generator.jani_entries.jani_expression import \
+    substitute_expression_identifiers
+from jani_generator.jani_entries.jani_variable import JaniVariableBounds
 
 ValidValue = Union[int, float, bool, dict, JaniExpression]
 
@@ -38,6 +44,7 @@ class JaniModel:
         self._variables: Dict[str, JaniVariable] = {}
         self._constants: Dict[str, JaniConstant] = {}
         self._automata: List[JaniAutomaton] = []
+        self._automata_by_name: Dict[str, JaniAutomaton] = {}
         # The list of actions can be generated later on from the automata
         self._system: Optional[JaniComposition] = None
         self._properties: List[JaniProperty] = []
@@ -51,22 +58,57 @@ class JaniModel:
     def add_jani_variable(self, variable: JaniVariable):
         self._variables.update({variable.name(): variable})
 
+    def get_variables(self) -> Dict[str, JaniVariable]:
+        return self._variables
+
     def add_variable(self, variable_name: str, variable_type: Type,
                      variable_init_expression: Optional[ValidValue] = None,
-                     transient: bool = False):
+                     transient: bool = False,
+                     variable_bounds: Optional[JaniVariableBounds] = None):
         if variable_init_expression is None or isinstance(variable_init_expression, JaniExpression):
             self.add_jani_variable(
-                JaniVariable(variable_name, variable_type, variable_init_expression, transient))
+                JaniVariable(variable_name, variable_type, variable_init_expression, transient,
+                             variable_bounds))
         else:
             assert JaniValue(variable_init_expression).is_valid(), \
                 f"Invalid value for variable {variable_name}"
             self.add_jani_variable(
                 JaniVariable(variable_name, variable_type,
-                             JaniExpression(variable_init_expression), transient))
+                             JaniExpression(variable_init_expression), transient,
+                             variable_bounds))
+
+    def replace_variables(self, replacements: Dict[str, str]):
+        """
+        Replace global variables with other existing ones, in the edges of all automata.
+
+        :param replacements: The variable replacing each one of the variables to remove.
+        """
+        for variable_name, replacement_name in replacements.items():
+            assert replacement_name in self._variables, \
+                f"Variable {replacement_name}, replacing {variable_name}, not found."
+            self._variables.pop(variable_name)
+        substitutions = {variable_name: JaniExpression(replacement_name)
+                         for variable_name, replacement_name in replacements.items()}
+        for automaton in self._automata:
+            for edge in automaton.get_edges():
+                if edge.guard is not None and edge.guard.expression is not None:
+                    edge.guard.expression = substitute_expression_identifiers(
+                        edge.guard.expression, substitutions)
+                for destination in edge.destinations:
+                    destination["assignments"] = [JaniAssignment({
+                        "ref": replacements.get(assignment.get_target(),
+                                                assignment.get_target()),
+                        "value": substitute_expression_identifiers(
+                            assignment.get_expression(), substitutions),
+                        "index": assignment.get_index()
+                    }) for assignment in destination["assignments"]]
 
     def add_jani_constant(self, constant: JaniConstant):
         self._constants.update({constant.name(): constant})
 
+    def get_constants(self) -> Dict[str, JaniConstant]:
+        return self._constants
+
     def add_constant(self, constant_name: str, constant_type: Type, constant_value: ValidValue):
         if isinstance(constant_value, JaniExpression):
             self.add_jani_constant(JaniConstant(constant_name, constant_type, constant_value))
@@ -77,16 +119,20 @@ class JaniModel:
                 JaniConstant(constant_name, constant_type, JaniExpression(constant_value)))
 
     def add_jani_automaton(self, automaton: JaniAutomaton):
+        automaton_name = automaton.get_name()
+        assert automaton_name not in self._automata_by_name, \
+            f"Automaton {automaton_name} already exists in the model"
         self._automata.append(automaton)
+        self._automata_by_name[automaton_name] = automaton
 
     def get_automata(self) -> List[JaniAutomaton]:
         return self._automata
 
     def get_automaton(self, automaton_name: str) -> Optional[JaniAutomaton]:
-        for automaton in self._automata:
-            if automaton._name == automaton_name:
-                return automaton
-        return None
+        return self._automata_by_name.get(automaton_name)
+
+    def get_system(self) -> Optional[JaniComposition]:
+        return self._system
 
     def add_system_sync(self, system: JaniComposition):
         """Specify how the different automata are composed together."""
@@ -102,15 +148,95 @@ class JaniModel:
         for automaton in self._automata:
             automaton.remove_edges_with_action_name(action)
 
+    def remove_edges_with_actions(self, actions: Iterable[str]):
+        """Remove the edges in all automaton with any of the action names provided.
+
+        :param actions: The names of the actions to remove.
+        """
+        actions = set(actions)
+        for automaton in self._automata:
+            automaton.remove_edges_with_action_names(actions)
+
     def _generate_missing_syncs(self):
         """Automatically generate the syncs that are not explicitly defined."""
         assert len(self._automata) == len(self._system.get_elements()), \
             "We expect there to be explicit syncs for all automata."
         for automaton in self._automata:
-            existing_syncs = self._system.get_syncs_for_element(automaton.get_name())
+            automaton_name = automaton.get_name()
             for action in automaton.get_actions():
-                if action not in existing_syncs:
-                    self._system.add_sync(action, {automaton.get_name(): action})
+                if not self._system.has_sync_for_element(automaton_name, action):
+                    self._system.add_sync(action, {automaton_name: action})
+
+    def _get_sync_partners_assignments(self) -> Dict[str, Dict[str, Tuple[Set[str], int]]]:
+        """
+        Get, for each automaton and synchronized action, the assignments of its sync partners.
+
+        :return: For each automaton and action, the variables assigned by the other automata
+            in the same syncs and the highest index of their assignments.
+        """
+        assert self._system is not None, "The system composition is not set"
+        partners_assignments: Dict[str, Dict[str, Tuple[Set[str], int]]] = {}
+        for _, sync_participants in self._system.get_syncs():
+            if len(sync_participants) < 2:
+                continue
+            participants_edges = {
+                automaton_name: self._automata_by_name[automaton_name].get_edges_with_action(
+                    action) for automaton_name, action in sync_participants.items()}
+            for automaton_name, action in sync_participants.items():
+                automaton_partners = partners_assignments.setdefault(automaton_name, {})
+                partners_variables, partners_max_index = \
+                    automaton_partners.get(action, (set(), -1))
+                for partner_name, partner_edges in participants_edges.items():
+                    if partner_name == automaton_name:
+                        continue
+                    for edge in partner_edges:
+                        partners_variables.update(get_assigned_variables(edge))
+                        partners_max_index = max(
+                            partners_max_index, get_max_assignment_index(edge))
+                automaton_partners[action] = (partners_variables, partners_max_index)
+        return partners_assignments
+
+    def compact_edge_chains(self) -> Tuple[int, int]:
+        """
+        Merge the chains of local edges, e.g. the ones generated by the SCXML executable bodies.
+
+        This removes the intermediate locations, reducing the interleavings the model checker
+        has to explore.
+
+        :return: The amount of locations in the automata, before and after the process.
+        """
+        assert self._system is not None, "The system composition is not set"
+        locations_before = sum(len(automaton.get_locations()) for automaton in self._automata)
+        partners_assignments = self._get_sync_partners_assignments()
+        for automaton in self._automata:
+            automaton_name = automaton.get_name()
+            automaton_partners = partners_assignments.get(automaton_name, {})
+            actions_before = automaton.get_actions()
+            automaton.compact_edge_chains(
+                actions_before - automaton_partners.keys(), automaton_partners)
+            self._system.remove_element_syncs(
+                automaton_name, actions_before - automaton.get_actions())
+        locations_after = sum(len(automaton.get_locations()) for automaton in self._automata)
+        return locations_before, locations_after
+
+    def eliminate_common_subexpressions(self) -> Tuple[int, int]:
+        """
+        Store the operations repeated in the assignments of an edge in transient variables.
+
+        This reduces the size of the generated expressions, e.g. the expanded CONVINCE ones.
+
+        :return: The amount of expression nodes in the assignments, before and after the process.
+        """
+        global_types = {name: var.get_type() for name, var in self._variables.items()}
+        global_types.update({name: const.get_type() for name, const in self._constants.items()})
+        nodes_before = 0
+        nodes_after = 0
+        for automaton in self._automata:
+            automaton_before, automaton_after = \
+                automaton.eliminate_common_subexpressions(self._constants, global_types)
+            nodes_before += automaton_before
+            nodes_after += automaton_after
+        return nodes_before, nodes_after
 
     def add_jani_property(self, property: JaniProperty):
         self._properties.append(property)
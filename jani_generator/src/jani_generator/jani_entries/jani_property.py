@@ -23,6 +23,8 @@ from typing import Any, Dict, Union
 from jani_generator.jani_entries import JaniConstant, JaniExpression
 from jani_generator.jani_entries.jani_convince_expression_expansion import \
     expand_expression
+from jani_generator.jani_entries.jani_expression_simplifier import \
+    simplify_expression
 
 
 class FilterProperty:
@@ -120,8 +122,10 @@ class PathProperty:
     def as_dict(self, constants: Dict[str, JaniConstant]):
         ret_dict = {
             "op": self._op,
-            "left": expand_expression(self._left, constants).as_dict(),
-            "right": expand_expression(self._right, constants).as_dict()
+            "left": simplify_expression(
+                expand_expression(self._left, constants), constants).as_dict(),
+            "right": simplify_expression(
+                expand_expression(self._right, constants), constants).as_dict()
         }
         if self._bounds is not None:
             ret_dict["step-bounds"] = self._bounds.as_dict(constants)
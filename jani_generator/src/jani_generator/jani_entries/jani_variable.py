@@ -17,37 +17,68 @@
 Variables in Jani
 """
 
-from typing import Optional, Union, get_args
+from typing import Any, Dict, Optional, Tuple, Union, get_args
 
 from as2fm_common.common import ValidTypes
 from jani_generator.jani_entries import JaniExpression, JaniValue
 
+# Lower and upper bounds (both included) of a numeric variable. None if unbounded on that side.
+JaniVariableBounds = Tuple[Optional[Union[int, float]], Optional[Union[int, float]]]
+
 
 class JaniVariable:
     def __init__(self, v_name: str, v_type: ValidTypes,
                  init_value: Optional[Union[JaniExpression, JaniValue]] = None,
-                 v_transient: bool = False):
+                 v_transient: bool = False, v_bounds: Optional[JaniVariableBounds] = None):
+        """
+        Initialize a Jani variable.
+
+        :param v_name: The name of the variable.
+        :param v_type: The (python) type of the variable.
+        :param init_value: The initial value. If None, a default value of the type is used.
+        :param v_transient: Whether the variable is transient.
+        :param v_bounds: The bounds of a numeric variable, generating a Jani bounded type.
+        """
         assert init_value is None or isinstance(init_value, (JaniExpression, JaniValue)), \
             "Init value should be a JaniExpression or a JaniValue"
         self._name = v_name
         self._type = v_type
         self._transient = v_transient
+        self._bounds: Optional[JaniVariableBounds] = None
+        if v_bounds is not None and v_bounds != (None, None):
+            assert v_type in (int, float), \
+                f"Variable {v_name}: only numeric variables can be bounded, found {v_type}."
+            lower_bound, upper_bound = v_bounds
+            assert lower_bound is None or upper_bound is None or lower_bound <= upper_bound, \
+                f"Variable {v_name}: invalid bounds {v_bounds}."
+            self._bounds = (lower_bound, upper_bound)
         self._init_expr: Optional[JaniExpression] = None
         if init_value is not None:
             self._init_expr = JaniExpression(init_value)
         else:
             # Some Model Checkers need a explicit initial value.
             if self._type == int:
-                self._init_expr = JaniExpression(0)
+                self._init_expr = JaniExpression(self._get_default_numeric_value(0))
             elif self._type == bool:
                 self._init_expr = JaniExpression(False)
             elif self._type == float:
-                self._init_expr = JaniExpression(0.0)
+                self._init_expr = JaniExpression(self._get_default_numeric_value(0.0))
         assert v_type in get_args(ValidTypes), f"Type {v_type} not supported by Jani"
         if not self._transient and self._type == float:
             print(f"Warning: Variable {self._name} is not transient and has type float."
                   "This is not supported by STORM yet.")
 
+    def _get_default_numeric_value(self, zero_value: Union[int, float]) -> Union[int, float]:
+        """Get the value closest to zero within the variable bounds."""
+        if self._bounds is None:
+            return zero_value
+        lower_bound, upper_bound = self._bounds
+        if lower_bound is not None and lower_bound > zero_value:
+            return lower_bound
+        if upper_bound is not None and upper_bound < zero_value:
+            return upper_bound
+        return zero_value
+
     def name(self):
         """Get name."""
         return self._name
@@ -56,11 +87,28 @@ class JaniVariable:
         """Get type."""
         return self._type
 
+    def get_bounds(self) -> Optional[JaniVariableBounds]:
+        """Get the bounds of the variable, None if it is unbounded."""
+        return self._bounds
+
+    def _type_as_dict(self) -> Union[str, dict]:
+        """Return the Jani type of the variable, as a string or as a bounded type dictionary."""
+        base_type = JaniVariable.jani_type_to_string(self._type)
+        if self._bounds is None:
+            return base_type
+        type_dict: Dict[str, Any] = {"kind": "bounded", "base": base_type}
+        lower_bound, upper_bound = self._bounds
+        if lower_bound is not None:
+            type_dict["lower-bound"] = lower_bound
+        if upper_bound is not None:
+            type_dict["upper-bound"] = upper_bound
+        return type_dict
+
     def as_dict(self):
         """Return the variable as a dictionary."""
         d = {
             "name": self._name,
-            "type": JaniVariable.jani_type_to_string(self._type),
+            "type": self._type_as_dict(),
             "transient": self._transient
         }
         if self._init_expr is not None:
@@ -68,10 +116,15 @@ class JaniVariable:
         return d
 
     @staticmethod
-    def jani_type_from_string(str_type: str) -> ValidTypes:
+    def jani_type_from_string(str_type: Union[str, dict]) -> ValidTypes:
         """
         Translate a (Jani) type string to a Python type.
+
+        For bounded types, the Python type of their base type is returned.
         """
+        if isinstance(str_type, dict):
+            assert str_type.get("kind") == "bounded", f"Type {str_type} not supported by Jani"
+            str_type = str_type["base"]
         if str_type == "bool":
             return bool
         elif str_type == "int":
@@ -81,6 +134,18 @@ class JaniVariable:
         else:
             raise ValueError(f"Type {str_type} not supported by Jani")
 
+    @staticmethod
+    def jani_bounds_from_type(jani_type: Union[str, dict]) -> Optional[JaniVariableBounds]:
+        """
+        Get the bounds of a (Jani) type, None if it is not a bounded type.
+        """
+        if not isinstance(jani_type, dict):
+            return None
+        bounds = (jani_type.get("lower-bound"), jani_type.get("upper-bound"))
+        assert all(bound is None or isinstance(bound, (int, float)) for bound in bounds), \
+            f"Only constant values are supported as bounds, found {bounds}."
+        return bounds
+
     @staticmethod
     def jani_type_to_string(v_type: ValidTypes) -> str:
         """
@@ -0,0 +1,130 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Serialization of Jani models to file.
+
+Supports a compact output (no indentation), the orjson backend (if installed) and compressed
+outputs (gzip, or zstd if the zstandard package is installed).
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+from typing import Optional
+
+JSON_BACKENDS = ("auto", "json", "orjson")
+COMPRESSION_FORMATS = ("none", "gzip", "zstd")
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def add_jani_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments controlling the serialization of the Jani model to a CLI parser.
+
+    :param parser: The parser to extend.
+    """
+    parser.add_argument(
+        '--compact', action='store_true',
+        help='Write the Jani model without indentation.')
+    parser.add_argument(
+        '--json-backend', choices=JSON_BACKENDS, default="auto",
+        help='The JSON library used to write the Jani model. '
+             '"auto" uses orjson if installed and supported by the output format.')
+    parser.add_argument(
+        '--compression', choices=COMPRESSION_FORMATS, default=None,
+        help='Compress the Jani model. By default, it is deduced from the output file extension.')
+
+
+def get_compression_from_path(output_path: str) -> str:
+    """
+    Get the compression format associated to the extension of a file.
+
+    :param output_path: The path to the output file.
+    :return: The compression format, "none" if the extension is not a known one.
+    """
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if output_path.endswith(extension):
+            return compression
+    return "none"
+
+
+def _get_orjson():
+    """Return the orjson module, or None if not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dump_to_bytes(jani_dict: dict, indent: Optional[int], backend: str) -> bytes:
+    """Convert the Jani dictionary to an UTF-8 encoded JSON string."""
+    assert backend in JSON_BACKENDS, f"Unknown JSON backend {backend}."
+    # orjson supports only an indentation of 2 spaces
+    orjson_supported = indent is None or indent == 2
+    if backend == "orjson":
+        assert orjson_supported, f"The orjson backend does not support indent={indent}."
+        orjson = _get_orjson()
+        assert orjson is not None, "The orjson backend is selected, but orjson is not installed."
+    elif backend == "auto" and orjson_supported:
+        orjson = _get_orjson()
+    else:
+        orjson = None
+    if orjson is not None:
+        return orjson.dumps(jani_dict, option=orjson.OPT_INDENT_2 if indent is not None else 0)
+    if indent is None:
+        return json.dumps(jani_dict, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(jani_dict, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def _open_output_file(output_path: str, compression: str) -> io.BufferedIOBase:
+    """Open the output file in binary mode, applying the requested compression."""
+    if compression == "none":
+        return open(output_path, "wb")
+    if compression == "gzip":
+        return gzip.open(output_path, "wb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError(
+                "The zstd compression requires the zstandard package to be installed.") from e
+        return zstandard.open(output_path, "wb")
+    raise ValueError(f"Unknown compression format {compression}.")
+
+
+def write_jani_file(jani_dict: dict, output_path: str, *, indent: Optional[int] = None,
+                    backend: str = "auto", compression: Optional[str] = None) -> None:
+    """
+    Write a Jani model to file.
+
+    :param jani_dict: The Jani model, as generated by JaniModel.as_dict.
+    :param output_path: The path to the output file.
+    :param indent: The amount of spaces used for indentation. None for a compact output.
+    :param backend: The JSON library to use: json, orjson, or auto (orjson, if available).
+    :param compression: The compression to apply. None to deduce it from the file extension.
+    """
+    if compression is None:
+        compression = get_compression_from_path(output_path)
+    assert compression in COMPRESSION_FORMATS, f"Unknown compression format {compression}."
+    output_dir = os.path.dirname(output_path)
+    assert output_dir == "" or os.path.isdir(output_dir), \
+        f"The output directory {output_dir} does not exist."
+    json_bytes = _dump_to_bytes(jani_dict, indent, backend)
+    with _open_output_file(output_path, compression) as output_file:
+        output_file.write(json_bytes)
@@ -16,15 +16,16 @@
 # limitations under the License.
 
 import argparse
-import json
 import os
 import timeit
 from typing import Optional, Sequence
 
 from jani_generator.convince_jani_helpers import convince_jani_parser
 from jani_generator.jani_entries import JaniModel
-from jani_generator.scxml_helpers.top_level_interpreter import \
-    interpret_top_level_xml
+from jani_generator.jani_serializer import (add_jani_output_arguments,
+                                            write_jani_file)
+from jani_generator.ros_helpers.ros_timer import GLOBAL_TIMER_ENCODINGS
+from jani_generator.scxml_helpers.scxml_event_processor import EVENT_SYNC_MODES
 
 
 def main_convince_to_plain_jani(_args: Optional[Sequence[str]] = None) -> None:
@@ -40,6 +41,10 @@ def main_convince_to_plain_jani(_args: Optional[Sequence[str]] = None) -> None:
         '--convince_jani', help='The convince-jani file.', type=str, required=True)
     parser.add_argument(
         '--output', help='The output Plain JANI file.', type=str, required=True)
+    parser.add_argument(
+        '--cse', action='store_true',
+        help='Store the subexpressions repeated in an edge in transient variables.')
+    add_jani_output_arguments(parser)
     args = parser.parse_args(_args)
 
     start_time = timeit.default_timer()
@@ -54,10 +59,13 @@ def main_convince_to_plain_jani(_args: Optional[Sequence[str]] = None) -> None:
         convince_jani_parser(jani_model, args.convince_jani)
         model_loaded = True
     assert model_loaded, "No input file was provided. Check your input."
+    if args.cse:
+        nodes_before, nodes_after = jani_model.eliminate_common_subexpressions()
+        print(f"Common subexpression elimination: {nodes_before} -> {nodes_after} "
+              "expression nodes in the assignments.")
     # Write the loaded model to the output file
-    with open(args.output, "w", encoding='utf-8') as output_file:
-        json.dump(jani_model.as_dict(), output_file,
-                  indent=4, ensure_ascii=False)
+    write_jani_file(jani_model.as_dict(), args.output, indent=None if args.compact else 4,
+                    backend=args.json_backend, compression=args.compression)
     print(f"Converted jani model written to {args.output}.")
     print(f"Conversion took {timeit.default_timer() - start_time} seconds.")
 
@@ -81,6 +89,67 @@ def main_scxml_to_jani(_args: Optional[Sequence[str]] = None) -> None:
         description="Convert SCXML robot system models to JANI model.")
     parser.add_argument(
         "main_xml", type=str, help="The path to the main XML file to interpret.")
+    parser.add_argument(
+        "--cache-dir", type=str, default=None,
+        help="Directory of the build cache, reusing the results of unchanged input files.")
+    parser.add_argument(
+        "--jobs", type=int, default=1,
+        help="Amount of processes converting the input files in parallel.")
+    parser.add_argument(
+        "--trust-inputs", action="store_true",
+        help="Skip the validity checks of the input SCXML models, e.g. if already validated.")
+    parser.add_argument(
+        "--ros-interfaces-path", type=str, action="append", default=None,
+        help="Folder with ROS interface definitions (pkg/msg/Type.msg), used before the "
+             "installed ROS packages. Can be repeated.")
+    parser.add_argument(
+        "--ros-interfaces-schema", type=str, default=None,
+        help="File storing the resolved ROS interfaces: loaded if existing, then updated.")
+    parser.add_argument(
+        "--timer-encoding", choices=GLOBAL_TIMER_ENCODINGS, default="absolute",
+        help="Time encoding of the global timer: absolute uses an unbounded time variable, "
+             "cyclic uses bounded counters over the timers hyperperiod.")
+    parser.add_argument(
+        "--event-sync", choices=EVENT_SYNC_MODES, default="buffered",
+        help="Implementation of the SCXML events: buffered stores each event in an automaton until "
+             "it is received, direct synchronizes senders and receivers where possible.")
+    parser.add_argument(
+        "--prune-dead-events", action="store_true",
+        help="Remove the events that are sent but never received (e.g. unused topics), unless "
+             "they are used in the properties.")
+    parser.add_argument(
+        "--compact-edge-chains", action="store_true",
+        help="Merge the chains of local edges generated by the SCXML executable bodies, removing "
+             "the intermediate locations.")
+    parser.add_argument(
+        "--compact-unhandled-events", action="store_true",
+        help="Remove the self-loops ignoring the events where they can never be received, and "
+             "discard the events ignored by their only receiver with a single edge.")
+    parser.add_argument(
+        "--share-events-payload", action="store_true",
+        help="Store the payload of the events that cannot be pending at the same time in shared "
+             "variables, printing the variables stored in each one.")
+    parser.add_argument(
+        "--cone-of-influence", action="store_true",
+        help="Generate a reduced model main_<property>.jani for each property, containing only "
+             "the automata and variables that can affect it.")
+    add_jani_output_arguments(parser)
     args = parser.parse_args(_args)
 
-    interpret_top_level_xml(args.main_xml)
+    # The SCXML conversion pipeline is slow to import: load it only once the arguments are valid
+    from jani_generator.scxml_helpers.top_level_interpreter import \
+        interpret_top_level_xml
+
+    interpret_top_level_xml(args.main_xml, indent=None if args.compact else 2,
+                            json_backend=args.json_backend, compression=args.compression,
+                            cache_dir=args.cache_dir, jobs=args.jobs,
+                            trust_inputs=args.trust_inputs,
+                            ros_interfaces_paths=args.ros_interfaces_path,
+                            ros_interfaces_schema=args.ros_interfaces_schema,
+                            timer_encoding=args.timer_encoding,
+                            event_sync=args.event_sync,
+                            prune_dead_events=args.prune_dead_events,
+                            compact_edge_chains=args.compact_edge_chains,
+                            compact_unhandled_events=args.compact_unhandled_events,
+                            share_events_payload=args.share_events_payload,
+                            cone_of_influence=args.cone_of_influence)
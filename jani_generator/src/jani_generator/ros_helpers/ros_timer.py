@@ -17,16 +17,22 @@
 Representation of ROS timers.
 """
 
+from math import gcd
 from typing import List, Optional, Tuple
 
 from jani_generator.jani_entries.jani_assignment import JaniAssignment
 from jani_generator.jani_entries.jani_automaton import JaniAutomaton
 from jani_generator.jani_entries.jani_edge import JaniEdge
 from jani_generator.jani_entries.jani_expression import JaniExpression
+from jani_generator.jani_entries.jani_expression_generator import \
+    balanced_min_operator
 from jani_generator.jani_entries.jani_guard import JaniGuard
 from jani_generator.jani_entries.jani_variable import JaniVariable
 from scxml_converter.scxml_converter import ROS_TIMER_RATE_EVENT_PREFIX
 
+# Ways of storing the time in the global timer automaton
+GLOBAL_TIMER_ENCODINGS = ("absolute", "cyclic")
+
 TIME_UNITS = {
     "s": 1,
     "ms": 1e-3,
@@ -34,6 +40,9 @@ TIME_UNITS = {
     "ns": 1e-9,
 }
 
+# Max. relative error allowed when rounding the timer periods to the time resolution
+DEFAULT_TIME_RESOLUTION_TOLERANCE = 0.01
+
 
 def _convert_time_between_units(time: int, from_unit: str, to_unit: str) -> int:
     """Convert time from one unit to another."""
@@ -59,21 +68,192 @@ def _to_best_int_period(period: float) -> Tuple[int, str, float]:
     raise ValueError(f"Period {period} cannot be converted to an integer.")
 
 
+def _to_quantized_int_period(period: float, time_resolution_ns: int,
+                             tolerance: float) -> Tuple[int, str, float, float]:
+    """Round a period to a multiple of the time resolution.
+    The unit is the largest one in which the time resolution is an integer.
+
+    :param period: The period to round, in seconds.
+    :param time_resolution_ns: The time resolution, in nanoseconds.
+    :param tolerance: The max. relative rounding error allowed.
+    :return: The rounded period as integer, its unit and factor, and the relative rounding error.
+    """
+    assert time_resolution_ns > 0, "The time resolution must be positive."
+    for unit, factor in TIME_UNITS.items():
+        unit_ns = round(factor / TIME_UNITS["ns"])
+        if time_resolution_ns % unit_ns == 0:
+            resolution_int = time_resolution_ns // unit_ns
+            break
+    n_steps = max(1, round(period / (time_resolution_ns * TIME_UNITS["ns"])))
+    rounding_error = abs(n_steps * time_resolution_ns * TIME_UNITS["ns"] - period) / period
+    if rounding_error > tolerance:
+        raise ValueError(
+            f"Period {period} s cannot be rounded to a multiple of the time resolution "
+            f"{time_resolution_ns} ns: rounding error {rounding_error:.2%} > {tolerance:.2%}.")
+    return n_steps * resolution_int, unit, factor, rounding_error
+
+
 class RosTimer(object):
-    def __init__(self, name: str, freq: float) -> None:
+    def __init__(self, name: str, freq: float, time_resolution_ns: Optional[int] = None,
+                 tolerance: float = DEFAULT_TIME_RESOLUTION_TOLERANCE) -> None:
+        """
+        Initialize the timer.
+
+        :param name: The name of the timer.
+        :param freq: The frequency of the timer, in Hz.
+        :param time_resolution_ns: If defined, round the period to a multiple of this time.
+        :param tolerance: The max. relative error allowed when rounding the period.
+        """
         self.name = name
         self.freq = freq
         self.period = 1.0 / freq
-        self.period_int, self.unit, self.factor = _to_best_int_period(
-            self.period)
+        # Relative difference between the period used in the model and the exact one
+        self.rounding_error = 0.0
+        if time_resolution_ns is None:
+            self.period_int, self.unit, self.factor = _to_best_int_period(
+                self.period)
+        else:
+            self.period_int, self.unit, self.factor, self.rounding_error = \
+                _to_quantized_int_period(self.period, time_resolution_ns, tolerance)
+
+
+def _make_next_deadline_expression(timer_periods: List[int], time_var: str) -> JaniExpression:
+    """
+    Generate the expression computing the next time instant at which any of the timers is due.
+
+    :param timer_periods: The periods of the timers, all in the same time unit.
+    :param time_var: The name of the variable holding the current time.
+    :return: The expression computing the next deadline from the current time.
+    """
+    min_period = min(timer_periods)
+    if all(period % min_period == 0 for period in timer_periods):
+        # Time is always a multiple of the smallest period, that is due at each step
+        return JaniExpression({
+            "op": "+",
+            "left": JaniExpression(time_var),
+            "right": JaniExpression(min_period)
+        })
+    # The next deadline of each timer is the next multiple of its period: t - t % p + p
+    timer_deadline_exps = []
+    for period in sorted(set(timer_periods)):
+        timer_deadline_exps.append(JaniExpression({
+            "op": "+",
+            "left": JaniExpression({
+                "op": "-",
+                "left": JaniExpression(time_var),
+                "right": JaniExpression({
+                    "op": "%",
+                    "left": JaniExpression(time_var),
+                    "right": JaniExpression(period)
+                })
+            }),
+            "right": JaniExpression(period)
+        }))
+    return balanced_min_operator(timer_deadline_exps)
 
 
-def make_global_timer_automaton(timers: List[RosTimer],
-                                max_time_ns: int) -> Optional[JaniAutomaton]:
+def _make_time_encoding(
+        timer_periods: List[int], max_time: int, encoding: str
+) -> Tuple[str, List[int], List[JaniVariable], JaniExpression, List[JaniAssignment]]:
+    """
+    Generate the variables and the expressions keeping track of the time in the global timer.
+
+    :param timer_periods: The periods of the timers, all in the same time unit.
+    :param max_time: The time after which the timers stop, in the same unit of the periods.
+    :param encoding: The time encoding to use, one of GLOBAL_TIMER_ENCODINGS.
+    :return: The variable to compare with the timer periods, the periods to compare it with,
+        the time variables, the guard checking the time limit and the time assignments.
+        The time assignments with index 0 are evaluated before the timer ones, the others after.
+    """
+    assert encoding in GLOBAL_TIMER_ENCODINGS, f"Unknown global timer encoding {encoding}."
+    if encoding == "absolute":
+        # t = next deadline among all timers
+        time_assignments = [JaniAssignment({
+            "ref": "t",
+            "value": _make_next_deadline_expression(timer_periods, "t"),
+            "index": 0})]
+        time_guard = JaniExpression({
+            "op": "<",
+            "left": JaniExpression("t"),
+            "right": JaniExpression(max_time)
+        })
+        return "t", timer_periods, [JaniVariable("t", int, JaniExpression(0))], time_guard, \
+            time_assignments
+    # Cyclic encoding: the time is always a multiple of the periods' GCD, used as time unit
+    time_unit = 0
+    for period in timer_periods:
+        time_unit = gcd(time_unit, period)
+    cycle_periods = [period // time_unit for period in timer_periods]
+    # The timers are triggered with the same pattern in each hyperperiod
+    hyperperiod = 1
+    for period in cycle_periods:
+        hyperperiod = hyperperiod * period // gcd(hyperperiod, period)
+    # Time steps allowed before stopping, and the hyperperiods that can be (partially) reached
+    max_steps = -(-max_time // time_unit)
+    max_cycles = (max_steps - 1) // hyperperiod + 1 if max_steps > 0 else 0
+    time_variables = [
+        JaniVariable("t_cycle", int, JaniExpression(0), v_bounds=(0, hyperperiod - 1)),
+        JaniVariable("t_cycles", int, JaniExpression(0), v_bounds=(0, max_cycles))]
+    # t_cycles * hyperperiod + t_cycle < max_steps
+    time_guard = JaniExpression({
+        "op": "<",
+        "left": JaniExpression({
+            "op": "+",
+            "left": JaniExpression({
+                "op": "*",
+                "left": JaniExpression("t_cycles"),
+                "right": JaniExpression(hyperperiod)
+            }),
+            "right": JaniExpression("t_cycle")
+        }),
+        "right": JaniExpression(max_steps)
+    })
+    time_assignments = [
+        # t_cycle = next deadline % hyperperiod
+        JaniAssignment({
+            "ref": "t_cycle",
+            "value": JaniExpression({
+                "op": "%",
+                "left": _make_next_deadline_expression(cycle_periods, "t_cycle"),
+                "right": JaniExpression(hyperperiod)
+            }),
+            "index": 0}),
+        # The hyperperiod is completed when the (updated) t_cycle restarts from 0
+        JaniAssignment({
+            "ref": "t_cycles",
+            "value": JaniExpression({
+                "op": "ite",
+                "if": JaniExpression({
+                    "op": "=",
+                    "left": JaniExpression("t_cycle"),
+                    "right": JaniExpression(0)
+                }),
+                "then": JaniExpression({
+                    "op": "+",
+                    "left": JaniExpression("t_cycles"),
+                    "right": JaniExpression(1)
+                }),
+                "else": JaniExpression("t_cycles")
+            }),
+            "index": 1})]
+    return "t_cycle", cycle_periods, time_variables, time_guard, time_assignments
+
+
+def make_global_timer_automaton(timers: List[RosTimer], max_time_ns: int,
+                                encoding: str = "absolute") -> Optional[JaniAutomaton]:
     """
     Create a global timer automaton from a list of ROS timers.
 
+    The time advances directly to the next instant at which one or more timers are due, and only
+    the due timers are triggered: there are no steps in which no timer is triggered.
+
+    With the absolute encoding, the time is stored in an unbounded integer t. With the cyclic
+    encoding, the time is stored as the position in the hyperperiod of the timers and the amount
+    of hyperperiods elapsed, both bounded: the position depends only on the ratios of the periods.
+
     :param timers: The list of ROS timers.
+    :param max_time_ns: The time after which the timers stop, in nanoseconds.
+    :param encoding: The time encoding to use, one of GLOBAL_TIMER_ENCODINGS.
     :return: The global timer automaton.
     """
     if len(timers) == 0:
@@ -88,8 +268,6 @@ def make_global_timer_automaton(timers: List[RosTimer],
             timer.period_int, timer.unit, smallest_unit)
         for timer in timers
     }
-    # TODO: Should be greatest-common-divisor instead
-    global_timer_period = min(timer_periods_in_smallest_unit.values())
     global_timer_period_unit = smallest_unit
 
     try:
@@ -101,6 +279,8 @@ def make_global_timer_automaton(timers: List[RosTimer],
             f"Max time {max_time_ns} cannot be converted to " +\
             f"{global_timer_period_unit}. The max_time must have a unit " +\
             "that is the same or larger than the smallest timer period.")
+    time_var, time_periods, time_variables, time_guard, time_assignments = _make_time_encoding(
+        [timer_periods_in_smallest_unit[timer.name] for timer in timers], max_time, encoding)
 
     # Automaton
     LOC_NAME = "loc"
@@ -110,8 +290,8 @@ def make_global_timer_automaton(timers: List[RosTimer],
 
     # variables
     variable_names = [f"{timer.name}_needed" for timer in timers]
-    timer_automaton.add_variable(
-        JaniVariable("t", int, JaniExpression(0)))
+    for time_variable in time_variables:
+        timer_automaton.add_variable(time_variable)
     for variable_name in variable_names:
         timer_automaton.add_variable(
             JaniVariable(variable_name, bool, JaniExpression(True)))
@@ -120,27 +300,22 @@ def make_global_timer_automaton(timers: List[RosTimer],
     # edges
     # timer assignments
     timer_assignments = []
-    for i, (timer, variable_name) in enumerate(zip(timers, variable_names)):
-        period_in_gloabl_unit = timer_periods_in_smallest_unit[timer.name]
+    for i, (time_period, variable_name) in enumerate(zip(time_periods, variable_names)):
         timer_assignments.append(JaniAssignment({
             "ref": variable_name,
-            # t % {period_in_gloabl_unit} == 0
+            # t % {time_period} == 0
             "value": JaniExpression({
                 "op": "=",
                 "left": JaniExpression({
                     "op": "%",
-                    "left": JaniExpression("t"),
-                    "right": JaniExpression(period_in_gloabl_unit)
+                    "left": JaniExpression(time_var),
+                    "right": JaniExpression(time_period)
                 }),
                 "right": JaniExpression(0)
             }),
-            "index": i+1}))  # 1, because t is at index 0
+            "index": i+1}))  # 1, because the time is updated at index 0
     # guard for main edge
-    guard_exp = JaniExpression({
-        "op": "<",
-        "left": JaniExpression("t"),
-        "right": JaniExpression(max_time)
-    })
+    guard_exp = time_guard
     assert len(variable_names) > 0, "At least one timer is required."
     for variable_name in variable_names:
         singular_exp = JaniExpression({
@@ -152,17 +327,7 @@ def make_global_timer_automaton(timers: List[RosTimer],
             "left": guard_exp,
             "right": singular_exp
         })  # TODO: write test case for this
-    assignments = [
-        # t = t + global_timer_period
-        JaniAssignment({
-            "ref": "t",
-            "value": JaniExpression({
-                "op": "+",
-                "left": JaniExpression("t"),
-                "right": JaniExpression(global_timer_period)
-            }),
-            "index": 0})
-    ] + timer_assignments
+    assignments = time_assignments + timer_assignments
     iterator_edge = JaniEdge({
         "location": LOC_NAME,
         "guard": JaniGuard(guard_exp),
@@ -22,9 +22,14 @@ import xml.etree.ElementTree as ET
 from typing import Dict, List, Optional, get_args
 
 from as2fm_common.common import ros_type_name_to_python_type
-from as2fm_common.ecmascript_interpretation import interpret_ecma_script_expr
+from as2fm_common.ecmascript_interpretation import \
+    interpret_ecma_script_expr_type
 from jani_generator.jani_entries.jani_expression import JaniExpression
+from jani_generator.jani_entries.jani_expression_simplifier import \
+    simplify_expression
 from jani_generator.jani_entries.jani_variable import JaniVariable, ValidTypes
+from jani_generator.scxml_helpers.scxml_expression import \
+    parse_ecmascript_to_jani_expression
 
 
 class ScxmlData:
@@ -73,7 +78,7 @@ class ScxmlData:
 
         # trying to find the initial value of the data
         self.initial_value: ValidTypes = (
-            self.type(interpret_ecma_script_expr(self.xml_expr))
+            self.type(self._interpret_ecma_script_expr_to_value(self.xml_expr))
             if self.xml_expr is not None
             else self.type())
 
@@ -109,12 +114,27 @@ class ScxmlData:
         :param expr: The ECMA script expression
         :return: The type of the data
         """
-        my_type = type(interpret_ecma_script_expr(expr))
+        my_type = interpret_ecma_script_expr_type(expr)
         if my_type not in get_args(ValidTypes):
             raise ValueError(
                 f"Type {my_type} must be supported by Jani.")
         return my_type
 
+    def _interpret_ecma_script_expr_to_value(self, expr: str) -> ValidTypes:
+        """Interpret the value of the data from the ECMA script expression, without executing it.
+
+        :param expr: The ECMA script expression, folded to a constant in Jani
+        :raises ValueError: If the expression is not supported or it is not constant
+        :return: The value of the data
+        """
+        try:
+            jani_expr = simplify_expression(parse_ecmascript_to_jani_expression(expr), {})
+        except (AssertionError, NotImplementedError) as e:
+            raise ValueError(f"Cannot interpret the expression '{expr}' of data {self.id}.") from e
+        if jani_expr.value is None:
+            raise ValueError(f"The expression '{expr}' of data {self.id} must be constant.")
+        return jani_expr.value.value()
+
     def _evalute_possible_types(
             self,
             type_from_comment_above: Optional[type],
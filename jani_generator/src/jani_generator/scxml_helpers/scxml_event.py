@@ -17,7 +17,7 @@
 Module to hold scxml even information to convert to jani syncs later.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from scxml_converter.scxml_converter import ROS_TIMER_RATE_EVENT_PREFIX
 
@@ -127,3 +127,41 @@ class EventsHolder:
     def add_event(self, event: Event):
         assert event.name not in self._events, f"Event {event.name} must not be added twice."
         self._events[event.name] = event
+
+    def remove_event(self, event_name: str):
+        assert event_name in self._events, f"Event {event_name} not found."
+        del self._events[event_name]
+
+    def get_data_structures_subset(self, event_names: Iterable[str]) -> 'EventsHolder':
+        """
+        Generate a new holder with the data structures of the selected events.
+
+        The events in the new holder have no senders and no receivers.
+
+        :param event_names: The events to include. Unknown events are ignored.
+        :return: The new events holder.
+        """
+        subset_holder = EventsHolder()
+        for event_name in event_names:
+            if event_name in self._events and event_name not in subset_holder._events:
+                data_struct = self._events[event_name].data_struct
+                subset_holder.add_event(
+                    Event(event_name, None if data_struct is None else dict(data_struct)))
+        return subset_holder
+
+    def merge(self, other: 'EventsHolder'):
+        """
+        Add the events, senders and receivers from another holder into this one.
+
+        The data structure of an event is taken from the other holder only if it sends the event.
+
+        :param other: The events holder to merge in this one.
+        """
+        for event_name, other_event in other.get_events().items():
+            if event_name not in self._events:
+                self._events[event_name] = Event(event_name, other_event.data_struct)
+            event = self._events[event_name]
+            if other_event.has_senders():
+                event.set_data_structure(other_event.get_data_structure())
+            event.senders.update(other_event.senders)
+            event.receivers.update(other_event.receivers)
@@ -0,0 +1,182 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Allocation of the events payload variables, sharing them across mutually exclusive events.
+
+The payload of an event is live from the step sending it until the step receiving it, i.e. while
+its event automaton is in the `received` location. Two events are exclusive if none of them can be
+sent while the other one is live: this is checked on the locations of the involved automata only,
+ignoring the guards, which over-approximates the reachable states of the model.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from jani_generator.jani_entries import JaniModel, JaniVariable
+from jani_generator.jani_entries.jani_expression import \
+    get_expression_identifiers
+from jani_generator.jani_entries.jani_locations_skeleton import \
+    LocationsSkeleton
+from jani_generator.jani_entries.jani_variable import JaniVariableBounds
+from jani_generator.scxml_helpers.scxml_event import EventsHolder
+
+# Prefix of the variables storing the payload of multiple events
+PAYLOAD_SLOT_PREFIX = "events_payload.slot_"
+
+
+@dataclass()
+class PayloadAllocationReport:
+    """Summary of the payload variables shared across the events."""
+
+    variables_before: int = 0
+    variables_after: int = 0
+    # The variables stored in each shared slot
+    slots: Dict[str, List[str]] = field(default_factory=dict)
+
+    def get_stats(self) -> str:
+        """Get a description of the allocation, with the variables stored in each slot."""
+        stats = (f"Events payload allocation: {self.variables_before} -> "
+                 f"{self.variables_after} variables.")
+        for slot_name, variables in self.slots.items():
+            stats += f"\n{slot_name}: {', '.join(variables)}."
+        return stats
+
+
+def _get_misplaced_events(events_variables: Dict[str, List[str]],
+                          jani_model: JaniModel) -> Set[str]:
+    """
+    Get the events whose payload is accessed outside of the edges sending and receiving them.
+
+    :param events_variables: The payload variables of each event.
+    :param jani_model: The Jani model accessing the variables.
+    :return: The events whose payload is written or read by other edges.
+    """
+    variables_events = {variable_name: event_name
+                        for event_name, variables in events_variables.items()
+                        for variable_name in variables}
+    misplaced_events = set()
+    for automaton in jani_model.get_automata():
+        for edge in automaton.get_edges():
+            read_variables = set()
+            if edge.guard is not None and edge.guard.expression is not None:
+                read_variables.update(get_expression_identifiers(edge.guard.expression))
+            written_variables = set()
+            for destination in edge.destinations:
+                for assignment in destination["assignments"]:
+                    read_variables.update(get_expression_identifiers(assignment.get_expression()))
+                    written_variables.add(assignment.get_target())
+            for variable_name in read_variables.intersection(variables_events):
+                event_name = variables_events[variable_name]
+                if edge.get_action() != f"{event_name}_on_receive":
+                    misplaced_events.add(event_name)
+            for variable_name in written_variables.intersection(variables_events):
+                event_name = variables_events[variable_name]
+                if edge.get_action() != f"{event_name}_on_send":
+                    misplaced_events.add(event_name)
+    return misplaced_events
+
+
+def share_events_payload_variables(events_holder: EventsHolder, jani_model: JaniModel,
+                                   observed_variables: Iterable[str] = ()
+                                   ) -> PayloadAllocationReport:
+    """
+    Store the payload of mutually exclusive events in the same variables, once the syncs are set.
+
+    The payload variables of each event (including the `valid` flag) are assigned greedily to the
+    first slot of the same type that is not used by a non-exclusive event. Only the slots used by
+    multiple variables replace the original variables.
+
+    :param events_holder: The holder of the events, implemented as syncs in the Jani model.
+    :param jani_model: The Jani model to modify.
+    :param observed_variables: Variables that must be kept (e.g. the ones used in the properties).
+    :return: A report of the allocation, relating each slot to the variables it stores.
+    """
+    observed_variables = set(observed_variables)
+    model_variables = jani_model.get_variables()
+    events_variables: Dict[str, List[str]] = {}
+    for event_name, event in events_holder.get_events().items():
+        if event.must_be_skipped_in_jani_conversion():
+            continue
+        event_variables = [f"{event_name}.{p_name}" for p_name in event.get_data_structure()]
+        event_variables.append(f"{event_name}.valid")
+        if all(variable_name in model_variables for variable_name in event_variables) and \
+                observed_variables.isdisjoint(event_variables):
+            events_variables[event_name] = event_variables
+    for event_name in _get_misplaced_events(events_variables, jani_model):
+        events_variables.pop(event_name)
+    skeleton = LocationsSkeleton(jani_model)
+    events_automata: Dict[str, Set[str]] = {}
+    live_locations: Dict[str, Tuple[str, str]] = {}
+    for event_name in events_variables:
+        event = events_holder.get_event(event_name)
+        events_automata[event_name] = \
+            {sender.automaton_name for sender in event.get_senders()} | \
+            {receiver.automaton_name for receiver in event.get_receivers()}
+        if skeleton.has_location(event_name, "received"):
+            # Buffered event, otherwise it is never live after the step sending it
+            events_automata[event_name].add(event_name)
+            live_locations[event_name] = (event_name, "received")
+    exclusive_events: Dict[FrozenSet[str], bool] = {}
+
+    def are_exclusive(first_event: str, second_event: str) -> bool:
+        events_pair = frozenset((first_event, second_event))
+        if events_pair not in exclusive_events:
+            pair_live_locations = {event_name: live_locations[event_name]
+                                   for event_name in events_pair if event_name in live_locations}
+            # The sending of each event, while the other one is live
+            sending_location_actions = [
+                (live_automaton, live_location, f"{sent_event}_on_send")
+                for live_event, (live_automaton, live_location) in pair_live_locations.items()
+                for sent_event in events_pair if sent_event != live_event]
+            exclusive_events[events_pair] = len(sending_location_actions) == 0 or \
+                skeleton.get_enabled_location_actions(
+                    events_automata[first_event] | events_automata[second_event],
+                    sending_location_actions) == set()
+        return exclusive_events[events_pair]
+
+    # The slots of each type, with the events using them
+    slots: Dict[Tuple[type, Optional[JaniVariableBounds]], List[Tuple[List[str], Set[str]]]] = {}
+    for event_name, event_variables in events_variables.items():
+        used_slots = set()
+        for variable_name in event_variables:
+            variable = model_variables[variable_name]
+            slot_type = (variable.get_type(), variable.get_bounds())
+            type_slots = slots.setdefault(slot_type, [])
+            for slot_idx, (slot_variables, slot_events) in enumerate(type_slots):
+                if (slot_type, slot_idx) not in used_slots and \
+                        all(are_exclusive(event_name, slot_event) for slot_event in slot_events):
+                    break
+            else:
+                slot_idx = len(type_slots)
+                type_slots.append(([], set()))
+            type_slots[slot_idx][0].append(variable_name)
+            type_slots[slot_idx][1].add(event_name)
+            used_slots.add((slot_type, slot_idx))
+    report = PayloadAllocationReport()
+    replacements: Dict[str, str] = {}
+    for (variable_type, variable_bounds), type_slots in slots.items():
+        for slot_variables, _ in type_slots:
+            report.variables_before += len(slot_variables)
+            report.variables_after += 1
+            if len(slot_variables) < 2:
+                continue
+            slot_name = f"{PAYLOAD_SLOT_PREFIX}{len(report.slots)}"
+            jani_model.add_jani_variable(
+                JaniVariable(slot_name, variable_type, v_bounds=variable_bounds))
+            replacements.update({variable_name: slot_name for variable_name in slot_variables})
+            report.slots[slot_name] = slot_variables
+    jani_model.replace_variables(replacements)
+    return report
@@ -17,32 +17,403 @@
 Module to process events from scxml and implement them as syncs between jani automata.
 """
 
-from typing import List
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from jani_generator.jani_entries import JaniModel
+from jani_generator.jani_entries import (JaniAssignment, JaniExpression,
+                                         JaniModel)
 from jani_generator.jani_entries.jani_automaton import JaniAutomaton
 from jani_generator.jani_entries.jani_composition import JaniComposition
 from jani_generator.jani_entries.jani_edge import JaniEdge
+from jani_generator.jani_entries.jani_expression import \
+    get_expression_identifiers
+from jani_generator.jani_entries.jani_expression_generator import (
+    and_operator, balanced_or_operator, equal_operator, lower_equal_operator)
+from jani_generator.jani_entries.jani_locations_skeleton import \
+    LocationsSkeleton
+from jani_generator.jani_entries.jani_variable import JaniVariableBounds
 from jani_generator.ros_helpers.ros_timer import RosTimer
-from jani_generator.scxml_helpers.scxml_event import EventsHolder
+from jani_generator.scxml_helpers.scxml_event import Event, EventsHolder
 from scxml_converter.scxml_converter import ROS_TIMER_RATE_EVENT_PREFIX
 
+# Bounds of the data fields sent along each event: event name -> field name -> bounds
+EventsPayloadBounds = Dict[str, Dict[str, JaniVariableBounds]]
+
+# buffered: each event is stored in a dedicated automaton, until all receivers process it.
+# direct: where possible, the senders synchronize directly with the receivers of the event.
+EVENT_SYNC_MODES = ("buffered", "direct")
+
+# Suffix of the variable storing the location of an automaton, used by the discard edges
+LOCATION_ID_SUFFIX = ".location_id"
+
+
+def _is_direct_sync_possible(event: Event, jani_model: JaniModel) -> bool:
+    """
+    Check if the senders of an event can synchronize directly with its receivers.
+
+    This is the case if the receivers can process the event from all their locations, so that the
+    senders are never blocked, and their guards do not depend on the data sent with the event, that
+    is assigned in the same step. Additionally, no automaton can send the event to itself.
+
+    :param event: The event to check.
+    :param jani_model: The Jani model containing the senders and receivers automata.
+    :return: True if the event can be implemented without an intermediate automaton.
+    """
+    action_on_receive = f"{event.name}_on_receive"
+    senders = {sender.automaton_name for sender in event.get_senders()}
+    for receiver in event.get_receivers():
+        if receiver.automaton_name in senders:
+            return False
+        receiver_automaton = jani_model.get_automaton(receiver.automaton_name)
+        assert receiver_automaton is not None, \
+            f"Automaton {receiver.automaton_name} receiving event {event.name} not found."
+        receiving_locations = set()
+        for edge in receiver_automaton.get_edges_with_action(action_on_receive):
+            if edge.guard is not None and edge.guard.expression is not None:
+                guard_identifiers = get_expression_identifiers(edge.guard.expression)
+                if any(identifier.startswith((f"{event.name}.", "_event."))
+                       for identifier in guard_identifiers):
+                    return False
+            receiving_locations.add(edge.location)
+        if receiving_locations != receiver_automaton.get_locations():
+            return False
+    return True
+
+
+def _implement_direct_event_syncs(event: Event, jani_model: JaniModel, jc: JaniComposition):
+    """
+    Synchronize the edges sending an event directly with the edges receiving it.
+
+    The assignments of the receiving edges are moved to the next assignment index, to read the data
+    assigned by the sender in the same step.
+
+    :param event: The event to implement.
+    :param jani_model: The Jani model containing the senders and receivers automata.
+    :param jc: The composition to add the syncs to.
+    """
+    action_on_send = f"{event.name}_on_send"
+    action_on_receive = f"{event.name}_on_receive"
+    receivers_syncs = {}
+    for receiver in event.get_receivers():
+        assert receiver.edge_action_name == action_on_receive, \
+            f"Action name {receiver.edge_action_name} must be {action_on_receive}."
+        receiver_automaton = jani_model.get_automaton(receiver.automaton_name)
+        assert receiver_automaton is not None, \
+            f"Automaton {receiver.automaton_name} receiving event {event.name} not found."
+        for edge in receiver_automaton.get_edges_with_action(action_on_receive):
+            for destination in edge.destinations:
+                destination["assignments"] = [JaniAssignment({
+                    "ref": assignment.get_target(),
+                    "value": assignment.get_expression(),
+                    "index": assignment.get_index() + 1
+                }) for assignment in destination["assignments"]]
+        receivers_syncs[receiver.automaton_name] = action_on_receive
+    for sender in event.get_senders():
+        assert sender.edge_action_name == action_on_send, \
+            f"Action name {sender.edge_action_name} must be {action_on_send}."
+        jc.add_sync(action_on_send, {sender.automaton_name: action_on_send, **receivers_syncs})
+
+
+@dataclass()
+class DeadEventsReport:
+    """Summary of the elements removed with the events that are never received."""
+
+    events: List[str] = field(default_factory=list)
+    variables: List[str] = field(default_factory=list)
+    assignments: int = 0
+    edges: int = 0
+    locations: int = 0
+
+    def get_stats(self) -> str:
+        """Get a description of the removed elements."""
+        stats = (f"Dead events pruning: removed {len(self.events)} events, "
+                 f"{len(self.variables)} variables, {self.assignments} assignments, "
+                 f"{self.edges} edges and {self.locations} locations.")
+        if len(self.events) > 0:
+            stats += f"\nRemoved events: {', '.join(self.events)}."
+        return stats
+
+
+def _is_bypassable_edge(edge: JaniEdge, automaton: JaniAutomaton) -> bool:
+    """Check if an edge does nothing, and it is the only way out of its (non-initial) source."""
+    if len(edge.destinations) != 1 or len(edge.destinations[0]["assignments"]) > 0:
+        return False
+    if edge.guard is not None and edge.guard.expression is not None:
+        return False
+    if edge.destinations[0]["location"] == edge.location:
+        return False
+    return edge.location not in automaton.get_initial_locations() and \
+        len(automaton.get_edges_from_location(edge.location)) == 1
+
+
+def _bypass_locations(automaton: JaniAutomaton, next_locations: Dict[str, str]):
+    """
+    Redirect the edges reaching the provided locations to the following ones, and remove them.
+
+    :param automaton: The automaton to modify.
+    :param next_locations: The locations to remove, with the location each one leads to.
+    """
+    def resolve(location: str) -> str:
+        while location in next_locations:
+            location = next_locations[location]
+        return location
+
+    for edge in automaton.get_edges():
+        for destination in edge.destinations:
+            destination["location"] = resolve(destination["location"])
+    for location in next_locations:
+        automaton.remove_location(location)
+
+
+def remove_dead_events(events_holder: EventsHolder, jani_model: JaniModel,
+                       observed_variables: Iterable[str] = ()) -> DeadEventsReport:
+    """
+    Remove the events that are sent but never received, before implementing the events as syncs.
+
+    The edges sending these events lose the assignments to the event data: the ones left without
+    effects are removed, connecting their source location directly to their target location.
+
+    :param events_holder: The holder of the events, the dead events are removed from it.
+    :param jani_model: The jani model containing the automata sending the events.
+    :param observed_variables: Variables that must be kept (e.g. the ones used in the properties).
+    :return: A report of the removed elements.
+    """
+    observed_variables = set(observed_variables)
+    report = DeadEventsReport()
+    # The locations to remove in each automaton, with the location each one leads to
+    bypassed_locations: Dict[str, Dict[str, str]] = {}
+    for event_name, event in list(events_holder.get_events().items()):
+        if event.must_be_skipped_in_jani_conversion() or event.has_receivers() or \
+                not event.has_senders():
+            continue
+        event_variables = [f"{event_name}.{p_name}" for p_name in event.get_data_structure()]
+        event_variables.append(f"{event_name}.valid")
+        if not observed_variables.isdisjoint(event_variables):
+            continue
+        events_holder.remove_event(event_name)
+        report.events.append(event_name)
+        report.variables.extend(event_variables)
+        for sender in event.get_senders():
+            automaton = jani_model.get_automaton(sender.automaton_name)
+            assert automaton is not None, \
+                f"Automaton {sender.automaton_name} sending event {event_name} not found."
+            for edge in automaton.get_edges_with_action(sender.edge_action_name):
+                for destination in edge.destinations:
+                    kept_assignments = [assignment for assignment in destination["assignments"]
+                                        if assignment.get_target() not in event_variables]
+                    report.assignments += len(destination["assignments"]) - len(kept_assignments)
+                    destination["assignments"] = kept_assignments
+                if _is_bypassable_edge(edge, automaton):
+                    bypassed_locations.setdefault(automaton.get_name(), {})[edge.location] = \
+                        edge.destinations[0]["location"]
+                    automaton.remove_edge(edge)
+                    report.edges += 1
+    for automaton_name, next_locations in bypassed_locations.items():
+        automaton = jani_model.get_automaton(automaton_name)
+        assert automaton is not None, f"Automaton {automaton_name} not found."
+        _bypass_locations(automaton, next_locations)
+        report.locations += len(next_locations)
+    return report
+
+
+def _get_discarding_locations(automaton: JaniAutomaton, action_name: str) -> List[str]:
+    """
+    Get the locations where an event is always discarded, by means of an empty self-loop.
+
+    :param automaton: The automaton receiving the event.
+    :param action_name: The action of the edges receiving the event.
+    :return: The locations whose only edge receiving the event is an unguarded, empty self-loop.
+    """
+    edges_per_location: Dict[str, List[JaniEdge]] = {}
+    for edge in automaton.get_edges_with_action(action_name):
+        edges_per_location.setdefault(edge.location, []).append(edge)
+    return sorted(
+        location for location, edges in edges_per_location.items()
+        if len(edges) == 1 and edges[0].is_empty_self_loop() and
+        (edges[0].guard is None or edges[0].guard.expression is None))
+
+
+def _remove_unreachable_discards(events_receivers: Dict[str, List[str]],
+                                 jani_model: JaniModel) -> int:
+    """
+    Remove the self-loops discarding an event in locations where it can never be received.
+
+    The locations of the event automaton, its senders and receivers are explored, ignoring the
+    guards. While some self-loops seem reachable, the exploration is repeated including the
+    automata synchronizing with the explored ones, until all of them are included or the
+    exploration gets too large.
+
+    :param events_receivers: The buffered events, each one with its receiving automata.
+    :param jani_model: The Jani model containing the event and receiver automata, with its syncs.
+    :return: The amount of removed self-loops.
+    """
+    skeleton = LocationsSkeleton(jani_model)
+    removed_loops = 0
+    for event_name, receivers_names in events_receivers.items():
+        action_on_receive = f"{event_name}_on_receive"
+        receivers_automata: Dict[str, JaniAutomaton] = {}
+        for receiver_name in receivers_names:
+            receiver_automaton = jani_model.get_automaton(receiver_name)
+            assert receiver_automaton is not None, \
+                f"Automaton {receiver_name} receiving event {event_name} not found."
+            receivers_automata[receiver_name] = receiver_automaton
+        discarding_locations = {
+            (receiver_name, location, action_on_receive)
+            for receiver_name, receiver_automaton in receivers_automata.items()
+            for location in _get_discarding_locations(receiver_automaton, action_on_receive)}
+        reachable_locations = discarding_locations
+        explored_automata = skeleton.get_neighbors([event_name])
+        while len(reachable_locations) > 0:
+            explored_locations = skeleton.get_enabled_location_actions(
+                explored_automata, reachable_locations)
+            if explored_locations is None:
+                break
+            reachable_locations = explored_locations
+            next_automata = skeleton.get_neighbors(explored_automata)
+            if next_automata == explored_automata:
+                break
+            explored_automata = next_automata
+        for receiver_name, location, _ in discarding_locations - reachable_locations:
+            receiver_automaton = receivers_automata[receiver_name]
+            for edge in receiver_automaton.get_edges_with_action(action_on_receive):
+                if edge.location == location:
+                    receiver_automaton.remove_edge(edge)
+                    removed_loops += 1
+    return removed_loops
+
+
+def _add_location_id_variable(automaton: JaniAutomaton, jani_model: JaniModel) -> Dict[str, int]:
+    """
+    Add a global variable mirroring the current location of an automaton.
+
+    The variable is updated by all edges changing location, so it adds no states to the model.
+
+    :param automaton: The automaton whose location is stored.
+    :param jani_model: The Jani model to add the variable to.
+    :return: The value of the variable in each location of the automaton.
+    """
+    location_ids = {location: location_id
+                    for location_id, location in enumerate(sorted(automaton.get_locations()))}
+    initial_locations = automaton.get_initial_locations()
+    assert len(initial_locations) == 1, \
+        f"Automaton {automaton.get_name()} must have exactly one initial location."
+    variable_name = f"{automaton.get_name()}{LOCATION_ID_SUFFIX}"
+    jani_model.add_variable(variable_name, int, location_ids[next(iter(initial_locations))],
+                            variable_bounds=(0, len(location_ids) - 1))
+    for edge in automaton.get_edges():
+        for destination in edge.destinations:
+            if destination["location"] != edge.location:
+                destination["assignments"].append(JaniAssignment({
+                    "ref": variable_name,
+                    "value": location_ids[destination["location"]]
+                }))
+    return location_ids
+
+
+def _get_location_set_guard(variable_name: str, location_ids: List[int]) -> JaniExpression:
+    """Get the expression checking if the location variable is one of the provided values."""
+    ranges: List[Tuple[int, int]] = []
+    for location_id in sorted(location_ids):
+        if len(ranges) > 0 and ranges[-1][1] == location_id - 1:
+            ranges[-1] = (ranges[-1][0], location_id)
+        else:
+            ranges.append((location_id, location_id))
+    return balanced_or_operator([
+        equal_operator(variable_name, lower) if lower == upper else
+        and_operator(lower_equal_operator(lower, variable_name),
+                     lower_equal_operator(variable_name, upper))
+        for lower, upper in ranges])
+
+
+def _implement_events_discard(events_receivers: Dict[str, List[str]],
+                              jani_model: JaniModel) -> Tuple[int, int]:
+    """
+    Replace the self-loops discarding an event in its receiver with an edge in the event automaton.
+
+    The event automaton gets a local edge, dropping the event when the receiver is in one of the
+    locations that ignore it. This is done only for the events with a single receiver, discarded in
+    at least 2 locations, to reduce the amount of edges in the model.
+
+    :param events_receivers: The buffered events, each one with its receiving automata.
+    :param jani_model: The Jani model containing the event and receiver automata, with its syncs.
+    :return: The amount of removed self-loops and of added discard edges.
+    """
+    removed_loops = 0
+    added_edges = 0
+    system = jani_model.get_system()
+    assert system is not None, "The system composition is not set"
+    receivers_location_ids: Dict[str, Dict[str, int]] = {}
+    for event_name, receivers_names in events_receivers.items():
+        if len(receivers_names) != 1:
+            continue
+        receiver_name = receivers_names[0]
+        action_on_receive = f"{event_name}_on_receive"
+        receiver_automaton = jani_model.get_automaton(receiver_name)
+        assert receiver_automaton is not None, \
+            f"Automaton {receiver_name} receiving event {event_name} not found."
+        discarding_locations = _get_discarding_locations(receiver_automaton, action_on_receive)
+        if len(discarding_locations) < 2 or \
+                len(receiver_automaton.get_initial_locations()) != 1:
+            continue
+        for edge in receiver_automaton.get_edges_with_action(action_on_receive):
+            if edge.location in discarding_locations:
+                receiver_automaton.remove_edge(edge)
+                removed_loops += 1
+        if receiver_name not in receivers_location_ids:
+            receivers_location_ids[receiver_name] = \
+                _add_location_id_variable(receiver_automaton, jani_model)
+        location_ids = receivers_location_ids[receiver_name]
+        action_on_discard = f"{event_name}_on_discard"
+        event_automaton = jani_model.get_automaton(event_name)
+        assert event_automaton is not None, f"Automaton for event {event_name} not found."
+        event_automaton.add_edge(JaniEdge({
+            "location": "received",
+            "guard": _get_location_set_guard(
+                f"{receiver_name}{LOCATION_ID_SUFFIX}",
+                [location_ids[location] for location in discarding_locations]),
+            "destinations": [{
+                "location": "waiting",
+                "probability": {"exp": 1.0},
+                "assignments": []
+            }],
+            "action": action_on_discard
+        }))
+        system.add_sync(action_on_discard, {event_name: action_on_discard})
+        added_edges += 1
+    return removed_loops, added_edges
+
 
 def implement_scxml_events_as_jani_syncs(
         events_holder: EventsHolder,
         timers: List[RosTimer],
-        jani_model: JaniModel) -> List[str]:
+        jani_model: JaniModel,
+        events_payload_bounds: Optional[EventsPayloadBounds] = None,
+        event_sync: str = "buffered",
+        compact_unhandled_events: bool = False) -> List[str]:
     """
     Implement the scxml events as jani syncs.
 
     :param events_holder: The holder of the events.
     :param timers: The timers to add to the jani model.
     :param jani_model: The jani model to add the syncs to.
+    :param events_payload_bounds: The bounds of the events' data fields, if known.
+    :param event_sync: How the events are implemented, one of EVENT_SYNC_MODES.
+    :param compact_unhandled_events: If True, the self-loops ignoring a buffered event are removed
+        where it can never be received, and replaced by a discard edge in the event automaton where
+        possible.
     :return: The list of events having only senders.
     """
+    assert event_sync in EVENT_SYNC_MODES, \
+        f"Unknown event sync mode {event_sync}, expected one of {EVENT_SYNC_MODES}."
+    if events_payload_bounds is None:
+        events_payload_bounds = {}
     jc = JaniComposition()
     event_action_names = []
     events_without_receivers = []
+    # The actions of the edges receiving unused bt events, removed all at once at the end
+    bt_actions_to_remove = []
+    # The receivers of the buffered events, whose unhandled self-loops can be compacted
+    events_receivers: Dict[str, List[str]] = {}
     for automaton in jani_model.get_automata():
         jc.add_element(automaton.get_name())
     for event_name, event in events_holder.get_events().items():
@@ -53,9 +424,29 @@ def implement_scxml_events_as_jani_syncs(
         if event.must_be_skipped_in_jani_conversion():
             # if this is a bt event, we have to get rid of all edges receiving that event
             if event.is_bt_response_event():
-                jani_model.remove_edges_with_action(event_name_on_receive)
+                bt_actions_to_remove.append(event_name_on_receive)
             continue
         assert event.has_senders(), f"Event {event_name} must have at least one sender"
+        # Add the global data, if needed
+        payload_bounds = events_payload_bounds.get(event_name, {})
+        for p_name, p_type_str in event.get_data_structure().items():
+            # TODO: Dots are likely to create problems in the future. Consider replacing them
+            jani_model.add_variable(
+                variable_name=f"{event_name}.{p_name}",
+                variable_type=p_type_str,
+                variable_bounds=payload_bounds.get(p_name) if p_type_str == int else None
+            )
+        # For each event, we add an extra boolean flag for data validity
+        jani_model.add_variable(
+            variable_name=f"{event_name}.valid",
+            variable_type=bool,
+            variable_init_expression=False
+        )
+        if event_sync == "direct" and _is_direct_sync_possible(event, jani_model):
+            _implement_direct_event_syncs(event, jani_model, jc)
+            if not event.has_receivers():
+                events_without_receivers.append(event_name)
+            continue
         # Prepare the automaton handling the event
         event_automaton = JaniAutomaton()
         event_automaton.set_name(event_name)
@@ -110,6 +501,8 @@ def implement_scxml_events_as_jani_syncs(
                     f"Action name {action_name} must be {event_name_on_receive}."
                 receivers_syncs.update({receiver.automaton_name: action_name})
             jc.add_sync(event_name_on_receive, receivers_syncs)
+            events_receivers[event_name] = sorted(
+                {receiver.automaton_name for receiver in event.get_receivers()})
         # Verify and prepare the sender syncs
         for sender in event.get_senders():
             action_name = sender.edge_action_name
@@ -119,19 +512,6 @@ def implement_scxml_events_as_jani_syncs(
                 event_name: action_name,
                 sender.automaton_name: action_name}
             jc.add_sync(action_name, senders_syncs)
-        # Add the global data, if needed
-        for p_name, p_type_str in event.get_data_structure().items():
-            # TODO: Dots are likely to create problems in the future. Consider replacing them
-            jani_model.add_variable(
-                variable_name=f"{event_name}.{p_name}",
-                variable_type=p_type_str
-            )
-        # For each event, we add an extra boolean flag for data validity
-        jani_model.add_variable(
-            variable_name=f"{event_name}.valid",
-            variable_type=bool,
-            variable_init_expression=False
-        )
     # Add syncs for rate timers
     for timer in timers:
         name = timer.name
@@ -147,5 +527,11 @@ def implement_scxml_events_as_jani_syncs(
         jc.add_sync(action_name_receiver, {
             automaton_name: action_name_receiver,
             'global_timer': action_name_receiver})
+    jani_model.remove_edges_with_actions(bt_actions_to_remove)
     jani_model.add_system_sync(jc)
+    if compact_unhandled_events:
+        unreachable_loops = _remove_unreachable_discards(events_receivers, jani_model)
+        removed_loops, added_edges = _implement_events_discard(events_receivers, jani_model)
+        print(f"Unhandled events compaction: {unreachable_loops} unreachable self-loops removed, "
+              f"{removed_loops} self-loops replaced by {added_edges} discard edges.")
     return events_without_receivers
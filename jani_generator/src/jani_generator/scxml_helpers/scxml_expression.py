@@ -17,28 +17,43 @@
 Module producing jani expressions from ecmascript.
 """
 
-import esprima
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from jani_generator.jani_entries.jani_convince_expression_expansion import \
     BASIC_EXPRESSIONS_MAPPING
 from jani_generator.jani_entries.jani_expression import JaniExpression
 from jani_generator.jani_entries.jani_value import JaniValue
 
+if TYPE_CHECKING:
+    # esprima is slow to import: it is imported at its first use
+    import esprima
 
+# Max. amount of parsed ecmascript expressions to keep in memory
+ECMASCRIPT_PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=ECMASCRIPT_PARSE_CACHE_SIZE)
 def parse_ecmascript_to_jani_expression(ecmascript: str) -> JaniExpression:
     """
     Parse ecmascript to jani expression.
 
+    The results are cached and shared among all callers using the same ecmascript string: the
+    returned expression must not be modified in place (e.g. use the copy returned by
+    `replace_event` instead).
+
     :param ecmascript: The ecmascript to parse.
     :return: The jani expression.
     """
+    import esprima
+
     ast = esprima.parseScript(ecmascript)
     assert len(ast.body) == 1, "The ecmascript must contain exactly one expression."
     ast = ast.body[0]
     return _parse_ecmascript_to_jani_expression(ast)
 
 
-def _parse_ecmascript_to_jani_expression(ast: esprima.nodes.Script) -> JaniExpression:
+def _parse_ecmascript_to_jani_expression(ast: "esprima.nodes.Script") -> JaniExpression:
     """
     Parse ecmascript to jani expression.
 
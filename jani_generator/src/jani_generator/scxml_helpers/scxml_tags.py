@@ -21,12 +21,13 @@ import xml.etree.ElementTree as ET
 from hashlib import sha256
 from typing import Dict, List, Optional, Set, Tuple, Union
 
-from as2fm_common.ecmascript_interpretation import interpret_ecma_script_expr
+from as2fm_common.ecmascript_interpretation import \
+    interpret_ecma_script_expr_type
 from jani_generator.jani_entries import (JaniAssignment, JaniAutomaton,
                                          JaniEdge, JaniExpression, JaniGuard,
                                          JaniVariable)
 from jani_generator.jani_entries.jani_expression_generator import (
-    and_operator, not_operator)
+    balanced_and_operator, not_operator)
 from jani_generator.scxml_helpers.scxml_event import Event, EventsHolder
 from jani_generator.scxml_helpers.scxml_expression import \
     parse_ecmascript_to_jani_expression
@@ -66,9 +67,7 @@ def _interpret_scxml_assign(elem: ScxmlAssign, event_substitution: Optional[str]
     assert isinstance(elem, ScxmlAssign), \
         f"Expected ScxmlAssign, got {type(elem)}"
     assignment_value = parse_ecmascript_to_jani_expression(
-        elem.get_expr())
-    if isinstance(assignment_value, JaniExpression):
-        assignment_value.replace_event(event_substitution)
+        elem.get_expr()).replace_event(event_substitution)
     return JaniAssignment({
         "ref": elem.get_location(),
         "value": assignment_value,
@@ -91,10 +90,29 @@ def _merge_conditions(
         joint_condition = new_condition
     else:
         joint_condition = JaniExpression(True)
-    for pc in previous_conditions:
-        negated_pc = not_operator(pc)
-        joint_condition = and_operator(joint_condition, negated_pc)
-    return joint_condition
+    return balanced_and_operator(
+        [joint_condition] + [not_operator(pc) for pc in previous_conditions])
+
+
+def _get_variable_types(jani_automaton: JaniAutomaton, events_holder: EventsHolder,
+                        trigger_event: Optional[str]) -> Dict[str, type]:
+    """Collect the types of the variables accessible from an SCXML executable body.
+
+    These are the automaton's variables and, if known, the payload of the triggering event.
+
+    :param jani_automaton: The automaton holding the variables declared in the datamodel.
+    :param events_holder: The holder of the events, containing the known payload structures.
+    :param trigger_event: The event triggering the execution of the body, if any.
+    :return: A dictionary mapping each variable name (e.g. `_event.data`) to its type.
+    """
+    variable_types = {
+        var_name: jani_var.get_type() for var_name, jani_var in
+        jani_automaton.get_variables().items()}
+    if trigger_event is not None and events_holder.has_event(trigger_event):
+        event_struct = events_holder.get_event(trigger_event).get_data_structure()
+        for field_name, field_type in event_struct.items():
+            variable_types[f"_event.{field_name}"] = field_type
+    return variable_types
 
 
 def _append_scxml_body_to_jani_automaton(jani_automaton: JaniAutomaton, events_holder: EventsHolder,
@@ -150,14 +168,8 @@ def _append_scxml_body_to_jani_automaton(jani_automaton: JaniAutomaton, events_h
                     "value": parse_ecmascript_to_jani_expression(
                         expr).replace_event(trigger_event)
                 }))
-                variables = {}
-                for n, v in jani_automaton.get_variables().items():
-                    variables[n] = v.get_type()()
-                # TODO: We should get the type explicitly: sometimes the expression is underdefined
-                print(f"Interpreting {expr} with {variables}")
-                # This might contain reference to event variables, that have no type specified
-                data_structure_for_event[param.get_name()] = \
-                    type(interpret_ecma_script_expr(expr, variables))
+                data_structure_for_event[param.get_name()] = interpret_ecma_script_expr_type(
+                    expr, _get_variable_types(jani_automaton, events_holder, trigger_event))
             new_edge.destinations[0]['assignments'].append(JaniAssignment({
                 "ref": f'{ec.get_event()}.valid',
                 "value": True
@@ -287,16 +299,16 @@ class DatamodelTag(BaseTag):
     def write_model(self):
         for scxml_data in self.element.get_data_entries():
             assert isinstance(scxml_data, ScxmlData), "Unexpected element in the DataModel."
-            assert scxml_data.check_validity(), "Found invalid data entry."
+            assert scxml_data.is_valid(), "Found invalid data entry."
             # TODO: ScxmlData from scxml_helpers provide many more options.
             # It should be ported to scxml_entries.ScxmlDataModel
             init_value = parse_ecmascript_to_jani_expression(scxml_data.get_expr())
-            expr_type = type(interpret_ecma_script_expr(scxml_data.get_expr()))
+            expr_type = interpret_ecma_script_expr_type(scxml_data.get_expr())
             assert expr_type == scxml_data.get_type(), \
                 f"Expected type {scxml_data.get_type()}, got {expr_type}."
-            # TODO: Add support for lower and upper bounds
             self.automaton.add_variable(
-                JaniVariable(scxml_data.get_name(), scxml_data.get_type(), init_value))
+                JaniVariable(scxml_data.get_name(), scxml_data.get_type(), init_value,
+                             v_bounds=scxml_data.get_bounds()))
 
 
 class ScxmlTag(BaseTag):
@@ -477,15 +489,12 @@ class TransitionTag(BaseTag):
             existing_event.add_receiver(self.automaton.get_name(), action_name)
         # Prepare the previous expressions for the transition guard
         previous_expressions = [
-            parse_ecmascript_to_jani_expression(cond) for cond in self._previous_conditions]
-        if event_name is not None:
-            for expr in previous_expressions:
-                expr.replace_event(transition_trigger_event)
+            parse_ecmascript_to_jani_expression(cond).replace_event(transition_trigger_event)
+            for cond in self._previous_conditions]
         transition_condition = self.element.get_condition()
         if transition_condition is not None:
-            current_expression = parse_ecmascript_to_jani_expression(transition_condition)
-            if event_name is not None:
-                current_expression.replace_event(transition_trigger_event)
+            current_expression = parse_ecmascript_to_jani_expression(
+                transition_condition).replace_event(transition_trigger_event)
             # If there are multiple transitions for an event, consider the previous conditions
             merged_expression = _merge_conditions(previous_expressions, current_expression)
             guard = JaniGuard(merged_expression)
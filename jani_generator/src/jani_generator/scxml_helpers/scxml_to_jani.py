@@ -17,8 +17,11 @@
 Module handling the conversion from SCXML to Jani.
 """
 
-from typing import List, Union
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                wait)
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
+from as2fm_common.build_cache import BuildCache
 from jani_generator.jani_entries.jani_automaton import JaniAutomaton
 from jani_generator.jani_entries.jani_model import JaniModel
 from jani_generator.ros_helpers.ros_services import \
@@ -26,10 +29,18 @@ from jani_generator.ros_helpers.ros_services import \
 from jani_generator.ros_helpers.ros_timer import (RosTimer,
                                                   make_global_timer_automaton)
 from jani_generator.scxml_helpers.scxml_event import EventsHolder
-from jani_generator.scxml_helpers.scxml_event_processor import \
-    implement_scxml_events_as_jani_syncs
+from jani_generator.scxml_helpers.scxml_event_payload import \
+    share_events_payload_variables
+from jani_generator.scxml_helpers.scxml_event_processor import (
+    EventsPayloadBounds, implement_scxml_events_as_jani_syncs,
+    remove_dead_events)
 from jani_generator.scxml_helpers.scxml_tags import BaseTag
-from scxml_converter.scxml_entries import ScxmlRoot
+from scxml_converter.scxml_entries import (ScxmlExecutionBody, ScxmlIf,
+                                           ScxmlRoot, ScxmlSend,
+                                           get_trust_inputs, set_trust_inputs)
+
+# Result of the conversion of a single SCXML model: the automaton and its events, to be merged
+AutomatonConversionResult = Tuple[JaniAutomaton, EventsHolder]
 
 
 def convert_scxml_root_to_jani_automaton(
@@ -46,19 +57,184 @@ def convert_scxml_root_to_jani_automaton(
                          events_holder)).write_model()
 
 
+def _get_received_events(scxml_root: ScxmlRoot) -> Set[str]:
+    """Get the events triggering the transitions of an SCXML model."""
+    received_events: Set[str] = set()
+    for state in scxml_root.get_states():
+        for transition in state.get_body():
+            events = transition.get_events()
+            if events is not None:
+                received_events.update(events)
+    return received_events
+
+
+def _get_sent_events(scxml_root: ScxmlRoot) -> Set[str]:
+    """Get the events sent from the executable bodies of an SCXML model."""
+    sent_events: Set[str] = set()
+    bodies_to_visit: List[Optional[ScxmlExecutionBody]] = []
+    for state in scxml_root.get_states():
+        bodies_to_visit.extend([state.get_onentry(), state.get_onexit()])
+        bodies_to_visit.extend(
+            transition.get_executable_body() for transition in state.get_body())
+    while len(bodies_to_visit) > 0:
+        exec_body = bodies_to_visit.pop()
+        if exec_body is None:
+            continue
+        for entry in exec_body:
+            if isinstance(entry, ScxmlSend):
+                sent_events.add(entry.get_event())
+            elif isinstance(entry, ScxmlIf):
+                bodies_to_visit.extend(
+                    cond_body for _, cond_body in entry.get_conditional_executions())
+                bodies_to_visit.append(entry.get_else_execution())
+    return sent_events
+
+
+def _get_conversion_cache_key(
+        cache: BuildCache, scxml_root: ScxmlRoot, events_holder: EventsHolder) -> str:
+    """Get the cache key of an SCXML model, converted using the provided events."""
+    data_structures = [
+        f"{event_name}:{sorted((k, v.__name__) for k, v in event.get_data_structure().items())}"
+        for event_name, event in events_holder.get_events().items()]
+    return cache.make_key("scxml_to_jani", scxml_root.as_xml_string(), *data_structures)
+
+
+def _convert_scxml_root_with_events(
+        scxml_root: ScxmlRoot, events_holder: EventsHolder) -> AutomatonConversionResult:
+    """Convert an SCXML model to a Jani automaton, adding its events to the provided holder."""
+    automaton = JaniAutomaton()
+    convert_scxml_root_to_jani_automaton(scxml_root, automaton, events_holder)
+    return automaton, events_holder
+
+
+def convert_scxml_root_to_jani_automaton_and_events(
+        scxml_root: ScxmlRoot, known_events: EventsHolder, cache: Optional[BuildCache] = None
+) -> AutomatonConversionResult:
+    """
+    Convert an SCXML model to a Jani automaton, independently from the other models.
+
+    The result depends only on the SCXML model and on the data structures of the events it
+    receives, hence it can be cached.
+
+    :param scxml_root: The plain SCXML model to convert.
+    :param known_events: The events declared by the previously converted models.
+    :param cache: The cache storing the results of previous conversions, if any.
+    :return: The Jani automaton and the events sent or received by it, to be merged.
+    """
+    events_holder = known_events.get_data_structures_subset(
+        sorted(_get_received_events(scxml_root)))
+    if cache is None:
+        return _convert_scxml_root_with_events(scxml_root, events_holder)
+    cache_key = _get_conversion_cache_key(cache, scxml_root, events_holder)
+    cached_entry = cache.load(cache_key)
+    if cached_entry is not None:
+        return cached_entry
+    conversion_result = _convert_scxml_root_with_events(scxml_root, events_holder)
+    cache.store(cache_key, conversion_result)
+    return conversion_result
+
+
+def _convert_scxml_roots_in_parallel(
+        scxml_roots: List[ScxmlRoot], jobs: int, cache: Optional[BuildCache] = None
+) -> List[AutomatonConversionResult]:
+    """
+    Convert multiple SCXML models to Jani automata, using a pool of processes.
+
+    A model is converted as soon as all the previous models sending the events it receives are
+    converted: this way, it gets the same payload structures as in the sequential conversion.
+
+    :param scxml_roots: The plain SCXML models to convert.
+    :param jobs: The amount of processes to use.
+    :param cache: The cache storing the results of previous conversions, if any.
+    :return: The conversion result of each model, in the same order as the input models.
+    """
+    received_events = [_get_received_events(scxml_root) for scxml_root in scxml_roots]
+    sent_events = [_get_sent_events(scxml_root) for scxml_root in scxml_roots]
+    dependencies = [
+        [prev_idx for prev_idx in range(idx)
+         if not sent_events[prev_idx].isdisjoint(received_events[idx])]
+        for idx in range(len(scxml_roots))]
+    results: List[Optional[AutomatonConversionResult]] = [None] * len(scxml_roots)
+    models_to_convert = list(range(len(scxml_roots)))
+    running_conversions: Dict[Future, Tuple[int, Optional[str]]] = {}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=set_trust_inputs,
+                             initargs=(get_trust_inputs(),)) as executor:
+        while len(models_to_convert) > 0 or len(running_conversions) > 0:
+            ready_models = [idx for idx in models_to_convert
+                            if all(results[dep_idx] is not None for dep_idx in dependencies[idx])]
+            found_in_cache = False
+            for idx in ready_models:
+                models_to_convert.remove(idx)
+                known_events = EventsHolder()
+                for dep_idx in dependencies[idx]:
+                    dep_result = results[dep_idx]
+                    assert dep_result is not None, f"Model {dep_idx} must be converted first."
+                    known_events.merge(dep_result[1])
+                events_holder = known_events.get_data_structures_subset(
+                    sorted(received_events[idx]))
+                cache_key = None
+                if cache is not None:
+                    cache_key = _get_conversion_cache_key(cache, scxml_roots[idx], events_holder)
+                    results[idx] = cache.load(cache_key)
+                    if results[idx] is not None:
+                        found_in_cache = True
+                        continue
+                future = executor.submit(
+                    _convert_scxml_root_with_events, scxml_roots[idx], events_holder)
+                running_conversions[future] = (idx, cache_key)
+            if found_in_cache:
+                # Other models might be ready to be converted already
+                continue
+            done_conversions, _ = wait(running_conversions, return_when=FIRST_COMPLETED)
+            for future in done_conversions:
+                idx, cache_key = running_conversions.pop(future)
+                results[idx] = future.result()
+                if cache is not None:
+                    cache.store(cache_key, results[idx])
+    converted_results: List[AutomatonConversionResult] = []
+    for result in results:
+        assert result is not None, "All the models must be converted."
+        converted_results.append(result)
+    return converted_results
+
+
 def convert_multiple_scxmls_to_jani(
         scxmls: List[Union[str, ScxmlRoot]],
         timers: List[RosTimer],
-        max_time_ns: int
+        max_time_ns: int,
+        cache: Optional[BuildCache] = None,
+        jobs: int = 1,
+        timer_encoding: str = "absolute",
+        events_payload_bounds: Optional[EventsPayloadBounds] = None,
+        event_sync: str = "buffered",
+        prune_dead_events: bool = False,
+        observed_variables: Iterable[str] = (),
+        compact_edge_chains: bool = False,
+        compact_unhandled_events: bool = False,
+        share_events_payload: bool = False
 ) -> JaniModel:
     """
     Assemble automata from multiple SCXML files into a Jani model.
 
     :param scxml_paths: The paths to the SCXML files to convert.
+    :param timers: The ROS timers to implement in the global timer automaton.
+    :param max_time_ns: The maximum time to simulate, in nanoseconds.
+    :param cache: The cache storing the conversion results of each SCXML model, if any.
+    :param jobs: The amount of processes converting the SCXML models in parallel.
+    :param timer_encoding: The time encoding of the global timer automaton: absolute or cyclic.
+    :param events_payload_bounds: The bounds of the data fields sent along the events, if known.
+    :param event_sync: How the events are implemented: buffered or direct.
+    :param prune_dead_events: If True, remove the events that are sent but never received.
+    :param observed_variables: Variables to keep when pruning the events (e.g. from properties).
+    :param compact_edge_chains: If True, merge the chains of local edges in the automata.
+    :param compact_unhandled_events: If True, remove the self-loops ignoring the events where they
+        can never be received, and discard the other ignored events in the event automata.
+    :param share_events_payload: If True, store the payload of mutually exclusive events in the
+        same variables.
     :return: The Jani model containing the converted automata.
     """
-    base_model = JaniModel()
-    events_holder = EventsHolder()
+    assert jobs > 0, f"The amount of jobs must be positive, found {jobs}."
+    scxml_roots: List[ScxmlRoot] = []
     for input_scxml in scxmls:
         if isinstance(input_scxml, str):
             scxml_root = ScxmlRoot.from_scxml_file(input_scxml)
@@ -67,12 +243,34 @@ def convert_multiple_scxmls_to_jani(
             scxml_root = input_scxml
         assert scxml_root.is_plain_scxml(), \
             f"Input model {scxml_root.get_name()} does not contain a plain SCXML model."
-        automaton = JaniAutomaton()
-        convert_scxml_root_to_jani_automaton(scxml_root, automaton, events_holder)
+        scxml_roots.append(scxml_root)
+    parallel_results: Sequence[Optional[AutomatonConversionResult]] = [None] * len(scxml_roots)
+    if jobs > 1 and len(scxml_roots) > 1:
+        parallel_results = _convert_scxml_roots_in_parallel(scxml_roots, jobs, cache)
+    base_model = JaniModel()
+    events_holder = EventsHolder()
+    # Merge the results in the input order, to get the same model as in the sequential conversion
+    for scxml_root, conversion_result in zip(scxml_roots, parallel_results):
+        if conversion_result is None:
+            conversion_result = convert_scxml_root_to_jani_automaton_and_events(
+                scxml_root, events_holder, cache)
+        automaton, automaton_events = conversion_result
+        events_holder.merge(automaton_events)
         base_model.add_jani_automaton(automaton)
-    timer_automaton = make_global_timer_automaton(timers, max_time_ns)
+    timer_automaton = make_global_timer_automaton(timers, max_time_ns, timer_encoding)
     if timer_automaton is not None:
         base_model.add_jani_automaton(timer_automaton)
-    implement_scxml_events_as_jani_syncs(events_holder, timers, base_model)
+    if prune_dead_events:
+        print(remove_dead_events(events_holder, base_model, observed_variables).get_stats())
+    # The service handlers must be finalized before checking which events can be synced directly
     remove_empty_self_loops_from_srv_handlers_in_jani(base_model)
+    implement_scxml_events_as_jani_syncs(
+        events_holder, timers, base_model, events_payload_bounds, event_sync,
+        compact_unhandled_events)
+    if compact_edge_chains:
+        locations_before, locations_after = base_model.compact_edge_chains()
+        print(f"Edge chains compaction: {locations_before} -> {locations_after} locations.")
+    if share_events_payload:
+        print(share_events_payload_variables(
+            events_holder, base_model, observed_variables).get_stats())
     return base_model
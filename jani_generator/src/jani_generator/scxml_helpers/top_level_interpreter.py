@@ -19,23 +19,47 @@ Module reading the top level xml file containing the whole model to check.
 
 import json
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from xml.etree import ElementTree as ET
 
-from as2fm_common.common import remove_namespace
+from as2fm_common.build_cache import BuildCache
+from as2fm_common.common import remove_namespace, ros_type_name_to_bounds
 from jani_generator.jani_entries import JaniModel
+from jani_generator.jani_entries.jani_cone_of_influence import \
+    get_cone_of_influence_model
+from jani_generator.jani_entries.jani_variable import JaniVariableBounds
+from jani_generator.jani_serializer import (COMPRESSION_EXTENSIONS,
+                                            write_jani_file)
 from jani_generator.ros_helpers.ros_services import RosService, RosServices
-from jani_generator.ros_helpers.ros_timer import RosTimer
+from jani_generator.ros_helpers.ros_timer import (
+    DEFAULT_TIME_RESOLUTION_TOLERANCE, RosTimer)
+from jani_generator.scxml_helpers.scxml_event_processor import \
+    EventsPayloadBounds
 from jani_generator.scxml_helpers.scxml_to_jani import \
     convert_multiple_scxmls_to_jani
-from scxml_converter.bt_converter import bt_converter
-from scxml_converter.scxml_entries import ScxmlRoot
+from scxml_converter.ros_interfaces_registry import (
+    RosInterfacesRegistry, get_ros_interfaces_registry,
+    set_ros_interfaces_registry)
+from scxml_converter.scxml_entries import (ScxmlRoot,
+                                           ScxmlRosDeclarationsContainer,
+                                           get_trust_inputs, set_trust_inputs)
+from scxml_converter.scxml_entries.utils import (
+    generate_srv_request_event, generate_srv_response_event,
+    generate_srv_server_request_event, generate_srv_server_response_event)
+
+# Property keys whose value depends on the amount of steps or rewards collected by the whole model.
+# Properties containing them are always evaluated on the full model.
+STEP_DEPENDENT_PROPERTY_KEYS = {"step-bounds", "time-bounds", "reward-bounds", "accumulate"}
 
 
 @dataclass()
 class FullModel:
     max_time: Optional[int] = None
+    time_resolution: Optional[int] = None
+    time_resolution_tolerance: float = DEFAULT_TIME_RESOLUTION_TOLERANCE
     bt: Optional[str] = None
     plugins: List[str] = field(default_factory=list)
     skills: List[str] = field(default_factory=list)
@@ -67,6 +91,8 @@ def parse_main_xml(xml_path: str) -> FullModel:
 
     The returned dictionary contains the following keys:
     - max_time: The maximum time in nanoseconds.
+    - time_resolution: The resolution of the timer periods in nanoseconds, if any.
+    - time_resolution_tolerance: The max. relative error when rounding the timer periods.
     - bt: The path to the Behavior Tree definition.
     - plugins: A list of paths to the Behavior Tree plugins.
     - skills: A list of paths to SCXML files encoding an FSM.
@@ -83,10 +109,13 @@ def parse_main_xml(xml_path: str) -> FullModel:
     for first_level in xml.getroot():
         if remove_namespace(first_level.tag) == "mc_parameters":
             for mc_parameter in first_level:
-                # if remove_namespace(mc_parameter.tag) == "time_resolution":
-                #     time_resolution = _parse_time_element(mc_parameter)
                 if remove_namespace(mc_parameter.tag) == "max_time":
                     model.max_time = _parse_time_element(mc_parameter)
+                elif remove_namespace(mc_parameter.tag) == "time_resolution":
+                    model.time_resolution = _parse_time_element(mc_parameter)
+                    assert model.time_resolution > 0, "The time resolution must be positive."
+                    if "tolerance" in mc_parameter.attrib:
+                        model.time_resolution_tolerance = float(mc_parameter.attrib["tolerance"])
                 else:
                     raise ValueError(
                         f"Invalid mc_parameter tag: {mc_parameter.tag}")
@@ -124,62 +153,360 @@ def parse_main_xml(xml_path: str) -> FullModel:
     return model
 
 
+def _read_file_content(fname: str) -> bytes:
+    with open(fname, 'rb') as f:
+        return f.read()
+
+
+def _convert_bt_to_scxml_files(
+        bt_path: str, plugin_paths: List[str], output_folder: str,
+        cache: Optional[BuildCache] = None) -> List[str]:
+    """
+    Convert the Behavior Tree and its plugins to ROS-SCXML files, reusing cached results if any.
+
+    :param bt_path: The path to the Behavior Tree definition.
+    :param plugin_paths: The paths to the Behavior Tree plugins.
+    :param output_folder: The folder where the generated SCXML files are written.
+    :param cache: The cache storing the results of previous conversions, if any.
+    :return: The paths of the generated SCXML files.
+    """
+    # btlib is required (and imported) only by the models containing a Behavior Tree
+    from scxml_converter.bt_converter import bt_converter
+
+    if cache is None:
+        return bt_converter(bt_path, plugin_paths, output_folder)
+    cache_key = cache.make_key(
+        "bt_converter", _read_file_content(bt_path),
+        *[_read_file_content(plugin_path) for plugin_path in plugin_paths])
+    generated_contents: Optional[List[Tuple[str, str]]] = cache.load(cache_key)
+    if generated_contents is None:
+        generated_files = bt_converter(bt_path, plugin_paths, output_folder)
+        generated_contents = []
+        for fname in generated_files:
+            with open(fname, 'r', encoding='utf-8') as f:
+                generated_contents.append((os.path.basename(fname), f.read()))
+        cache.store(cache_key, generated_contents)
+        return generated_files
+    generated_files = []
+    for basename, content in generated_contents:
+        fname = os.path.join(output_folder, basename)
+        with open(fname, 'w', encoding='utf-8') as f:
+            f.write(content)
+        generated_files.append(fname)
+    return generated_files
+
+
+def _initialize_conversion_process(
+        trust_inputs: bool, ros_interfaces_registry: RosInterfacesRegistry) -> None:
+    """Configure a worker process like the main one, sharing the ROS interfaces resolved so far."""
+    set_trust_inputs(trust_inputs)
+    set_ros_interfaces_registry(ros_interfaces_registry)
+
+
+def _convert_to_plain_scxml_and_declarations(
+        fname: str) -> Tuple[ScxmlRoot, ScxmlRosDeclarationsContainer]:
+    """Convert a ROS-SCXML file to plain SCXML, returning the ROS declarations found in it."""
+    scxml_root = ScxmlRoot.from_scxml_file(fname)
+    # Validate the whole model once: the following checks reuse the cached results
+    assert scxml_root.is_valid(), f"Invalid SCXML model in {fname}."
+    return scxml_root.to_plain_scxml_and_declarations()
+
+
+def _convert_to_plain_scxml_and_declarations_in_worker(
+        fname: str) -> Tuple[Tuple[ScxmlRoot, ScxmlRosDeclarationsContainer], Dict[str, Any]]:
+    """Convert a ROS-SCXML file, returning also the schema of the ROS interfaces resolved."""
+    conversion_result = _convert_to_plain_scxml_and_declarations(fname)
+    return conversion_result, get_ros_interfaces_registry().export_schema()
+
+
+def _get_ros_interfaces_fields(
+        ros_declarations: ScxmlRosDeclarationsContainer) -> Dict[str, Any]:
+    """Get the resolved fields of the ROS interfaces declared by an automaton, None if unknown."""
+    registry = get_ros_interfaces_registry()
+    interfaces_fields: Dict[str, Any] = {}
+    for msg_type in {**ros_declarations.get_publishers(),
+                     **ros_declarations.get_subscribers()}.values():
+        interfaces_fields[f"msg:{msg_type}"] = registry.get_msg_fields(msg_type) \
+            if registry.is_type_known(msg_type, "msg") else None
+    for srv_type in {**ros_declarations.get_service_clients(),
+                     **ros_declarations.get_service_servers()}.values():
+        interfaces_fields[f"srv:{srv_type}"] = registry.get_srv_fields(srv_type) \
+            if registry.is_type_known(srv_type, "srv") else None
+    return interfaces_fields
+
+
+def _has_same_ros_interfaces(cache_entry: Tuple[Tuple[ScxmlRoot, ScxmlRosDeclarationsContainer],
+                                                Dict[str, Any]]) -> bool:
+    """Check if the ROS interfaces used by a cached conversion still resolve to the same fields."""
+    (_, ros_declarations), interfaces_fields = cache_entry
+    return _get_ros_interfaces_fields(ros_declarations) == interfaces_fields
+
+
+def _convert_files_to_plain_scxml_and_declarations(
+        fnames: List[str], cache: Optional[BuildCache] = None, jobs: int = 1
+) -> List[Tuple[ScxmlRoot, ScxmlRosDeclarationsContainer]]:
+    """
+    Convert multiple ROS-SCXML files to plain SCXML, reusing cached results if any.
+
+    :param fnames: The paths to the ROS-SCXML files.
+    :param cache: The cache storing the results of previous conversions, if any.
+    :param jobs: The amount of processes converting the files in parallel.
+    :return: The plain SCXML model and the ROS declarations of each file, in the input order.
+    """
+    results: List[Optional[Tuple[ScxmlRoot, ScxmlRosDeclarationsContainer]]] = \
+        [None] * len(fnames)
+    cache_keys: List[Optional[str]] = [None] * len(fnames)
+    if cache is not None:
+        for idx, fname in enumerate(fnames):
+            # The key covers the file only: the ROS interfaces it uses are checked when loading
+            cache_keys[idx] = cache.make_key("ros_to_plain_scxml", _read_file_content(fname))
+            cache_entry = cache.load(cache_keys[idx], _has_same_ros_interfaces)
+            if cache_entry is not None:
+                results[idx] = cache_entry[0]
+    files_to_convert = [idx for idx, result in enumerate(results) if result is None]
+    fnames_to_convert = [fnames[idx] for idx in files_to_convert]
+    if jobs > 1 and len(files_to_convert) > 1:
+        with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_initialize_conversion_process,
+                initargs=(get_trust_inputs(), get_ros_interfaces_registry())) as executor:
+            conversion_results = []
+            for conversion_result, ros_interfaces_schema in executor.map(
+                    _convert_to_plain_scxml_and_declarations_in_worker, fnames_to_convert):
+                # Share the interfaces resolved by the workers with the main process
+                get_ros_interfaces_registry().import_schema(ros_interfaces_schema)
+                conversion_results.append(conversion_result)
+    else:
+        conversion_results = [
+            _convert_to_plain_scxml_and_declarations(fname) for fname in fnames_to_convert]
+    for idx, conversion_result in zip(files_to_convert, conversion_results):
+        results[idx] = conversion_result
+        if cache is not None:
+            cache.store(cache_keys[idx], (
+                conversion_result, _get_ros_interfaces_fields(conversion_result[1])))
+    converted_results: List[Tuple[ScxmlRoot, ScxmlRosDeclarationsContainer]] = []
+    for result in results:
+        assert result is not None, "All the files must be converted."
+        converted_results.append(result)
+    return converted_results
+
+
+def _get_ros_fields_bounds(ros_fields: Dict[str, str]) -> Dict[str, JaniVariableBounds]:
+    """Get the bounds of the integer ROS fields, from their bit width."""
+    fields_bounds = {}
+    for field_name, field_type in ros_fields.items():
+        field_bounds = ros_type_name_to_bounds(field_type)
+        if field_bounds is not None:
+            fields_bounds[field_name] = field_bounds
+    return fields_bounds
+
+
+def _add_ros_events_payload_bounds(
+        ros_declarations: ScxmlRosDeclarationsContainer,
+        events_payload_bounds: EventsPayloadBounds) -> None:
+    """
+    Add the bounds of the data exchanged by the ROS topics and services of an automaton.
+
+    The data of interfaces that cannot be resolved (e.g. from cached conversions) stays unbounded.
+
+    :param ros_declarations: The ROS declarations of the automaton.
+    :param events_payload_bounds: The bounds of each event's data fields, updated in place.
+    """
+    registry = get_ros_interfaces_registry()
+    automaton_name = ros_declarations.get_automaton_name()
+    for topic_name, topic_type in {**ros_declarations.get_publishers(),
+                                   **ros_declarations.get_subscribers()}.items():
+        if not registry.is_type_known(topic_type, "msg"):
+            continue
+        events_payload_bounds[f"ros_topic.{topic_name}"] = \
+            _get_ros_fields_bounds(registry.get_msg_fields(topic_type))
+    for service_name, service_type in ros_declarations.get_service_clients().items():
+        if not registry.is_type_known(service_type, "srv"):
+            continue
+        req_fields, res_fields = registry.get_srv_fields(service_type)
+        events_payload_bounds[generate_srv_request_event(service_name, automaton_name)] = \
+            _get_ros_fields_bounds(req_fields)
+        events_payload_bounds[generate_srv_response_event(service_name, automaton_name)] = \
+            _get_ros_fields_bounds(res_fields)
+    for service_name, service_type in ros_declarations.get_service_servers().items():
+        if not registry.is_type_known(service_type, "srv"):
+            continue
+        req_fields, res_fields = registry.get_srv_fields(service_type)
+        events_payload_bounds[generate_srv_server_request_event(service_name)] = \
+            _get_ros_fields_bounds(req_fields)
+        events_payload_bounds[generate_srv_server_response_event(service_name)] = \
+            _get_ros_fields_bounds(res_fields)
+
+
 def generate_plain_scxml_models_and_timers(
-        model: FullModel) -> Tuple[List[ScxmlRoot], List[RosTimer]]:
+        model: FullModel, cache: Optional[BuildCache] = None, jobs: int = 1
+) -> Tuple[List[ScxmlRoot], List[RosTimer], EventsPayloadBounds]:
     """
     Generate plain SCXML models and ROS timers from the full model dictionary.
+
+    :param model: The full model to convert.
+    :param cache: The cache storing the results of previous conversions, if any.
+    :param jobs: The amount of processes converting the ROS-SCXML files in parallel.
+    :return: The plain SCXML models, the ROS timers they use and the bounds of the data exchanged
+        by the ROS topics and services (from the bit width of the fields).
     """
     # Convert behavior tree and plugins to ROS-scxml
     scxml_files_to_convert: list = model.skills + model.components
     if model.bt is not None:
         bt_out_dir = os.path.join(os.path.dirname(model.bt), "generated_bt_scxml")
         os.makedirs(bt_out_dir, exist_ok=True)
-        expanded_bt_plugin_scxmls = bt_converter(
-            model.bt, model.plugins, bt_out_dir)
+        expanded_bt_plugin_scxmls = _convert_bt_to_scxml_files(
+            model.bt, model.plugins, bt_out_dir, cache)
         scxml_files_to_convert.extend(expanded_bt_plugin_scxmls)
 
     # Convert ROS-SCXML FSMs to plain SCXML
     plain_scxml_models = []
     all_timers: List[RosTimer] = []
     all_services: RosServices = {}
-    for fname in scxml_files_to_convert:
-        plain_scxml, ros_declarations = \
-            ScxmlRoot.from_scxml_file(fname).to_plain_scxml_and_declarations()
+    events_payload_bounds: EventsPayloadBounds = {}
+    for plain_scxml, ros_declarations in _convert_files_to_plain_scxml_and_declarations(
+            scxml_files_to_convert, cache, jobs):
         # Handle ROS timers
         for timer_name, timer_rate in ros_declarations._timers.items():
             assert timer_name not in all_timers, \
                 f"Timer {timer_name} already exists."
-            all_timers.append(RosTimer(timer_name, timer_rate))
+            ros_timer = RosTimer(timer_name, timer_rate, model.time_resolution,
+                                 model.time_resolution_tolerance)
+            if model.time_resolution is not None:
+                print(f"Timer {timer_name}: period of {ros_timer.period_int} "
+                      f"{ros_timer.unit}, rounding error {ros_timer.rounding_error:.3%}.")
+            all_timers.append(ros_timer)
         # Handle ROS Services
-        for service_name, service_type in ros_declarations._service_clients.items():
+        for service_name, service_type in ros_declarations.get_service_clients().items():
             if service_name not in all_services:
                 all_services[service_name] = RosService()
             all_services[service_name].append_service_client(
                 service_name, service_type, plain_scxml.get_name())
-        for service_name, service_type in ros_declarations._service_servers.items():
+        for service_name, service_type in ros_declarations.get_service_servers().items():
             if service_name not in all_services:
                 all_services[service_name] = RosService()
             all_services[service_name].set_service_server(
                 service_name, service_type, plain_scxml.get_name())
+        _add_ros_events_payload_bounds(ros_declarations, events_payload_bounds)
         plain_scxml_models.append(plain_scxml)
     # Generate service sync SCXML models
     for service_info in all_services.values():
         plain_scxml_models.append(service_info.to_scxml())
-    return plain_scxml_models, all_timers
+    return plain_scxml_models, all_timers, events_payload_bounds
+
+
+def _get_json_strings(json_content: Any) -> Set[str]:
+    """Get all strings in a JSON structure, e.g. to find the identifiers used in the properties."""
+    json_strings: Set[str] = set()
+    contents_to_visit = [json_content]
+    while len(contents_to_visit) > 0:
+        content = contents_to_visit.pop()
+        if isinstance(content, str):
+            json_strings.add(content)
+        elif isinstance(content, dict):
+            contents_to_visit.extend(content.values())
+        elif isinstance(content, list):
+            contents_to_visit.extend(content)
+    return json_strings
 
 
-def interpret_top_level_xml(xml_path: str, store_generated_scxmls: bool = False):
+def _has_step_dependent_keys(jani_property: Dict[str, Any]) -> bool:
+    """Check if a property depends on the amount of steps, e.g. with step bounds or rewards."""
+    contents_to_visit: List[Any] = [jani_property]
+    while len(contents_to_visit) > 0:
+        content = contents_to_visit.pop()
+        if isinstance(content, dict):
+            if not STEP_DEPENDENT_PROPERTY_KEYS.isdisjoint(content.keys()):
+                return True
+            contents_to_visit.extend(content.values())
+        elif isinstance(content, list):
+            contents_to_visit.extend(content)
+    return False
+
+
+def _sanitize_file_name(name: str) -> str:
+    """Replace the characters that are not safe in file names."""
+    return re.sub(r"[^\w.-]", "_", name)
+
+
+def interpret_top_level_xml(xml_path: str, store_generated_scxmls: bool = False, *,
+                            indent: Optional[int] = 2, json_backend: str = "auto",
+                            compression: Optional[str] = None, cache_dir: Optional[str] = None,
+                            jobs: int = 1, trust_inputs: bool = False,
+                            ros_interfaces_paths: Optional[List[str]] = None,
+                            ros_interfaces_schema: Optional[str] = None,
+                            timer_encoding: str = "absolute", event_sync: str = "buffered",
+                            prune_dead_events: bool = False,
+                            compact_edge_chains: bool = False,
+                            compact_unhandled_events: bool = False,
+                            share_events_payload: bool = False,
+                            cone_of_influence: bool = False):
     """
     Interpret the top-level XML file as a Jani model. And write it to a file.
     The generated Jani model is written to the same directory as the input XML file under the
-    name `main.jani`.
+    name `main.jani` (with an additional `.gz` or `.zst` extension if compressed).
 
     :param xml_path: The path to the XML file to interpret.
+    :param store_generated_scxmls: If True, store the generated plain SCXML models.
+    :param indent: The indentation of the generated Jani file. None for a compact output.
+    :param json_backend: The JSON library to use for writing: json, orjson or auto.
+    :param compression: The compression to apply to the output: none, gzip or zstd.
+    :param cache_dir: The directory of the build cache. If None, no caching is performed.
+    :param jobs: The amount of processes converting the input files in parallel.
+    :param trust_inputs: If True, skip the validity checks of the (pre-validated) SCXML models.
+    :param ros_interfaces_paths: Folders with the ROS interface definition files (.msg, .srv),
+        used before the installed ROS packages. If None, the current configuration is kept.
+    :param ros_interfaces_schema: A file storing the resolved ROS interfaces. It is loaded if
+        existing, and updated with the interfaces resolved in the conversion.
+    :param timer_encoding: The time encoding of the global timer automaton: absolute or cyclic.
+    :param event_sync: How the SCXML events are implemented: buffered or direct.
+    :param prune_dead_events: If True, remove the events that are sent but never received, unless
+        their data is used in the properties.
+    :param compact_edge_chains: If True, merge the chains of local edges generated by the SCXML
+        executable bodies, removing the intermediate locations.
+    :param compact_unhandled_events: If True, the self-loops ignoring the events are removed where
+        they can never be received, and replaced by a single discard edge where possible.
+    :param share_events_payload: If True, store the payload of the events that cannot be pending at
+        the same time in shared variables. The variables stored in each one are printed.
+    :param cone_of_influence: If True, generate a reduced model for each property, containing only
+        the automata and variables that can affect it. The models are written in the files
+        `main_<property_name>.jani`, instead of `main.jani`.
     """
+    previous_trust_inputs = get_trust_inputs()
+    previous_registry = get_ros_interfaces_registry()
+    set_trust_inputs(trust_inputs)
+    if ros_interfaces_paths is not None and \
+            ros_interfaces_paths != previous_registry.get_search_paths():
+        set_ros_interfaces_registry(RosInterfacesRegistry(ros_interfaces_paths))
+    try:
+        if ros_interfaces_schema is not None and os.path.isfile(ros_interfaces_schema):
+            get_ros_interfaces_registry().load_schema(ros_interfaces_schema)
+        _interpret_top_level_xml(xml_path, store_generated_scxmls, indent, json_backend,
+                                 compression, cache_dir, jobs, timer_encoding, event_sync,
+                                 prune_dead_events, compact_edge_chains,
+                                 compact_unhandled_events, share_events_payload,
+                                 cone_of_influence)
+        if cache_dir is not None or ros_interfaces_schema is not None:
+            # The interfaces are reused across conversions only with a cache or a schema
+            print(get_ros_interfaces_registry().get_stats())
+        if ros_interfaces_schema is not None:
+            get_ros_interfaces_registry().save_schema(ros_interfaces_schema)
+    finally:
+        set_trust_inputs(previous_trust_inputs)
+        set_ros_interfaces_registry(previous_registry)
+
+
+def _interpret_top_level_xml(xml_path: str, store_generated_scxmls: bool, indent: Optional[int],
+                             json_backend: str, compression: Optional[str],
+                             cache_dir: Optional[str], jobs: int, timer_encoding: str,
+                             event_sync: str, prune_dead_events: bool,
+                             compact_edge_chains: bool, compact_unhandled_events: bool,
+                             share_events_payload: bool, cone_of_influence: bool):
     model_dir = os.path.dirname(xml_path)
     model = parse_main_xml(xml_path)
     assert model.max_time is not None, f"Max time must be defined in {xml_path}."
-    plain_scxml_models, all_timers = generate_plain_scxml_models_and_timers(model)
+    cache = None if cache_dir is None else BuildCache(cache_dir)
+    plain_scxml_models, all_timers, events_payload_bounds = generate_plain_scxml_models_and_timers(
+        model, cache, jobs)
 
     if store_generated_scxmls:
         plain_scxml_dir = os.path.join(model_dir, "generated_plain_scxml")
@@ -189,14 +516,44 @@ def interpret_top_level_xml(xml_path: str, store_generated_scxmls: bool = False)
                       encoding='utf-8') as f:
                 f.write(scxml_model.as_xml_string())
 
-    jani_model = convert_multiple_scxmls_to_jani(
-        plain_scxml_models, all_timers, model.max_time)
-
-    jani_dict = jani_model.as_dict()
     assert len(model.properties) == 1, "Only one property is supported right now."
     with open(model.properties[0], "r", encoding='utf-8') as f:
-        jani_dict["properties"] = json.load(f)["properties"]
+        jani_properties = json.load(f)["properties"]
 
-    output_path = os.path.join(model_dir, "main.jani")
-    with open(output_path, "w", encoding='utf-8') as f:
-        json.dump(jani_dict, f, indent=2, ensure_ascii=False)
+    jani_model = convert_multiple_scxmls_to_jani(
+        plain_scxml_models, all_timers, model.max_time, cache, jobs, timer_encoding,
+        events_payload_bounds, event_sync, prune_dead_events,
+        _get_json_strings(jani_properties), compact_edge_chains, compact_unhandled_events,
+        share_events_payload)
+    if cache is not None:
+        print(cache.get_stats())
+
+    output_extension = "" if compression is None else COMPRESSION_EXTENSIONS.get(compression, "")
+    if not cone_of_influence:
+        jani_dict = jani_model.as_dict()
+        jani_dict["properties"] = jani_properties
+        output_path = os.path.join(model_dir, "main.jani" + output_extension)
+        write_jani_file(jani_dict, output_path, indent=indent, backend=json_backend,
+                        compression=compression)
+        return
+    # Generate a reduced model for each property
+    n_automata = len(jani_model.get_automata())
+    n_variables = len(jani_model.get_variables())
+    for jani_property in jani_properties:
+        property_name = jani_property["name"]
+        property_strings = _get_json_strings(jani_property)
+        if _has_step_dependent_keys(jani_property):
+            print(f"Property {property_name} depends on the amount of steps: "
+                  "keeping the full model.")
+            reduced_model = jani_model
+        else:
+            reduced_model = get_cone_of_influence_model(jani_model, property_strings)
+        print(f"Cone of influence of {property_name}: kept "
+              f"{len(reduced_model.get_automata())}/{n_automata} automata and "
+              f"{len(reduced_model.get_variables())}/{n_variables} global variables.")
+        jani_dict = reduced_model.as_dict()
+        jani_dict["properties"] = [jani_property]
+        output_path = os.path.join(
+            model_dir, f"main_{_sanitize_file_name(property_name)}.jani{output_extension}")
+        write_jani_file(jani_dict, output_path, indent=indent, backend=json_backend,
+                        compression=compression)
@@ -15,7 +15,9 @@
 
 """Test to CONVINCE robotics Jani to plain Jani conversion."""
 
+import json
 import os
+from math import cos, pi, sin
 
 from jani_generator.convince_jani_helpers import convince_jani_parser
 from jani_generator.jani_entries import JaniModel
@@ -29,3 +31,23 @@ def test_convince_to_plain_jani():
     plain_dict = jani_model.as_dict()
     assert len(plain_dict) > 0
     assert isinstance(plain_dict["variables"][0]["type"], str)
+
+
+def test_convince_to_plain_jani_many_boundaries(tmp_path):
+    """Test that maps with thousands of boundaries are converted without recursion errors."""
+    test_file = os.path.join(os.path.dirname(__file__), '_test_data', 'convince_jani',
+                             'first-model-mc-version.jani')
+    with open(test_file, "r", encoding='utf-8') as file:
+        convince_jani_json = json.load(file)
+    n_boundaries = 2000
+    convince_jani_json["rob_env_model"]["boundaries"] = [
+        {"x": 5.0 + 4.0 * cos(2 * pi * i / n_boundaries),
+         "y": 5.0 + 4.0 * sin(2 * pi * i / n_boundaries)}
+        for i in range(n_boundaries)]
+    large_test_file = tmp_path / "many-boundaries.jani"
+    with open(large_test_file, "w", encoding='utf-8') as file:
+        json.dump(convince_jani_json, file)
+    jani_model = JaniModel()
+    convince_jani_parser(jani_model, str(large_test_file))
+    plain_json = json.dumps(jani_model.as_dict())
+    assert f"boundaries.{n_boundaries - 1}.x" in plain_json
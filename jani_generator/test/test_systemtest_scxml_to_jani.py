@@ -17,12 +17,16 @@
 
 import json
 import os
+import tempfile
 import unittest
 import xml.etree.ElementTree as ET
+from typing import List
 
 import pytest
 
-from jani_generator.jani_entries import JaniAutomaton
+from jani_generator.jani_entries import JaniAutomaton, JaniModel
+from jani_generator.jani_entries.jani_cone_of_influence import \
+    get_cone_of_influence_model
 from jani_generator.scxml_helpers.scxml_event import EventsHolder
 from jani_generator.scxml_helpers.scxml_to_jani import (
     convert_multiple_scxmls_to_jani, convert_scxml_root_to_jani_automaton)
@@ -34,6 +38,13 @@ from .test_utilities_smc_storm import run_smc_storm_with_output
 
 
 class TestConversion(unittest.TestCase):
+    @staticmethod
+    def _convert_scxml_strings(scxml_models: List[str], **kwargs) -> JaniModel:
+        """Convert SCXML models, provided as XML strings, to a Jani model."""
+        scxml_roots = [ScxmlRoot.from_xml_tree(ET.fromstring(scxml_model))
+                       for scxml_model in scxml_models]
+        return convert_multiple_scxmls_to_jani(scxml_roots, [], 0, **kwargs)
+
     def test_basic_example(self):
         """
         Very basic example of a SCXML file.
@@ -195,11 +206,407 @@ class TestConversion(unittest.TestCase):
         if os.path.exists(TEST_FILE):
             os.remove(TEST_FILE)
 
+    def test_example_with_sync_in_parallel(self):
+        """
+        Testing the parallel conversion gives the same model as the sequential one.
+        """
+        TEST_DATA_FOLDER = os.path.join(
+            os.path.dirname(__file__), '_test_data', 'battery_example')
+        scxml_models = []
+        for fname in ['battery_drainer.scxml', 'battery_manager.scxml']:
+            with open(os.path.join(TEST_DATA_FOLDER, fname), 'r', encoding='utf-8') as f:
+                scxml_models.append(f.read())
+        # Try both with the sender before and after the receiver
+        for models_order in [scxml_models, scxml_models[::-1]]:
+            sequential_model = convert_multiple_scxmls_to_jani(models_order, [], 0)
+            parallel_model = convert_multiple_scxmls_to_jani(models_order, [], 0, jobs=2)
+            self.assertEqual(parallel_model.as_dict(), sequential_model.as_dict())
+
+    def test_example_with_direct_sync(self):
+        """
+        Testing the sender synchronizes directly with the receiver, without the event automaton.
+        """
+        TEST_DATA_FOLDER = os.path.join(
+            os.path.dirname(__file__), '_test_data', 'battery_example')
+        scxml_models = []
+        for fname in ['battery_drainer.scxml', 'battery_manager.scxml']:
+            with open(os.path.join(TEST_DATA_FOLDER, fname), 'r', encoding='utf-8') as f:
+                scxml_models.append(f.read())
+        jani_dict = convert_multiple_scxmls_to_jani(
+            scxml_models, [], 0, event_sync="direct").as_dict()
+        names = [a["name"] for a in jani_dict["automata"]]
+        self.assertEqual(names, ["BatteryDrainer", "BatteryManager"])
+        self.assertIn({'result': 'level_on_send',
+                       'synchronise': ['level_on_send', 'level_on_receive']},
+                      jani_dict["system"]["syncs"])
+        # The receiver reads the data assigned by the sender in the same step
+        manager_edges = jani_dict["automata"][1]["edges"]
+        receive_edges = [edge for edge in manager_edges if edge["action"] == "level_on_receive"]
+        self.assertGreater(len(receive_edges), 0)
+        for edge in receive_edges:
+            for assignment in edge["destinations"][0]["assignments"]:
+                self.assertEqual(assignment["index"], 1)
+        # The global variables of the event are kept
+        self.assertEqual({v["name"] for v in jani_dict["variables"]},
+                         {"level.data", "level.valid"})
+
+    def test_direct_sync_fallback(self):
+        """
+        Testing the events whose data is used in the receivers' guards keep the event automaton.
+        """
+        sender_scxml = """
+        <scxml version="1.0" name="Sender" initial="idle">
+            <datamodel>
+                <data id="counter" expr="0" type="int32" />
+            </datamodel>
+            <state id="idle">
+                <transition target="idle">
+                    <assign location="counter" expr="counter + 1" />
+                    <send event="count">
+                        <param name="value" expr="counter" />
+                    </send>
+                </transition>
+            </state>
+        </scxml>"""
+        receiver_scxml = """
+        <scxml version="1.0" name="Receiver" initial="waiting">
+            <state id="waiting">
+                <transition event="count" cond="_event.value &gt; 5" target="done" />
+            </state>
+            <state id="done" />
+        </scxml>"""
+        jani_dict = self._convert_scxml_strings(
+            [sender_scxml, receiver_scxml], event_sync="direct").as_dict()
+        names = [a["name"] for a in jani_dict["automata"]]
+        self.assertEqual(names, ["Sender", "Receiver", "count"])
+        self.assertIn({'result': 'count_on_receive',
+                       'synchronise': [None, 'count_on_receive', 'count_on_receive']},
+                      jani_dict["system"]["syncs"])
+
+    def test_dead_events_pruning(self):
+        """
+        Testing the events without receivers are removed, together with their data.
+        """
+        sender_scxml = """
+        <scxml version="1.0" name="Sender" initial="idle">
+            <datamodel>
+                <data id="counter" expr="0" type="int32" />
+            </datamodel>
+            <state id="idle">
+                <transition target="idle">
+                    <assign location="counter" expr="counter + 1" />
+                    <send event="diagnostics">
+                        <param name="value" expr="counter" />
+                    </send>
+                    <send event="count">
+                        <param name="value" expr="counter" />
+                    </send>
+                </transition>
+            </state>
+        </scxml>"""
+        receiver_scxml = """
+        <scxml version="1.0" name="Receiver" initial="waiting">
+            <datamodel>
+                <data id="received" expr="0" type="int32" />
+            </datamodel>
+            <state id="waiting">
+                <transition event="count" target="waiting">
+                    <assign location="received" expr="_event.value" />
+                </transition>
+            </state>
+        </scxml>"""
+
+        scxml_models = [sender_scxml, receiver_scxml]
+        unpruned_dict = self._convert_scxml_strings(scxml_models).as_dict()
+        pruned_dict = self._convert_scxml_strings(scxml_models, prune_dead_events=True).as_dict()
+        self.assertIn("diagnostics", [a["name"] for a in unpruned_dict["automata"]])
+        self.assertEqual([a["name"] for a in pruned_dict["automata"]],
+                         ["Sender", "Receiver", "count"])
+        self.assertEqual({v["name"] for v in pruned_dict["variables"]},
+                         {"count.value", "count.valid"})
+        # The location before sending the removed event is bypassed
+        unpruned_sender, pruned_sender = unpruned_dict["automata"][0], pruned_dict["automata"][0]
+        self.assertEqual(len(pruned_sender["locations"]), len(unpruned_sender["locations"]) - 1)
+        self.assertEqual(len(pruned_sender["edges"]), len(unpruned_sender["edges"]) - 1)
+        self.assertNotIn("diagnostics_on_send", [edge["action"] for edge in pruned_sender["edges"]])
+        # The events observed in the properties are kept
+        observed_dict = self._convert_scxml_strings(
+            scxml_models, prune_dead_events=True,
+            observed_variables={"diagnostics.valid"}).as_dict()
+        self.assertEqual(observed_dict, unpruned_dict)
+
+    def test_cone_of_influence(self):
+        """
+        Testing the automata and variables not affecting the property are removed.
+        """
+        counter_scxml = """
+        <scxml version="1.0" name="Counter" initial="idle">
+            <datamodel>
+                <data id="counter" expr="0" type="int32" />
+                <data id="noise" expr="0" type="int32" />
+            </datamodel>
+            <state id="idle">
+                <transition target="idle">
+                    <assign location="counter" expr="counter + 1" />
+                    <assign location="noise" expr="noise + 2" />
+                    <send event="count">
+                        <param name="value" expr="counter" />
+                    </send>
+                </transition>
+            </state>
+        </scxml>"""
+        noise_scxml = """
+        <scxml version="1.0" name="Noise" initial="idle">
+            <datamodel>
+                <data id="noise" expr="0" type="int32" />
+            </datamodel>
+            <state id="idle">
+                <transition target="idle">
+                    <assign location="noise" expr="noise + 1" />
+                    <send event="noise">
+                        <param name="value" expr="noise" />
+                    </send>
+                </transition>
+            </state>
+        </scxml>"""
+        receiver_scxml = """
+        <scxml version="1.0" name="Receiver" initial="waiting">
+            <datamodel>
+                <data id="received" expr="0" type="int32" />
+            </datamodel>
+            <state id="waiting">
+                <transition event="count" target="waiting">
+                    <assign location="received" expr="_event.value" />
+                </transition>
+            </state>
+        </scxml>"""
+        jani_model = self._convert_scxml_strings(
+            [counter_scxml, noise_scxml, receiver_scxml])
+        full_dict = jani_model.as_dict()
+        reduced_dict = get_cone_of_influence_model(jani_model, {"count.value"}).as_dict()
+        # The input model is not modified
+        self.assertEqual(jani_model.as_dict(), full_dict)
+        # The Noise automata are removed, the Receiver is kept, since it synchronizes with Counter
+        self.assertEqual([a["name"] for a in full_dict["automata"]],
+                         ["Counter", "Noise", "Receiver", "count", "noise"])
+        self.assertEqual([a["name"] for a in reduced_dict["automata"]],
+                         ["Counter", "Receiver", "count"])
+        self.assertEqual([v["name"] for v in reduced_dict["variables"]], ["count.value"])
+        # The local variables not affecting the property are removed, with their assignments
+        reduced_counter = reduced_dict["automata"][0]
+        self.assertEqual([v["name"] for v in reduced_counter["variables"]], ["counter"])
+        reduced_targets = {assignment["ref"] for edge in reduced_counter["edges"]
+                           for destination in edge["destinations"]
+                           for assignment in destination.get("assignments", [])}
+        self.assertIn("counter", reduced_targets)
+        self.assertNotIn("noise", reduced_targets)
+        # Identifiers not assigned by any automaton keep the full model
+        self.assertIs(get_cone_of_influence_model(jani_model, {"unknown"}), jani_model)
+
+    def test_edge_chains_compaction(self):
+        """
+        Testing the intermediate locations of the executable bodies are merged, except for sends.
+        """
+        counter_scxml = """
+        <scxml version="1.0" name="Counter" initial="idle">
+            <datamodel>
+                <data id="counter" expr="0" type="int32" />
+                <data id="step" expr="0" type="int32" />
+            </datamodel>
+            <state id="idle">
+                <transition target="idle">
+                    <assign location="counter" expr="counter + 1" />
+                    <if cond="counter &gt; 10">
+                        <assign location="step" expr="0" />
+                    <else />
+                        <assign location="step" expr="1" />
+                    </if>
+                    <assign location="counter" expr="counter + step" />
+                    <send event="count">
+                        <param name="value" expr="counter" />
+                    </send>
+                </transition>
+            </state>
+        </scxml>"""
+        receiver_scxml = """
+        <scxml version="1.0" name="Receiver" initial="waiting">
+            <datamodel>
+                <data id="received" expr="0" type="int32" />
+            </datamodel>
+            <state id="waiting">
+                <transition event="count" target="waiting">
+                    <if cond="_event.value &gt; 5">
+                        <assign location="received" expr="received + 1" />
+                    <else />
+                        <assign location="received" expr="0" />
+                    </if>
+                </transition>
+            </state>
+        </scxml>"""
+
+        scxml_models = [counter_scxml, receiver_scxml]
+        full_dict = self._convert_scxml_strings(scxml_models).as_dict()
+        compact_dict = self._convert_scxml_strings(scxml_models, compact_edge_chains=True).as_dict()
+        full_counter, compact_counter = full_dict["automata"][0], compact_dict["automata"][0]
+        self.assertEqual(len(full_counter["locations"]), 4)
+        # Only the location before sending the event is kept
+        self.assertEqual(len(compact_counter["locations"]), 2)
+        self.assertEqual(len(compact_counter["edges"]), 3)
+        for edge in compact_counter["edges"]:
+            if edge["location"] != "idle":
+                self.assertEqual(edge["action"], "count_on_send")
+                continue
+            # The assignments following the if block read the values assigned before it
+            self.assertIn("guard", edge)
+            self.assertEqual([(assignment["ref"], assignment["index"]) for assignment in
+                              edge["destinations"][0]["assignments"]],
+                             [("counter", 0), ("step", 1), ("counter", 2)])
+        # The if block of the receiver is evaluated when receiving the event
+        compact_receiver = compact_dict["automata"][1]
+        self.assertEqual(len(compact_receiver["locations"]), 1)
+        self.assertEqual([edge["action"] for edge in compact_receiver["edges"]],
+                         ["count_on_receive", "count_on_receive"])
+        # No sync refers to the removed actions
+        compact_actions = {action["name"] for action in compact_dict["actions"]}
+        for sync in compact_dict["system"]["syncs"]:
+            self.assertIn(sync["result"], compact_actions)
+
+    def test_unhandled_events_compaction(self):
+        """
+        Testing the events ignored in multiple states are discarded by the event automaton.
+        """
+        sender_scxml = """
+        <scxml version="1.0" name="Sender" initial="idle">
+            <state id="idle">
+                <transition target="idle">
+                    <send event="tick" />
+                    <send event="reset" />
+                </transition>
+            </state>
+        </scxml>"""
+        receiver_scxml = """
+        <scxml version="1.0" name="Receiver" initial="first">
+            <state id="first">
+                <transition event="tick" target="second" />
+            </state>
+            <state id="second">
+                <transition event="tick" target="third" />
+            </state>
+            <state id="third">
+                <transition event="tick" target="first" />
+                <transition event="reset" target="first" />
+            </state>
+        </scxml>"""
+
+        scxml_models = [sender_scxml, receiver_scxml]
+
+        def get_automaton(jani_dict: dict, name: str) -> dict:
+            return next(automaton for automaton in jani_dict["automata"]
+                        if automaton["name"] == name)
+
+        def count_edges(jani_dict: dict) -> int:
+            return sum(len(automaton["edges"]) for automaton in jani_dict["automata"])
+
+        full_dict = self._convert_scxml_strings(scxml_models).as_dict()
+        compact_dict = self._convert_scxml_strings(
+            scxml_models, compact_unhandled_events=True).as_dict()
+        full_receiver = get_automaton(full_dict, "Receiver")
+        self.assertEqual(len([edge for edge in full_receiver["edges"]
+                              if edge["action"] == "reset_on_receive"]), 3)
+        # The two self-loops ignoring the reset event are replaced by a single discard edge
+        self.assertEqual(count_edges(compact_dict), count_edges(full_dict) - 1)
+        compact_receiver = get_automaton(compact_dict, "Receiver")
+        self.assertEqual([edge["location"] for edge in compact_receiver["edges"]
+                          if edge["action"] == "reset_on_receive"], ["third"])
+        discard_edges = [edge for edge in get_automaton(compact_dict, "reset")["edges"]
+                         if edge["action"] == "reset_on_discard"]
+        self.assertEqual(len(discard_edges), 1)
+        self.assertEqual(discard_edges[0]["location"], "received")
+        # The location variable has a value for each location of the receiver
+        location_variable = next(variable for variable in compact_dict["variables"]
+                                 if variable["name"] == "Receiver.location_id")
+        self.assertEqual(location_variable["type"]["upper-bound"],
+                         len(compact_receiver["locations"]) - 1)
+        for edge in compact_receiver["edges"]:
+            assigned_variables = [assignment["ref"] for destination in edge["destinations"]
+                                  for assignment in destination["assignments"]]
+            changes_location = edge["destinations"][0]["location"] != edge["location"]
+            self.assertEqual("Receiver.location_id" in assigned_variables, changes_location)
+        # The tick event is handled in all locations, so it has no discard edge
+        self.assertEqual(len(get_automaton(compact_dict, "tick")["edges"]), 2)
+
+    def test_share_events_payload(self):
+        """
+        Testing the payload of events that cannot be pending at the same time is shared.
+        """
+        client_scxml = """
+        <scxml version="1.0" name="Client" initial="send">
+            <datamodel>
+                <data id="counter" expr="0" type="int32" />
+            </datamodel>
+            <state id="send">
+                <transition target="wait">
+                    <send event="request">
+                        <param name="value" expr="counter" />
+                    </send>
+                </transition>
+            </state>
+            <state id="wait">
+                <transition event="response" target="send">
+                    <assign location="counter" expr="_event.value" />
+                </transition>
+            </state>
+        </scxml>"""
+        server_scxml = """
+        <scxml version="1.0" name="Server" initial="idle">
+            <datamodel>
+                <data id="received" expr="0" type="int32" />
+            </datamodel>
+            <state id="idle">
+                <transition event="request" target="idle">
+                    <assign location="received" expr="_event.value" />
+                    <send event="response">
+                        <param name="value" expr="received + 1" />
+                    </send>
+                </transition>
+                <transition event="tick" target="idle">
+                    <assign location="received" expr="_event.value" />
+                </transition>
+            </state>
+        </scxml>"""
+        ticker_scxml = """
+        <scxml version="1.0" name="Ticker" initial="tick">
+            <state id="tick">
+                <transition target="tick">
+                    <send event="tick">
+                        <param name="value" expr="1" />
+                    </send>
+                </transition>
+            </state>
+        </scxml>"""
+        jani_dict = self._convert_scxml_strings(
+            [client_scxml, server_scxml, ticker_scxml], share_events_payload=True).as_dict()
+        variable_names = {variable["name"] for variable in jani_dict["variables"]}
+        # The request is answered before the next one is sent, the ticks are independent
+        self.assertTrue(variable_names.isdisjoint(
+            {"request.value", "response.value", "request.valid", "response.valid"}))
+        self.assertTrue({"tick.value", "tick.valid", "events_payload.slot_0",
+                         "events_payload.slot_1"}.issubset(variable_names))
+        self.assertEqual(len([name for name in variable_names
+                              if name.startswith("events_payload.")]), 2)
+        # The edges sending and receiving the events refer to the shared variables
+        client = next(automaton for automaton in jani_dict["automata"]
+                      if automaton["name"] == "Client")
+        for edge in client["edges"]:
+            for assignment in edge["destinations"][0]["assignments"]:
+                self.assertNotIn("request.", assignment["ref"])
+                self.assertNotIn("response.", json.dumps(assignment["value"]))
+
     # Tests using main.xml ...
 
     def _test_with_main(self,
                         folder: str, property_name: str, success: bool,
-                        store_generated_scxmls: bool = False):
+                        store_generated_scxmls: bool = False, event_sync: str = "buffered"):
         """Testing the conversion of the main.xml file with the entrypoint."""
         test_data_dir = os.path.join(
             os.path.dirname(__file__), '_test_data', folder)
@@ -207,7 +614,7 @@ class TestConversion(unittest.TestCase):
         ouput_path = os.path.join(test_data_dir, 'main.jani')
         if os.path.exists(ouput_path):
             os.remove(ouput_path)
-        interpret_top_level_xml(xml_main_path, store_generated_scxmls)
+        interpret_top_level_xml(xml_main_path, store_generated_scxmls, event_sync=event_sync)
         self.assertTrue(os.path.exists(ouput_path))
         # ground_truth = os.path.join(
         #     test_data_dir,
@@ -262,10 +669,101 @@ class TestConversion(unittest.TestCase):
         being sent in different orders without deadlocks."""
         self._test_with_main('multiple_senders_same_event', 'seq_check', True)
 
+    def test_events_sync_handling_direct(self):
+        """Same as test_events_sync_handling, with the senders synchronized with the receivers."""
+        self._test_with_main('events_sync_examples', 'seq_check', True, event_sync="direct")
+
+    def test_multiple_senders_same_event_direct(self):
+        """Same as test_multiple_senders_same_event, with the direct event syncs."""
+        self._test_with_main('multiple_senders_same_event', 'seq_check', True,
+                             event_sync="direct")
+
     def test_ros_add_int_srv_example(self):
         """Test the services are properly handled in Jani."""
         self._test_with_main('ros_add_int_srv_example', 'happy_clients', True, True)
 
+    def test_with_main_build_cache(self):
+        """Test the build cache gives the same Jani model as the uncached conversion."""
+        test_data_dir = os.path.join(
+            os.path.dirname(__file__), '_test_data', 'ros_example_w_bt')
+        xml_main_path = os.path.join(test_data_dir, 'main.xml')
+        ouput_path = os.path.join(test_data_dir, 'main.jani')
+        interpret_top_level_xml(xml_main_path)
+        with open(ouput_path, "r", encoding='utf-8') as f:
+            uncached_output = f.read()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # The first conversion fills the cache, the second one reads from it
+            for _ in range(2):
+                os.remove(ouput_path)
+                interpret_top_level_xml(xml_main_path, cache_dir=cache_dir)
+                with open(ouput_path, "r", encoding='utf-8') as f:
+                    self.assertEqual(f.read(), uncached_output)
+
+    def test_with_main_build_cache_ros_interfaces(self):
+        """Test the cached conversions are not reused if the ROS interfaces change."""
+        test_data_dir = os.path.join(
+            os.path.dirname(__file__), '_test_data', 'ros_add_int_srv_example')
+        xml_main_path = os.path.join(test_data_dir, 'main.xml')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_dir = os.path.join(tmp_dir, "cache")
+            interpret_top_level_xml(xml_main_path, cache_dir=cache_dir)
+            # The same service with an additional request field, not set by the clients
+            interfaces_dir = os.path.join(tmp_dir, "interfaces")
+            srv_dir = os.path.join(interfaces_dir, "example_interfaces", "srv")
+            os.makedirs(srv_dir)
+            with open(os.path.join(srv_dir, "AddTwoInts.srv"), "w", encoding='utf-8') as f:
+                f.write("int64 a\nint64 b\nint64 c\n---\nint64 sum\n")
+            with self.assertRaises(AssertionError):
+                interpret_top_level_xml(xml_main_path, cache_dir=cache_dir,
+                                        ros_interfaces_paths=[interfaces_dir])
+        os.remove(os.path.join(test_data_dir, 'main.jani'))
+
+    def test_with_main_cone_of_influence(self):
+        """Test a reduced model is generated for each property."""
+        test_data_dir = os.path.join(
+            os.path.dirname(__file__), '_test_data', 'ros_example')
+        xml_main_path = os.path.join(test_data_dir, 'main.xml')
+        property_names = ['battery_depleted', 'battery_over_depleted']
+        ouput_paths = [os.path.join(test_data_dir, f'main_{property_name}.jani')
+                       for property_name in property_names]
+        for ouput_path in ouput_paths:
+            if os.path.exists(ouput_path):
+                os.remove(ouput_path)
+        interpret_top_level_xml(xml_main_path, cone_of_influence=True)
+        for property_name, ouput_path in zip(property_names, ouput_paths):
+            with open(ouput_path, "r", encoding='utf-8') as f:
+                jani_dict = json.load(f)
+            self.assertEqual([p["name"] for p in jani_dict["properties"]], [property_name])
+            os.remove(ouput_path)
+
+    def test_with_main_unhandled_events_compaction(self):
+        """Test the unhandled responses are removed from the clients that cannot receive them."""
+        test_data_dir = os.path.join(
+            os.path.dirname(__file__), '_test_data', 'ros_add_int_srv_example')
+        xml_main_path = os.path.join(test_data_dir, 'main.xml')
+        ouput_path = os.path.join(test_data_dir, 'main.jani')
+        jani_dicts = []
+        for compact_unhandled_events in (False, True):
+            interpret_top_level_xml(xml_main_path,
+                                    compact_unhandled_events=compact_unhandled_events)
+            with open(ouput_path, "r", encoding='utf-8') as f:
+                jani_dicts.append(json.load(f))
+        os.remove(ouput_path)
+        full_dict, compact_dict = jani_dicts
+        # Once done, the clients sent their only request and received its response
+        for client_name in ('client_1', 'client_2'):
+            response_action = f"srv_adder_response_client_{client_name}_on_receive"
+            for jani_dict, expected_locations in ((full_dict, ['done']), (compact_dict, [])):
+                client_automaton = next(automaton for automaton in jani_dict["automata"]
+                                        if automaton["name"] == client_name)
+                self.assertEqual([edge["location"] for edge in client_automaton["edges"]
+                                  if edge["action"] == response_action and
+                                  edge["destinations"][0]["location"] == edge["location"]],
+                                 expected_locations)
+        self.assertEqual(sum(len(automaton["edges"]) for automaton in compact_dict["automata"]),
+                         sum(len(automaton["edges"]) for automaton in full_dict["automata"]) - 2)
+        self.assertEqual(compact_dict["variables"], full_dict["variables"])
+
 
 if __name__ == '__main__':
     pytest.main(['-s', '-v', __file__])
@@ -0,0 +1,71 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the startup of the command line tools does not load the heavy dependencies"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+import pytest
+
+# Modules that are slow to import and must be loaded only if needed
+HEAVY_MODULES = ("js2py", "esprima", "networkx", "btlib",
+                 "jani_generator.scxml_helpers.top_level_interpreter")
+
+# Runs the provided statement in a new interpreter, printing the loaded heavy modules
+STARTUP_SCRIPT = """
+import json, sys
+import jani_generator.main
+try:
+    {statement}
+except SystemExit:
+    pass
+print(json.dumps({{"heavy_modules": [m for m in {heavy_modules} if m in sys.modules]}}))
+"""
+
+
+def _run_startup(statement: str = "pass") -> dict:
+    """Execute a statement after importing the entry points in a new interpreter."""
+    script = STARTUP_SCRIPT.format(statement=statement, heavy_modules=repr(HEAVY_MODULES))
+    process = subprocess.run([sys.executable, "-c", script],
+                             capture_output=True, text=True, check=True)
+    return json.loads(process.stdout.splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_loads_no_heavy_modules(self):
+        """Importing the entry points loads no heavy dependency."""
+        startup_info = _run_startup()
+        self.assertEqual(startup_info["heavy_modules"], [])
+
+    def test_help_loads_no_heavy_modules(self):
+        """Printing the help of the command line tools loads no heavy dependency."""
+        for entry_point in ("main_scxml_to_jani", "main_convince_to_plain_jani"):
+            startup_info = _run_startup(f"jani_generator.main.{entry_point}(['--help'])")
+            self.assertEqual(startup_info["heavy_modules"], [], f"Loaded by {entry_point}.")
+
+    def test_ecmascript_modules_loaded_at_first_use(self):
+        """The ecmascript parser is loaded when the first expression is converted."""
+        startup_info = _run_startup(
+            "from jani_generator.scxml_helpers.scxml_expression import "
+            "parse_ecmascript_to_jani_expression; parse_ecmascript_to_jani_expression('1 + 2')")
+        self.assertEqual(startup_info["heavy_modules"], ["esprima"])
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
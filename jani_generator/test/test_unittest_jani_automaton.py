@@ -0,0 +1,65 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the edge indexes of Jani automata."""
+
+import unittest
+
+import pytest
+
+from jani_generator.jani_entries import JaniAutomaton, JaniEdge
+
+
+def _make_edge(source: str, target: str, action: str) -> JaniEdge:
+    return JaniEdge({"location": source, "action": action,
+                     "destinations": [{"location": target, "assignments": []}]})
+
+
+class TestJaniAutomatonIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.automaton = JaniAutomaton()
+        self.automaton.set_name("test_automaton")
+        for location in ["idle", "busy"]:
+            self.automaton.add_location(location)
+        self.automaton.add_edge(_make_edge("idle", "busy", "start"))
+        self.automaton.add_edge(_make_edge("busy", "idle", "stop"))
+        self.automaton.add_edge(_make_edge("busy", "busy", "tick"))
+        self.automaton.add_edge(_make_edge("idle", "idle", "tick"))
+
+    def test_lookups(self):
+        """Edges can be retrieved by action and by source location, in insertion order."""
+        self.assertEqual(self.automaton.get_actions(), {"start", "stop", "tick"})
+        self.assertTrue(self.automaton.has_action("tick"))
+        tick_edges = self.automaton.get_edges_with_action("tick")
+        self.assertEqual([edge.location for edge in tick_edges], ["busy", "idle"])
+        busy_edges = self.automaton.get_edges_from_location("busy")
+        self.assertEqual([edge.get_action() for edge in busy_edges], ["stop", "tick"])
+
+    def test_removals(self):
+        """Removing edges keeps the indexes and the order of the remaining edges consistent."""
+        self.automaton.remove_edges_with_action_names(["tick", "unknown_action"])
+        self.assertEqual(self.automaton.get_actions(), {"start", "stop"})
+        self.assertEqual(self.automaton.get_edges_from_location("idle"),
+                         self.automaton.get_edges_with_action("start"))
+        self.automaton.add_edge(_make_edge("idle", "idle", "tick"))
+        self.automaton.remove_empty_self_loop_edges()
+        self.assertFalse(self.automaton.has_action("tick"))
+        self.assertEqual([edge.get_action() for edge in self.automaton.get_edges()],
+                         ["start", "stop"])
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
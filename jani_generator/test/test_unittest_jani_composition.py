@@ -0,0 +1,75 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the composition of Jani automata."""
+
+import unittest
+
+import pytest
+
+from jani_generator.jani_entries import JaniComposition
+
+
+class TestJaniComposition(unittest.TestCase):
+
+    def test_sparse_syncs(self):
+        """Elements added after a sync do not participate in it."""
+        composition = JaniComposition()
+        composition.add_element("sender")
+        composition.add_sync("event_on_send", {"sender": "event_on_send"})
+        composition.add_element("receiver")
+        composition.add_sync("event_on_receive", {"receiver": "event_on_receive"})
+        self.assertTrue(composition.has_sync_for_element("sender", "event_on_send"))
+        self.assertFalse(composition.has_sync_for_element("receiver", "event_on_send"))
+        self.assertEqual(composition.get_syncs_for_element("receiver"), ["event_on_receive"])
+        self.assertEqual(composition.as_dict(), {
+            "elements": [{"automaton": "sender"}, {"automaton": "receiver"}],
+            "syncs": [
+                {"result": "event_on_receive", "synchronise": [None, "event_on_receive"]},
+                {"result": "event_on_send", "synchronise": ["event_on_send", None]}]})
+
+    def test_from_dict(self):
+        """A composition loaded from a dictionary is exported back to the same dictionary."""
+        composition_dict = {
+            "elements": [{"automaton": "robot"}, {"automaton": "env"}],
+            "syncs": [
+                {"result": "drive", "synchronise": ["drive", "drive"]},
+                {"result": "step", "synchronise": [None, "step"]}]}
+        composition = JaniComposition(composition_dict)
+        self.assertEqual(composition.get_syncs_for_element("robot"), ["drive"])
+        self.assertTrue(composition.has_sync_for_element("env", "step"))
+        self.assertEqual(composition.as_dict(), composition_dict)
+
+    def test_remove_element_syncs(self):
+        """Removing the syncs of an element updates the actions of all participants."""
+        composition = JaniComposition()
+        composition.add_element("robot")
+        composition.add_element("env")
+        composition.add_sync("drive", {"robot": "drive", "env": "drive"})
+        composition.add_sync("step", {"env": "step"})
+        composition.add_sync("wait", {"robot": "wait", "env": "wait"})
+        composition.remove_element_syncs("robot", ["drive", "unknown_action"])
+        self.assertEqual(composition.get_syncs_for_element("robot"), ["wait"])
+        self.assertEqual(composition.get_syncs_for_element("env"), ["step", "wait"])
+        self.assertFalse(composition.has_sync_for_element("env", "drive"))
+        self.assertEqual(composition.get_syncs(), [
+            ("step", {"env": "step"}), ("wait", {"robot": "wait", "env": "wait"})])
+        composition.remove_element_syncs("env", ["wait"])
+        self.assertEqual(composition.get_syncs_for_element("robot"), [])
+        self.assertEqual(composition.get_syncs(), [("step", {"env": "step"})])
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
@@ -0,0 +1,128 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the compaction of the edge chains in Jani automata"""
+
+import unittest
+
+import pytest
+
+from jani_generator.jani_entries import (JaniAssignment, JaniAutomaton,
+                                         JaniComposition, JaniEdge, JaniModel)
+from jani_generator.jani_entries.jani_edge_compaction import (
+    are_guards_exhaustive, merge_consecutive_edges)
+from jani_generator.jani_entries.jani_expression_generator import (
+    and_operator, greater_operator, not_operator, or_operator, plus_operator)
+
+
+class TestJaniEdgeCompaction(unittest.TestCase):
+
+    def test_exhaustive_guards(self):
+        """
+        Test that the guards generated by if-else blocks are recognized as exhaustive.
+        """
+        first_cond = greater_operator("x", 10)
+        second_cond = greater_operator("x", 5)
+        if_guards = [first_cond,
+                     and_operator(second_cond, not_operator(first_cond)),
+                     and_operator(not_operator(first_cond), not_operator(second_cond))]
+        self.assertTrue(are_guards_exhaustive(if_guards))
+        self.assertTrue(are_guards_exhaustive([first_cond, None]))
+        self.assertTrue(are_guards_exhaustive([or_operator(first_cond, not_operator(first_cond))]))
+        self.assertFalse(are_guards_exhaustive(if_guards[:2]))
+        # Related atoms are not recognized: the check is conservative
+        self.assertFalse(are_guards_exhaustive([first_cond, greater_operator(11, "x")]))
+
+    def test_merge_edges(self):
+        """
+        Test that the second edge is executed after the first one, using the assignment indices.
+        """
+        first_edge = JaniEdge({
+            "location": "a",
+            "action": "first",
+            "guard": greater_operator("y", 0),
+            "destinations": [{
+                "location": "b",
+                "assignments": [JaniAssignment({"ref": "x", "value": plus_operator("x", 1)})]
+            }]
+        })
+        second_edge = JaniEdge({
+            "location": "b",
+            "action": "second",
+            "guard": greater_operator("x", 10),
+            "destinations": [{
+                "location": "c",
+                "assignments": [JaniAssignment({"ref": "y", "value": "x"})]
+            }]
+        })
+        merged_edge = merge_consecutive_edges(first_edge, second_edge, 1)
+        self.assertEqual(merged_edge.as_dict({}), {
+            "location": "a",
+            "action": "first",
+            "guard": {"exp": {
+                "op": "∧",
+                "left": {"op": ">", "left": "y", "right": 0},
+                "right": {"op": ">", "left": {"op": "+", "left": "x", "right": 1}, "right": 10}}},
+            "destinations": [{
+                "location": "c",
+                "assignments": [
+                    {"ref": "x", "value": {"op": "+", "left": "x", "right": 1}, "index": 0},
+                    {"ref": "y", "value": "x", "index": 1}]
+            }]
+        })
+
+    def test_compact_model(self):
+        """
+        Test that the guards are not merged in edges synchronizing with automata assigning them.
+        """
+        jani_model = JaniModel()
+        jani_model.add_variable("data", int)
+        sender = JaniAutomaton(automaton_dict={
+            "name": "sender", "locations": [{"name": "idle"}], "initial-locations": ["idle"],
+            "variables": [],
+            "edges": [{"location": "idle", "action": "send", "destinations": [{
+                "location": "idle", "assignments": [{"ref": "data", "value": 1}]}]}]})
+        receiver = JaniAutomaton(automaton_dict={
+            "name": "receiver", "locations": [{"name": "idle"}, {"name": "received"}],
+            "initial-locations": ["idle"], "variables": [],
+            "edges": [
+                {"location": "idle", "action": "receive",
+                 "destinations": [{"location": "received"}]},
+                {"location": "received", "action": "check", "guard": {"exp": {
+                    "op": ">", "left": "data", "right": 0}},
+                 "destinations": [{"location": "idle"}]},
+                {"location": "received", "action": "check", "guard": {"exp": {
+                    "op": "¬", "exp": {"op": ">", "left": "data", "right": 0}}},
+                 "destinations": [{"location": "idle"}]}]})
+        jani_model.add_jani_automaton(sender)
+        jani_model.add_jani_automaton(receiver)
+        composition = JaniComposition()
+        composition.add_element("sender")
+        composition.add_element("receiver")
+        composition.add_sync("data_sync", {"sender": "send", "receiver": "receive"})
+        jani_model.add_system_sync(composition)
+        self.assertEqual(jani_model.compact_edge_chains(), (3, 3))
+        # Without the sync, the guards can be evaluated when receiving
+        composition = JaniComposition()
+        composition.add_element("sender")
+        composition.add_element("receiver")
+        jani_model.add_system_sync(composition)
+        self.assertEqual(jani_model.compact_edge_chains(), (3, 2))
+        self.assertEqual(receiver.get_actions(), {"receive"})
+        self.assertFalse(composition.has_sync_for_element("receiver", "check"))
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
@@ -0,0 +1,79 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the JaniExpression class"""
+
+import pickle
+import unittest
+
+import pytest
+
+from jani_generator.jani_entries import JaniExpression, JaniValue
+from jani_generator.jani_entries.jani_expression import \
+    substitute_expression_identifiers
+from jani_generator.jani_entries.jani_expression_generator import (
+    and_operator, not_operator, plus_operator)
+
+
+class TestJaniExpression(unittest.TestCase):
+
+    def test_hash_consing(self):
+        """
+        Test that structurally identical expressions are the same object.
+        """
+        expr = plus_operator("x", 1)
+        self.assertIs(expr, JaniExpression({"op": "+", "left": "x", "right": 1}))
+        self.assertIs(expr, JaniExpression(expr))
+        self.assertIs(expr.operands["right"], JaniExpression(JaniValue(1)))
+        self.assertIs(and_operator(expr, not_operator(expr)).operands["left"], expr)
+        self.assertEqual(hash(expr), hash(plus_operator("x", 1)))
+        # Same value, different types
+        self.assertIsNot(JaniExpression(1), JaniExpression(1.0))
+        self.assertIsNot(JaniExpression(1), JaniExpression(True))
+        self.assertIsNot(expr, plus_operator("x", 2))
+
+    def test_immutability(self):
+        """
+        Test that expressions cannot be modified.
+        """
+        expr = plus_operator("x", 1)
+        with self.assertRaises(AttributeError):
+            expr.op = "-"
+        with self.assertRaises(TypeError):
+            expr.operands["left"] = JaniExpression("y")
+        self.assertEqual(expr.as_dict(), {"op": "+", "left": "x", "right": 1})
+
+    def test_pickle(self):
+        """
+        Test that unpickled expressions are taken from the pool.
+        """
+        expr = and_operator(plus_operator("x", 1.5), JaniExpression({"constant": "π"}))
+        self.assertIs(pickle.loads(pickle.dumps(expr)), expr)
+
+    def test_substitute_identifiers(self):
+        """
+        Test that the identifiers are replaced, keeping the unchanged sub-expressions.
+        """
+        unchanged = plus_operator("y", 1)
+        expr = and_operator(plus_operator("x", 1), unchanged)
+        substituted = substitute_expression_identifiers(expr, {"x": JaniExpression("z")})
+        self.assertIs(substituted, and_operator(plus_operator("z", 1), unchanged))
+        self.assertIs(substituted.operands["right"], unchanged)
+        self.assertIs(substitute_expression_identifiers(unchanged, {"x": JaniExpression("z")}),
+                      unchanged)
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
@@ -0,0 +1,99 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the common subexpression elimination on Jani expressions"""
+
+import os
+import unittest
+
+import pytest
+
+from jani_generator.convince_jani_helpers import convince_jani_parser
+from jani_generator.jani_entries import JaniAssignment, JaniModel
+from jani_generator.jani_entries.jani_expression_cse import (
+    count_expression_nodes, eliminate_common_subexpressions_in_assignments,
+    find_common_subexpressions)
+from jani_generator.jani_entries.jani_expression_generator import (
+    abs_operator, and_operator, lower_operator, minus_operator,
+    multiply_operator, plus_operator)
+
+
+class TestJaniExpressionCse(unittest.TestCase):
+
+    def test_count_nodes(self):
+        """
+        Test that shared sub-expressions are counted at each occurrence.
+        """
+        diff_exp = minus_operator("x", "y")
+        self.assertEqual(count_expression_nodes(diff_exp), 3)
+        self.assertEqual(count_expression_nodes(multiply_operator(diff_exp, diff_exp)), 7)
+
+    def test_find_common_subexpressions(self):
+        """
+        Test that repeated operations are found and sorted by dependency.
+        """
+        diff_exp = minus_operator("x", "y")
+        abs_exp = abs_operator(diff_exp)
+        product_exp = multiply_operator(abs_exp, abs_exp)
+        common_exps = find_common_subexpressions([plus_operator(product_exp, diff_exp)])
+        self.assertEqual(common_exps, {diff_exp: 0, abs_exp: 1})
+        self.assertEqual(find_common_subexpressions([product_exp, plus_operator("x", "y")]),
+                         {abs_exp: 0})
+
+    def test_assignments(self):
+        """
+        Test that repeated operations are moved to transient variables with lower index.
+        """
+        diff_exp = minus_operator("x", "y")
+        assignments = [
+            JaniAssignment({"ref": "a", "value": multiply_operator(diff_exp, diff_exp)}),
+            JaniAssignment({"ref": "b", "value": and_operator(lower_operator(diff_exp, 0), "c"),
+                            "index": 1})]
+        new_assignments, new_vars = eliminate_common_subexpressions_in_assignments(
+            assignments, {}, {"x": int, "y": int, "c": bool})
+        self.assertEqual(new_vars, {"cse.int.0": int})
+        self.assertEqual([assignment.as_dict({}) for assignment in new_assignments], [
+            {"ref": "cse.int.0", "value": {"op": "-", "left": "x", "right": "y"}, "index": 0},
+            {"ref": "a", "value": {"op": "*", "left": "cse.int.0", "right": "cse.int.0"},
+             "index": 1},
+            {"ref": "b", "value": {"op": "∧", "left": {"op": "<", "left": {
+                "op": "-", "left": "x", "right": "y"}, "right": 0}, "right": "c"},
+             "index": 2}])
+        # Nothing to eliminate: the assignments are left untouched
+        same_assignments, new_vars = eliminate_common_subexpressions_in_assignments(
+            assignments[1:], {}, {"x": int, "y": int, "c": bool})
+        self.assertIs(same_assignments[0], assignments[1])
+        self.assertEqual(new_vars, {})
+
+    def test_convince_model(self):
+        """
+        Test the elimination on the expanded CONVINCE geometry expressions.
+        """
+        test_file = os.path.join(os.path.dirname(__file__), '_test_data', 'convince_jani',
+                                 'first-model-mc-version.jani')
+        jani_model = JaniModel()
+        convince_jani_parser(jani_model, test_file)
+        nodes_before, nodes_after = jani_model.eliminate_common_subexpressions()
+        self.assertLess(nodes_after, nodes_before / 2)
+        plain_dict = jani_model.as_dict()
+        cse_vars = [variable for automaton in plain_dict["automata"]
+                    for variable in automaton.get("variables", [])
+                    if variable["name"].startswith("cse.")]
+        self.assertGreater(len(cse_vars), 0)
+        self.assertTrue(all(variable["transient"] for variable in cse_vars))
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
@@ -0,0 +1,85 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the simplification of Jani expressions"""
+
+import unittest
+from math import pi
+
+import pytest
+
+from jani_generator.jani_entries import JaniConstant, JaniExpression
+from jani_generator.jani_entries.jani_expression_generator import (
+    and_operator, divide_operator, if_operator, lower_operator, max_operator,
+    minus_operator, multiply_operator, not_operator, or_operator,
+    plus_operator)
+from jani_generator.jani_entries.jani_expression_simplifier import \
+    simplify_expression
+
+
+class TestJaniExpressionSimplifier(unittest.TestCase):
+
+    def test_constant_folding(self):
+        """
+        Test the evaluation of constant operations, including the model's constants.
+        """
+        constants = {
+            "a.x": JaniConstant("a.x", float, JaniExpression(1.5)),
+            "b.x": JaniConstant("b.x", float, JaniExpression(4)),
+            "n": JaniConstant("n", int, JaniExpression(3))}
+        self.assertIs(simplify_expression(minus_operator("b.x", "a.x"), constants),
+                      JaniExpression(2.5))
+        self.assertIs(simplify_expression(plus_operator("n", 2), constants), JaniExpression(5))
+        self.assertIs(simplify_expression(divide_operator("n", 2), constants), JaniExpression(1.5))
+        to_deg_exp = multiply_operator("x", divide_operator(180, {"constant": "π"}))
+        self.assertIs(simplify_expression(to_deg_exp, {}), multiply_operator("x", 180 / pi))
+        self.assertIs(simplify_expression(lower_operator("n", "b.x"), constants),
+                      JaniExpression(True))
+        # Non foldable operations
+        self.assertIs(simplify_expression(divide_operator("n", 0), constants),
+                      divide_operator(3, 0))
+        self.assertIs(simplify_expression(plus_operator("x", "n"), constants),
+                      plus_operator("x", 3))
+
+    def test_boolean_identities(self):
+        """
+        Test the removal of neutral and absorbing boolean values, and of double negations.
+        """
+        self.assertIs(simplify_expression(and_operator(True, not_operator("a")), {}),
+                      not_operator("a"))
+        self.assertIs(simplify_expression(and_operator("a", False), {}), JaniExpression(False))
+        self.assertIs(simplify_expression(or_operator("a", False), {}), JaniExpression("a"))
+        self.assertIs(simplify_expression(or_operator(True, "a"), {}), JaniExpression(True))
+        self.assertIs(simplify_expression(not_operator(not_operator("a")), {}),
+                      JaniExpression("a"))
+        self.assertIs(simplify_expression(if_operator(True, "x", "y"), {}), JaniExpression("x"))
+        self.assertIs(simplify_expression(if_operator("c", True, False), {}), JaniExpression("c"))
+
+    def test_associative_chains(self):
+        """
+        Test the flattening of associative chains.
+        """
+        chain = and_operator(and_operator(True, "a"), and_operator("b", and_operator("a", True)))
+        self.assertIs(simplify_expression(chain, {}), and_operator("a", "b"))
+        max_chain = max_operator(max_operator("x", 1), max_operator(max_operator(2.0, "y"), "x"))
+        self.assertIs(simplify_expression(max_chain, {}),
+                      max_operator(max_operator("x", "y"), 2.0))
+        # The arithmetic operators are not reordered
+        sum_chain = plus_operator(plus_operator("x", 1), 2)
+        self.assertIs(simplify_expression(sum_chain, {}), sum_chain)
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
@@ -0,0 +1,95 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the serialization of Jani models to file"""
+
+import gzip
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from jani_generator.jani_serializer import write_jani_file
+
+JANI_DICT = {
+    "jani-version": 1,
+    "name": "test_ü",
+    "variables": [{"name": "x", "type": "real", "initial-value": 1e-05}],
+    "automata": [{"name": "a", "edges": [], "locations": [{"name": "l"}]}],
+}
+
+
+class TestJaniSerializer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _read_json(self, file_name: str, compressed: bool = False):
+        file_path = os.path.join(self.tmp_dir.name, file_name)
+        open_function = gzip.open if compressed else open
+        with open_function(file_path, "rb") as f:
+            content = f.read().decode("utf-8")
+        return content, json.loads(content)
+
+    def test_json_backend(self):
+        """
+        Test the indented and compact outputs with the json backend.
+        """
+        write_jani_file(JANI_DICT, os.path.join(self.tmp_dir.name, "indented.jani"), indent=2,
+                        backend="json")
+        content, loaded_dict = self._read_json("indented.jani")
+        self.assertEqual(content, json.dumps(JANI_DICT, indent=2, ensure_ascii=False))
+        self.assertEqual(loaded_dict, JANI_DICT)
+        write_jani_file(JANI_DICT, os.path.join(self.tmp_dir.name, "compact.jani"),
+                        backend="json")
+        content, loaded_dict = self._read_json("compact.jani")
+        self.assertNotIn(" ", content.replace("test_ü", ""))
+        self.assertEqual(loaded_dict, JANI_DICT)
+
+    @unittest.skipIf(importlib.util.find_spec("orjson") is None, "orjson not installed")
+    def test_orjson_backend(self):
+        """
+        Test the orjson backend generates the same JSON content.
+        """
+        for indent in (None, 2):
+            write_jani_file(JANI_DICT, os.path.join(self.tmp_dir.name, "model.jani"),
+                            indent=indent, backend="orjson")
+            _, loaded_dict = self._read_json("model.jani")
+            self.assertEqual(loaded_dict, JANI_DICT)
+        with self.assertRaises(AssertionError):
+            write_jani_file(JANI_DICT, os.path.join(self.tmp_dir.name, "model.jani"),
+                            indent=4, backend="orjson")
+
+    def test_gzip_compression(self):
+        """
+        Test the gzip compression, explicit and deduced from the file extension.
+        """
+        write_jani_file(JANI_DICT, os.path.join(self.tmp_dir.name, "model.jani.gz"))
+        _, loaded_dict = self._read_json("model.jani.gz", compressed=True)
+        self.assertEqual(loaded_dict, JANI_DICT)
+        write_jani_file(JANI_DICT, os.path.join(self.tmp_dir.name, "model.jani"),
+                        compression="gzip")
+        _, loaded_dict = self._read_json("model.jani", compressed=True)
+        self.assertEqual(loaded_dict, JANI_DICT)
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
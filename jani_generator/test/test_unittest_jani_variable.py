@@ -0,0 +1,82 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the bounded types of Jani variables."""
+
+import unittest
+
+import pytest
+
+from as2fm_common.common import ros_type_name_to_bounds
+from jani_generator.jani_entries import JaniAutomaton, JaniVariable
+from jani_generator.scxml_helpers.scxml_event import EventsHolder
+from jani_generator.scxml_helpers.scxml_to_jani import \
+    convert_scxml_root_to_jani_automaton
+from scxml_converter.scxml_entries import (ScxmlData, ScxmlDataModel,
+                                           ScxmlRoot, ScxmlState,
+                                           ScxmlTransition)
+
+
+class TestJaniVariableBounds(unittest.TestCase):
+
+    def test_bounded_type(self):
+        """Bounded variables generate a Jani bounded type, with a default value within bounds."""
+        bounded_var = JaniVariable("counter", int, v_bounds=(2, 10))
+        self.assertEqual(bounded_var.as_dict(), {
+            "name": "counter",
+            "type": {"kind": "bounded", "base": "int", "lower-bound": 2, "upper-bound": 10},
+            "transient": False,
+            "initial-value": 2})
+        lower_bounded_var = JaniVariable("counter", int, v_bounds=(0, None))
+        self.assertEqual(lower_bounded_var.as_dict()["type"],
+                         {"kind": "bounded", "base": "int", "lower-bound": 0})
+        self.assertIsNone(JaniVariable("counter", int, v_bounds=(None, None)).get_bounds())
+        with self.assertRaises(AssertionError):
+            JaniVariable("flag", bool, v_bounds=(0, 1))
+
+    def test_bounded_type_from_dict(self):
+        """Bounded types are loaded back from a Jani automaton definition."""
+        automaton = JaniAutomaton()
+        automaton.set_name("test_automaton")
+        automaton.add_location("idle", is_initial=True)
+        automaton.add_variable(JaniVariable("counter", int, v_bounds=(-5, 5)))
+        loaded_automaton = JaniAutomaton(automaton_dict=automaton.as_dict({}))
+        loaded_var = loaded_automaton.get_variables()["counter"]
+        self.assertEqual(loaded_var.get_type(), int)
+        self.assertEqual(loaded_var.get_bounds(), (-5, 5))
+
+    def test_scxml_data_bounds(self):
+        """The bounds of the SCXML data are used for the generated Jani variables."""
+        scxml_root = ScxmlRoot("BoundedCounter")
+        scxml_root.set_data_model(ScxmlDataModel([
+            ScxmlData("bounded", "3", "int32", 0, 10), ScxmlData("unbounded", "3", "int32")]))
+        scxml_root.add_state(ScxmlState("idle", body=[ScxmlTransition("idle", ["tick"])]),
+                             initial=True)
+        automaton = JaniAutomaton()
+        convert_scxml_root_to_jani_automaton(scxml_root, automaton, EventsHolder())
+        self.assertEqual(automaton.get_variables()["bounded"].get_bounds(), (0, 10))
+        self.assertIsNone(automaton.get_variables()["unbounded"].get_bounds())
+
+    def test_ros_type_bounds(self):
+        """The bounds of the ROS integer types depend on their bit width."""
+        self.assertEqual(ros_type_name_to_bounds("int8"), (-128, 127))
+        self.assertEqual(ros_type_name_to_bounds("uint16"), (0, 65535))
+        self.assertEqual(ros_type_name_to_bounds("int32"), (-2**31, 2**31 - 1))
+        self.assertIsNone(ros_type_name_to_bounds("double"))
+        self.assertIsNone(ros_type_name_to_bounds("boolean"))
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
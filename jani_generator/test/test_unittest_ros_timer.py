@@ -15,11 +15,68 @@
 
 """Test the ROS timer conversion"""
 
+import os
+import tempfile
 import unittest
 
 import pytest
 
-from jani_generator.ros_helpers.ros_timer import RosTimer
+from jani_generator.ros_helpers.ros_timer import (RosTimer,
+                                                  make_global_timer_automaton)
+from jani_generator.scxml_helpers.top_level_interpreter import parse_main_xml
+
+
+def _evaluate_expression(expression, variables: dict):
+    """Evaluate the expressions used in the global timer automaton."""
+    if isinstance(expression, str):
+        return variables[expression]
+    if not isinstance(expression, dict):
+        return expression
+    if expression["op"] == "ite":
+        if _evaluate_expression(expression["if"], variables):
+            return _evaluate_expression(expression["then"], variables)
+        return _evaluate_expression(expression["else"], variables)
+    if expression["op"] == "¬":
+        return not _evaluate_expression(expression["exp"], variables)
+    left = _evaluate_expression(expression["left"], variables)
+    right = _evaluate_expression(expression["right"], variables)
+    return {"+": lambda: left + right, "-": lambda: left - right, "*": lambda: left * right,
+            "%": lambda: left % right, "min": lambda: min(left, right),
+            "=": lambda: left == right, "<": lambda: left < right,
+            "∧": lambda: left and right}[expression["op"]]()
+
+
+def _simulate_global_timer(timers, max_time_ns: int, encoding: str):
+    """Get the timers triggered at each step of the global timer, until it stops."""
+    automaton_dict = make_global_timer_automaton(timers, max_time_ns, encoding).as_dict({})
+    variables = {variable["name"]: variable["initial-value"]
+                 for variable in automaton_dict["variables"]}
+    step_edge = [edge for edge in automaton_dict["edges"]
+                 if not edge["action"].endswith("_on_receive")][0]
+    triggered_timers = []
+    while True:
+        # The timers are received by the ROS automata
+        for timer in timers:
+            variables[f"{timer.name}_needed"] = False
+        if not _evaluate_expression(step_edge["guard"]["exp"], variables):
+            return triggered_timers
+        assignments = step_edge["destinations"][0]["assignments"]
+        for index in sorted({assignment.get("index", 0) for assignment in assignments}):
+            new_values = {assignment["ref"]: _evaluate_expression(assignment["value"], variables)
+                          for assignment in assignments if assignment.get("index", 0) == index}
+            variables.update(new_values)
+        triggered_timers.append(
+            [timer.name for timer in timers if variables[f"{timer.name}_needed"]])
+
+
+def _get_time_update_expression(timers, max_time_ns: int):
+    """Get the expression assigned to t in the global timer automaton."""
+    timer_automaton = make_global_timer_automaton(timers, max_time_ns)
+    time_updates = [assignment["value"] for edge in timer_automaton.as_dict({})["edges"]
+                    for assignment in edge["destinations"][0]["assignments"]
+                    if assignment["ref"] == "t"]
+    assert len(time_updates) == 1
+    return time_updates[0]
 
 
 class TestRosTimer(unittest.TestCase):
@@ -51,6 +108,82 @@ class TestRosTimer(unittest.TestCase):
         assert ros_timer.unit == "us"
         assert ros_timer.period_int == 1
 
+    def test_global_timer_multiple_periods(self):
+        """
+        Test the global timer advancing by the smallest period, if dividing all the others.
+        """
+        timers = [RosTimer("fast", 1000), RosTimer("slow", 1)]
+        time_update = _get_time_update_expression(timers, 10 * 1_000_000_000)
+        assert time_update == {"op": "+", "left": "t", "right": 1}
+
+    def test_global_timer_next_deadline(self):
+        """
+        Test the global timer jumping to the next deadline of timers with coprime periods.
+        """
+        # Periods of 5 ms and 8 ms
+        timers = [RosTimer("timer_a", 200), RosTimer("timer_b", 125)]
+        time_update = _get_time_update_expression(timers, 1_000_000_000)
+        t = 0
+        visited_times = []
+        while t < 40:
+            t = _evaluate_expression(time_update, {"t": t})
+            visited_times.append(t)
+        assert visited_times == [5, 8, 10, 15, 16, 20, 24, 25, 30, 32, 35, 40]
+
+    def test_global_timer_cyclic_encoding(self):
+        """
+        Test the cyclic time encoding triggers the timers as the absolute one, with bounded types.
+        """
+        # Periods of 5 ms, 8 ms and 1 s
+        timers = [RosTimer("timer_a", 200), RosTimer("timer_b", 125), RosTimer("timer_c", 1)]
+        for max_time_ns in (40_000_000, 1_999_000_000, 2_000_000_000):
+            absolute_steps = _simulate_global_timer(timers, max_time_ns, "absolute")
+            cyclic_steps = _simulate_global_timer(timers, max_time_ns, "cyclic")
+            assert absolute_steps == cyclic_steps
+        assert cyclic_steps[:3] == [["timer_a"], ["timer_b"], ["timer_a"]]
+        timer_automaton = make_global_timer_automaton(timers, 2_000_000_000, "cyclic")
+        variable_types = {variable["name"]: variable["type"]
+                          for variable in timer_automaton.as_dict({})["variables"]}
+        # The hyperperiod is 1 s, with a GCD of 1 ms
+        assert variable_types["t_cycle"] == {
+            "kind": "bounded", "base": "int", "lower-bound": 0, "upper-bound": 999}
+        assert variable_types["t_cycles"] == {
+            "kind": "bounded", "base": "int", "lower-bound": 0, "upper-bound": 2}
+
+    def test_time_resolution_quantization(self):
+        """
+        Test the timer periods are rounded to the time resolution, within the tolerance.
+        """
+        # Without a time resolution, 3 Hz cannot be represented
+        self.assertRaises(ValueError, RosTimer, "timer", 3)
+        ros_timer = RosTimer("timer", 3, time_resolution_ns=1_000_000)
+        assert ros_timer.unit == "ms"
+        assert ros_timer.period_int == 333
+        assert ros_timer.rounding_error == pytest.approx(0.001)
+        ros_timer = RosTimer("timer", 7, time_resolution_ns=2_000_000)
+        assert ros_timer.unit == "ms"
+        assert ros_timer.period_int == 142
+        self.assertRaises(ValueError, RosTimer, "timer", 3, 100_000_000)
+        ros_timer = RosTimer("timer", 3, 100_000_000, tolerance=0.2)
+        assert ros_timer.unit == "ms"
+        assert ros_timer.period_int == 300
+
+    def test_time_resolution_parsing(self):
+        """
+        Test the time resolution and its tolerance are read from the main XML file.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            main_xml_path = os.path.join(tmp_dir, "main.xml")
+            with open(main_xml_path, "w", encoding="utf-8") as f:
+                f.write('<convince_mc_tc><mc_parameters>'
+                        '<max_time value="100" unit="s" />'
+                        '<time_resolution value="5" unit="ms" tolerance="0.05" />'
+                        '</mc_parameters></convince_mc_tc>')
+            model = parse_main_xml(main_xml_path)
+        assert model.max_time == 100_000_000_000
+        assert model.time_resolution == 5_000_000
+        assert model.time_resolution_tolerance == 0.05
+
 
 if __name__ == '__main__':
     pytest.main(['-s', '-v', __file__])
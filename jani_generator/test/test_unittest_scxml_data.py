@@ -163,6 +163,19 @@ class TestScxmlData(unittest.TestCase):
         self.assertEqual(scxml_data.type, float)
         self.assertEqual(scxml_data.initial_value, 777.777)
 
+    def test_ecmascript_constant_expression(self):
+        """
+        Test with ECMAScript expressions that are folded to a constant, and with a non-constant one.
+        """
+        tag = ET.fromstring(
+            '<data id="VarFloat" expr="2 * 1.5" type="float64"/>')
+        scxml_data = ScxmlData(tag)
+        self.assertEqual(scxml_data.type, float)
+        self.assertEqual(scxml_data.initial_value, 3.0)
+        tag_variable = ET.fromstring(
+            '<data id="VarVariable" expr="other_var" type="int32"/>')
+        self.assertRaises(ValueError, ScxmlData, tag_variable)
+
     def test_ecmascript_unsupported(self):
         """
         Test with ECMA script expressions that evaluates to unsupported types.
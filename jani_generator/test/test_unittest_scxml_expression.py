@@ -0,0 +1,59 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the conversion of ecmascript expressions to JANI expressions"""
+
+import unittest
+
+import pytest
+
+from jani_generator.scxml_helpers.scxml_expression import \
+    parse_ecmascript_to_jani_expression
+
+
+class TestScxmlExpression(unittest.TestCase):
+
+    def test_parse_cache(self):
+        """
+        Test that parsing the same expression twice returns the same, shared expression.
+        """
+        expr = parse_ecmascript_to_jani_expression("x + 1 < _event.data")
+        self.assertIs(expr, parse_ecmascript_to_jani_expression("x + 1 < _event.data"))
+        self.assertIsNot(expr, parse_ecmascript_to_jani_expression("x + 2 < _event.data"))
+
+    def test_replace_event_copy(self):
+        """
+        Test that replacing the event in a cached expression leaves the cached one untouched.
+        """
+        expr = parse_ecmascript_to_jani_expression("x + 1 < _event.data")
+        expected_dict = {
+            "op": "<",
+            "left": {"op": "+", "left": "x", "right": 1},
+            "right": "_event.data"}
+        replaced = expr.replace_event("my_event")
+        self.assertEqual(replaced.as_dict(), {
+            "op": "<",
+            "left": {"op": "+", "left": "x", "right": 1},
+            "right": "my_event.data"})
+        self.assertEqual(expr.as_dict(), expected_dict)
+        self.assertEqual(
+            parse_ecmascript_to_jani_expression("x + 1 < _event.data").as_dict(), expected_dict)
+        # Sub-expressions without events are shared
+        self.assertIs(replaced.operands["left"], expr.operands["left"])
+        self.assertIs(expr.replace_event(None), expr)
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '-v', __file__])
@@ -157,7 +157,7 @@ def bt_converter(
         RosRateCallback(rtr, "tick"))
     root_tag.add_state(wait_for_tick, initial=True)
 
-    assert root_tag.check_validity(), "Error: SCXML root tag is not valid."
+    assert root_tag.is_valid(), "Error: SCXML root tag is not valid."
 
     with open(output_file_bt, 'w', encoding='utf-8') as f:
         f.write(root_tag.as_xml_string())
@@ -0,0 +1,174 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parser for the ROS interface definition files (.msg and .srv), not requiring ROS to be installed.
+
+The fields types are named as in the generated python ROS interfaces (get_fields_and_field_types).
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+# ROS primitive types -> type names used by the generated python interfaces
+ROS_PRIMITIVE_TYPES = {
+    "bool": "boolean",
+    "byte": "octet",
+    "char": "uint8",
+    "float32": "float",
+    "float64": "double",
+    "int8": "int8",
+    "uint8": "uint8",
+    "int16": "int16",
+    "uint16": "uint16",
+    "int32": "int32",
+    "uint32": "uint32",
+    "int64": "int64",
+    "uint64": "uint64",
+    "string": "string",
+    "wstring": "wstring",
+}
+
+SRV_SEPARATOR = "---"
+
+# Field line: type, name and (ignored) default value. Constants have a '=' after the name
+_FIELD_LINE_REGEX = re.compile(r"^(?P<type>\S+)\s+(?P<name>[A-Za-z][A-Za-z0-9_]*)\s*(?P<const>=)?")
+_FIELD_TYPE_REGEX = re.compile(
+    r"^(?P<base>[A-Za-z][A-Za-z0-9_/]*)(<=(?P<str_bound>\d+))?"
+    r"(?P<array>\[(?P<array_bounded><=)?(?P<array_size>\d+)?\])?$")
+
+
+def _parse_field_type(field_type: str, package_name: str) -> str:
+    """
+    Convert a field type from the ROS interface definition to the python interface type name.
+
+    :param field_type: The type as written in the definition file (e.g. float64[<=3]).
+    :param package_name: The package of the interface, for nested types without package.
+    :return: The type name (e.g. sequence<double, 3>).
+    """
+    type_match = _FIELD_TYPE_REGEX.match(field_type)
+    assert type_match is not None, f"Error: ROS interfaces parser: invalid type {field_type}."
+    base_type = type_match.group("base")
+    if base_type in ROS_PRIMITIVE_TYPES:
+        base_type = ROS_PRIMITIVE_TYPES[base_type]
+    elif "/" not in base_type:
+        base_type = f"{package_name}/{base_type}"
+    if type_match.group("str_bound") is not None:
+        assert base_type in ("string", "wstring"), \
+            f"Error: ROS interfaces parser: only strings can be bounded, found {field_type}."
+        base_type = f"{base_type}<{type_match.group('str_bound')}>"
+    if type_match.group("array") is None:
+        return base_type
+    array_size = type_match.group("array_size")
+    if array_size is None:
+        assert type_match.group("array_bounded") is None, \
+            f"Error: ROS interfaces parser: bounded array without size in {field_type}."
+        return f"sequence<{base_type}>"
+    if type_match.group("array_bounded") is not None:
+        return f"sequence<{base_type}, {array_size}>"
+    return f"{base_type}[{array_size}]"
+
+
+def parse_msg_content(msg_content: str, package_name: str) -> Dict[str, str]:
+    """
+    Get the fields defined in the content of a .msg file (or of a service request / response).
+
+    Nested message types are returned as they are (e.g. std_msgs/Header), constants are skipped.
+
+    :param msg_content: The content of the definition file.
+    :param package_name: The package of the interface, for nested types without package.
+    :return: A dictionary relating each field name to its type.
+    """
+    msg_fields: Dict[str, str] = {}
+    for line in msg_content.splitlines():
+        line = line.strip()
+        if len(line) == 0 or line.startswith("#"):
+            continue
+        line_match = _FIELD_LINE_REGEX.match(line)
+        assert line_match is not None, f"Error: ROS interfaces parser: invalid line '{line}'."
+        if line_match.group("const") is not None:
+            continue
+        field_name = line_match.group("name")
+        assert field_name not in msg_fields, \
+            f"Error: ROS interfaces parser: field {field_name} defined twice."
+        msg_fields[field_name] = _parse_field_type(line_match.group("type"), package_name)
+    return msg_fields
+
+
+def parse_srv_content(
+        srv_content: str, package_name: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Get the fields of the request and of the response defined in the content of a .srv file.
+
+    :param srv_content: The content of the definition file.
+    :param package_name: The package of the interface, for nested types without package.
+    :return: The request fields and the response fields, from field name to field type.
+    """
+    srv_lines = srv_content.splitlines()
+    separators = [idx for idx, line in enumerate(srv_lines) if line.strip() == SRV_SEPARATOR]
+    assert len(separators) == 1, \
+        "Error: ROS interfaces parser: a service needs exactly one request/response separator."
+    req_content = "\n".join(srv_lines[:separators[0]])
+    res_content = "\n".join(srv_lines[separators[0] + 1:])
+    return (parse_msg_content(req_content, package_name),
+            parse_msg_content(res_content, package_name))
+
+
+def find_interface_file(
+        type_definition: str, ros_interface: str, search_paths: List[str]) -> Optional[str]:
+    """
+    Look for the definition file of a ROS interface.
+
+    Each search path can contain either the packages folders (pkg/msg/Type.msg) or, as in a ROS
+    installation prefix, a share folder with them (share/pkg/msg/Type.msg).
+
+    :param type_definition: The interface to look for (e.g. std_msgs/Int32).
+    :param ros_interface: The kind of interface: msg or srv.
+    :param search_paths: The folders to look into, in order of priority.
+    :return: The path to the definition file, None if not found.
+    """
+    if type_definition.count("/") != 1:
+        return None
+    interface_ns, interface_type = type_definition.split("/")
+    if len(interface_ns) == 0 or len(interface_type) == 0:
+        return None
+    interface_fname = f"{interface_type}.{ros_interface}"
+    for search_path in search_paths:
+        for pkg_parent in (search_path, os.path.join(search_path, "share")):
+            interface_path = os.path.join(pkg_parent, interface_ns, ros_interface, interface_fname)
+            if os.path.isfile(interface_path):
+                return interface_path
+    return None
+
+
+def parse_interface_file(interface_path: str, type_definition: str,
+                         ros_interface: str) -> Tuple[Dict[str, str], ...]:
+    """
+    Parse a ROS interface definition file.
+
+    :param interface_path: The path to the definition file.
+    :param type_definition: The interface defined in the file (e.g. std_msgs/Int32).
+    :param ros_interface: The kind of interface: msg or srv.
+    :return: The message fields (for msg), or the request and response fields (for srv).
+    """
+    package_name = type_definition.split("/")[0]
+    with open(interface_path, "r", encoding="utf-8") as f:
+        interface_content = f.read()
+    if ros_interface == "msg":
+        return (parse_msg_content(interface_content, package_name),)
+    assert ros_interface == "srv", \
+        f"Error: ROS interfaces parser: unknown ROS interface {ros_interface}."
+    return parse_srv_content(interface_content, package_name)
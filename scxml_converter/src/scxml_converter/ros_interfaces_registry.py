@@ -0,0 +1,288 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Process-wide registry of the ROS interface definitions (messages and services).
+
+Resolving the ROS interfaces is slow: the registry resolves each interface only once, and memoizes
+its (flattened) fields for all the following lookups. Interfaces are resolved from the definition
+files found in the configured search paths first, then from the installed ROS python packages.
+The resolved fields can be exported in a compact schema, to be stored on disk and loaded later.
+The schema records the content hash of the definition file of each interface: the stored entries
+whose definition file has changed, or that are now provided by a definition file in the search
+paths, are resolved again.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from scxml_converter.ros_interfaces_parser import (find_interface_file,
+                                                   parse_interface_file)
+
+ROS_INTERFACE_KINDS = ("msg", "srv")
+
+# Version of the exported schema format
+ROS_INTERFACES_SCHEMA_VERSION = 2
+
+# The fields of a message, or the fields of a service request and response
+RosInterfaceFields = Tuple[Dict[str, str], ...]
+
+
+def _get_file_hash(file_path: str) -> str:
+    """Get the hash of the content of a file."""
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class RosInterfacesRegistry:
+    """Registry resolving ROS interfaces and their fields, caching the results."""
+
+    def __init__(self, search_paths: Optional[List[str]] = None):
+        """
+        Initialize the registry.
+
+        :param search_paths: Folders containing the ROS interface definition files, if any.
+        """
+        self._reset(search_paths)
+
+    def _reset(self, search_paths: Optional[List[str]]) -> None:
+        """Set the search paths, removing all the resolved interfaces and the lookup counters."""
+        self._search_paths: List[str] = [] if search_paths is None else list(search_paths)
+        # (interface kind, type definition) -> interface fields, None if it can't be resolved
+        self._interfaces: Dict[Tuple[str, str], Optional[RosInterfaceFields]] = {}
+        # (interface kind, type definition) -> definition file and its content hash, if any
+        self._sources: Dict[Tuple[str, str], Dict[str, str]] = {}
+        # Message type definition -> flattened fields, from field name to field type
+        self._msg_fields: Dict[str, Dict[str, str]] = {}
+        # Service type definition -> flattened fields of the request and of the response
+        self._srv_fields: Dict[str, Tuple[Dict[str, str], Dict[str, str]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def _count_lookup(self, is_hit: bool) -> None:
+        if is_hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    def get_search_paths(self) -> List[str]:
+        """Get the folders searched for the ROS interface definition files."""
+        return list(self._search_paths)
+
+    def set_search_paths(self, search_paths: List[str]) -> None:
+        """
+        Set the folders containing the ROS interface definition files, taking precedence over
+        the installed ROS python packages. This resets the interfaces resolved so far.
+
+        :param search_paths: The folders to look into, in order of priority.
+        """
+        self._reset(search_paths)
+
+    def get_interface_fields(
+            self, type_definition: str, ros_interface: str) -> Optional[RosInterfaceFields]:
+        """
+        Get the (not flattened) fields of a ROS interface.
+
+        :param type_definition: The type definition to resolve (e.g. std_msgs/Empty).
+        :param ros_interface: The kind of interface: msg or srv.
+        :return: The message fields (msg) or the request and response fields (srv), from field
+            name to field type. None if the interface can't be resolved.
+        """
+        assert ros_interface in ROS_INTERFACE_KINDS, \
+            f"Error: ROS interfaces registry: unknown ROS interface {ros_interface}."
+        interface_key = (ros_interface, type_definition)
+        self._count_lookup(interface_key in self._interfaces)
+        if interface_key not in self._interfaces:
+            self._interfaces[interface_key] = \
+                self._resolve_interface(type_definition, ros_interface)
+        return self._interfaces[interface_key]
+
+    def _resolve_interface(
+            self, type_definition: str, ros_interface: str) -> Optional[RosInterfaceFields]:
+        if not isinstance(type_definition, str):
+            return None
+        interface_path = find_interface_file(type_definition, ros_interface, self._search_paths)
+        if interface_path is not None:
+            self._sources[(ros_interface, type_definition)] = {
+                "path": interface_path, "sha256": _get_file_hash(interface_path)}
+            return parse_interface_file(interface_path, type_definition, ros_interface)
+        interface_class = self._import_interface(type_definition, ros_interface)
+        if interface_class is None:
+            return None
+        if ros_interface == "msg":
+            return (dict(interface_class.get_fields_and_field_types()),)
+        return (dict(interface_class.Request.get_fields_and_field_types()),
+                dict(interface_class.Response.get_fields_and_field_types()))
+
+    @staticmethod
+    def _import_interface(type_definition: str, ros_interface: str) -> Optional[Any]:
+        if type_definition.count("/") != 1:
+            return None
+        interface_ns, interface_type = type_definition.split("/")
+        if len(interface_ns) == 0 or len(interface_type) == 0:
+            return None
+        try:
+            interface_importer = __import__(interface_ns + f'.{ros_interface}', fromlist=[''])
+            return getattr(interface_importer, interface_type)
+        except (ImportError, AttributeError):
+            return None
+
+    def is_type_known(self, type_definition: str, ros_interface: str) -> bool:
+        """Check if the provided ROS interface can be resolved."""
+        return self.get_interface_fields(type_definition, ros_interface) is not None
+
+    def _flatten_fields(self, fields: Dict[str, str]) -> Dict[str, str]:
+        """Replace the fields with a nested message type with their sub-fields (e.g. pose.x)."""
+        flat_fields: Dict[str, str] = {}
+        for field_name, field_type in fields.items():
+            if field_type.count("/") == 1 and self.is_type_known(field_type, "msg"):
+                for sub_field_name, sub_field_type in self.get_msg_fields(field_type).items():
+                    flat_fields[f"{field_name}.{sub_field_name}"] = sub_field_type
+            else:
+                flat_fields[field_name] = field_type
+        return flat_fields
+
+    def get_msg_fields(self, msg_definition: str) -> Dict[str, str]:
+        """
+        Get the flattened fields of a message type.
+
+        :param msg_definition: The message type definition (e.g. std_msgs/Int32).
+        :return: A new dictionary relating each field name to its type.
+        """
+        self._count_lookup(msg_definition in self._msg_fields)
+        if msg_definition not in self._msg_fields:
+            msg_fields = self.get_interface_fields(msg_definition, "msg")
+            assert msg_fields is not None, \
+                f"Error: ROS interfaces registry: message type {msg_definition} not found."
+            self._msg_fields[msg_definition] = self._flatten_fields(msg_fields[0])
+        return dict(self._msg_fields[msg_definition])
+
+    def get_srv_fields(self, srv_definition: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Get the flattened fields of a service request and response.
+
+        :param srv_definition: The service type definition (e.g. std_srvs/SetBool).
+        :return: New dictionaries relating each field name to its type, for request and response.
+        """
+        self._count_lookup(srv_definition in self._srv_fields)
+        if srv_definition not in self._srv_fields:
+            srv_fields = self.get_interface_fields(srv_definition, "srv")
+            assert srv_fields is not None, \
+                f"Error: ROS interfaces registry: service type {srv_definition} not found."
+            self._srv_fields[srv_definition] = (
+                self._flatten_fields(srv_fields[0]), self._flatten_fields(srv_fields[1]))
+        req_fields, res_fields = self._srv_fields[srv_definition]
+        return dict(req_fields), dict(res_fields)
+
+    def export_schema(self) -> Dict[str, Any]:
+        """
+        Export the resolved interfaces in a compact, JSON serializable schema.
+
+        :return: The schema, relating each interface kind and type definition to its fields and
+            to its definition file (None if resolved from the installed ROS packages).
+        """
+        schema: Dict[str, Any] = {"version": ROS_INTERFACES_SCHEMA_VERSION}
+        for ros_interface in ROS_INTERFACE_KINDS:
+            schema[ros_interface] = {}
+        for interface_key, fields in sorted(self._interfaces.items()):
+            if fields is not None:
+                ros_interface, type_definition = interface_key
+                schema[ros_interface][type_definition] = {
+                    "fields": [dict(f) for f in fields],
+                    "source": self._sources.get(interface_key)}
+        return schema
+
+    def _is_schema_entry_current(self, type_definition: str, ros_interface: str,
+                                 source: Optional[Dict[str, str]]) -> bool:
+        """
+        Check if an interface stored in a schema matches its current definition file.
+
+        :param type_definition: The type definition of the stored interface.
+        :param ros_interface: The kind of the stored interface: msg or srv.
+        :param source: The definition file of the stored interface, None if it had none.
+        :return: False if the interface is defined by a different file in the search paths, or if
+            its definition file has changed. True if there is no file to compare with.
+        """
+        interface_path = find_interface_file(type_definition, ros_interface, self._search_paths)
+        if interface_path is None and source is not None and os.path.isfile(source["path"]):
+            interface_path = source["path"]
+        if interface_path is None:
+            return True
+        return source is not None and _get_file_hash(interface_path) == source["sha256"]
+
+    def import_schema(self, schema: Dict[str, Any]) -> None:
+        """
+        Add the interfaces from a schema generated by export_schema to the resolved ones.
+
+        The interfaces whose definition file has changed since the export are skipped, and
+        resolved again when used.
+
+        :param schema: The schema to import.
+        """
+        assert schema.get("version") == ROS_INTERFACES_SCHEMA_VERSION, \
+            "Error: ROS interfaces registry: unsupported schema version."
+        for ros_interface in ROS_INTERFACE_KINDS:
+            for type_definition, entry in schema[ros_interface].items():
+                interface_key = (ros_interface, type_definition)
+                if interface_key in self._interfaces or not self._is_schema_entry_current(
+                        type_definition, ros_interface, entry["source"]):
+                    continue
+                self._interfaces[interface_key] = tuple(dict(f) for f in entry["fields"])
+                if entry["source"] is not None:
+                    self._sources[interface_key] = dict(entry["source"])
+
+    def load_schema(self, schema_path: str) -> None:
+        """Import the interfaces from a schema file written by save_schema."""
+        with open(schema_path, "r", encoding="utf-8") as f:
+            self.import_schema(json.load(f))
+
+    def save_schema(self, schema_path: str) -> None:
+        """Write the resolved interfaces to a schema file."""
+        schema_folder = os.path.dirname(schema_path)
+        if len(schema_folder) > 0:
+            os.makedirs(schema_folder, exist_ok=True)
+        with open(schema_path, "w", encoding="utf-8") as f:
+            json.dump(self.export_schema(), f, separators=(",", ":"))
+
+    def clear(self) -> None:
+        """Remove all the resolved interfaces and reset the lookup counters."""
+        self._reset(self._search_paths)
+
+    def get_stats(self) -> str:
+        """Get a summary of the registry usage."""
+        return f"ROS interfaces registry: {self._hits} hits, {self._misses} misses."
+
+
+# The registry shared by all the SCXML models converted in this process
+_ROS_INTERFACES_REGISTRY = RosInterfacesRegistry()
+
+
+def get_ros_interfaces_registry() -> RosInterfacesRegistry:
+    """Get the registry of the ROS interfaces shared in this process."""
+    return _ROS_INTERFACES_REGISTRY
+
+
+def set_ros_interfaces_registry(registry: RosInterfacesRegistry) -> None:
+    """
+    Replace the registry of the ROS interfaces shared in this process.
+
+    Used to initialize the worker processes with the interfaces resolved by the main process.
+
+    :param registry: The new registry to share.
+    """
+    global _ROS_INTERFACES_REGISTRY
+    _ROS_INTERFACES_REGISTRY = registry
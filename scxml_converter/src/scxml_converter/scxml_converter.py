@@ -21,10 +21,12 @@ into generic SCXML code.
 """
 
 import xml.etree.ElementTree as ET
-from typing import Dict, Tuple, Union
+from typing import Dict, Tuple
 
 from as2fm_common.common import ros_type_name_to_python_type
-from as2fm_common.ecmascript_interpretation import interpret_ecma_script_expr
+from as2fm_common.ecmascript_interpretation import \
+    interpret_ecma_script_expr_type
+from scxml_converter.ros_interfaces_registry import get_ros_interfaces_registry
 from scxml_converter.scxml_entries import (ScxmlRoot,
                                            ScxmlRosDeclarationsContainer)
 
@@ -47,29 +49,16 @@ def _is_basic_field_type(field_name: str) -> bool:
     return field_name in BASIC_FIELD_TYPES
 
 
-def _ros_type_fields(type_str: str) -> Dict[str, Union[str, dict]]:
+def _ros_type_fields(type_str: str) -> Dict[str, str]:
     """Get the fields of a ROS message type.
 
-    This function imports the message type and returns a dictionary
-    containing the fields and their types.
+    The message type is resolved with the shared ROS interfaces registry: nested message types
+    are flattened, e.g. pose.x.
 
     :param type_str: The ROS message type string. (e.g. std_msgs/String)
     :return: A dictionary containing the fields and their types.
     """
-    pkg_and_msg_list = type_str.split('/')
-    pkg_name = pkg_and_msg_list[0]
-    msg_type = pkg_and_msg_list[1]
-    pkg_msgs = __import__(pkg_name + '.msg', fromlist=[msg_type])
-    msg_fields = getattr(pkg_msgs, msg_type).get_fields_and_field_types()
-    msg_fields_names = list(msg_fields.keys())
-    for key in msg_fields_names:
-        field_type = msg_fields[key]
-        if not _is_basic_field_type(field_type):
-            msg_subfields = _ros_type_fields(field_type)
-            for subfield_name, subfield_type in msg_subfields.items():
-                msg_fields[key + '.' + subfield_name] = subfield_type
-            del msg_fields[key]
-    return msg_fields
+    return get_ros_interfaces_registry().get_msg_fields(type_str)
 
 
 # TODO: Unused, keeping as reference to output types in low level SCXML
@@ -94,8 +83,7 @@ def _check_topic_type(
             f"Field {name} not found in the type dictionary {type_dict}")
     expected_ros_type = type_dict[this_topic][name]
     expected_python_type = ros_type_name_to_python_type(expected_ros_type)
-    expression_value = interpret_ecma_script_expr(expr)
-    expression_type = type(expression_value)
+    expression_type = interpret_ecma_script_expr_type(expr)
     if expression_type != expected_python_type:
         raise ConversionStaticAnalysisError(
             f"Field {name} has type {expression_type}, " +
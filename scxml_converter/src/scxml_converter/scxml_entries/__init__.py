@@ -1,6 +1,7 @@
 # isort: skip_file
 # Skipping file to avoid circular import problem
 from .scxml_base import ScxmlBase                                               # noqa: F401
+from .scxml_base import get_trust_inputs, set_trust_inputs                      # noqa: F401
 from .scxml_param import ScxmlParam                                             # noqa: F401
 from .scxml_ros_field import RosField                                           # noqa: F401
 from .utils import ScxmlRosDeclarationsContainer                                # noqa: F401
@@ -17,12 +17,52 @@
 Base SCXML class, defining the methods all SCXML entries shall implement.
 """
 
+from typing import Optional, Tuple
 from xml.etree import ElementTree as ET
 
+# If True, all SCXML entries are assumed to be valid and the validity checks are skipped
+_trust_inputs: bool = False
+
+
+def set_trust_inputs(trust_inputs: bool) -> None:
+    """
+    Enable or disable the validity checks of all SCXML entries, e.g. for pre-validated files.
+
+    :param trust_inputs: If True, assume all SCXML entries are valid without checking them.
+    """
+    global _trust_inputs
+    _trust_inputs = trust_inputs
+
+
+def get_trust_inputs() -> bool:
+    """Check whether the validity checks of the SCXML entries are skipped."""
+    return _trust_inputs
+
 
 class ScxmlBase:
     """This class is the base class for all SCXML entries."""
 
+    # Incremented when a checked SCXML entry is modified, invalidating all cached validity checks.
+    # Entries that were never checked (e.g. while being built) can't affect any cached result.
+    _modifications_count: int = 0
+    # The result of the last validity check, with the modifications count at that time
+    _cached_validity: Optional[Tuple[int, bool]] = None
+
+    def __setattr__(self, name, value):
+        self._notify_modification()
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        # The cached validity refers to the modifications count of this process only
+        state = self.__dict__.copy()
+        state.pop("_cached_validity", None)
+        return state
+
+    def _notify_modification(self) -> None:
+        """Invalidate the cached validity checks, after modifying the object in place."""
+        if self._cached_validity is not None:
+            ScxmlBase._modifications_count += 1
+
     @staticmethod
     def get_tag_name() -> str:
         """Get the tag name of the XML element."""
@@ -37,6 +77,22 @@ class ScxmlBase:
         """Check if the object is valid."""
         raise NotImplementedError
 
+    def is_valid(self) -> bool:
+        """
+        Check if the object is valid, reusing the last check if no SCXML entry was modified since.
+
+        Entries containing other entries should use this (and not check_validity) on them.
+        """
+        if _trust_inputs:
+            return True
+        modifications_count = ScxmlBase._modifications_count
+        cached_validity = self._cached_validity
+        if cached_validity is None or cached_validity[0] != modifications_count:
+            cached_validity = (modifications_count, self.check_validity())
+            # Bypass __setattr__: caching the result is not a modification
+            object.__setattr__(self, "_cached_validity", cached_validity)
+        return cached_validity[1]
+
     def as_plain_scxml(self, ros_declarations) -> "ScxmlBase":
         """Convert the object to its plain SCXML  version."""
         raise NotImplementedError
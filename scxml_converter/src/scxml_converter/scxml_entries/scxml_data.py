@@ -17,7 +17,7 @@
 Container for a single variable definition in SCXML. In XML, it has the tag `data`.
 """
 
-from typing import Any
+from typing import Any, Optional, Tuple
 from xml.etree import ElementTree as ET
 
 from scxml_converter.scxml_entries import ScxmlBase
@@ -42,10 +42,21 @@ class ScxmlData(ScxmlBase):
         assert data_expr is not None, "Error: SCXML data: 'expr' not found."
         data_type = xml_tree.attrib.get("type")
         assert data_type is not None, "Error: SCXML data: 'type' not found."
-        lower_bound = xml_tree.attrib.get("lower_bound_incl", None)
-        upper_bound = xml_tree.attrib.get("upper_bound_incl", None)
+        lower_bound = ScxmlData._parse_bound(xml_tree.attrib.get("lower_bound_incl"), data_type)
+        upper_bound = ScxmlData._parse_bound(xml_tree.attrib.get("upper_bound_incl"), data_type)
         return ScxmlData(data_id, data_expr, data_type, lower_bound, upper_bound)
 
+    @staticmethod
+    def _parse_bound(bound_str: Optional[str], data_type: str) -> Any:
+        """Convert a bound from the XML attribute to the data type, if possible."""
+        if bound_str is None or data_type not in SCXML_DATA_STR_TO_TYPE:
+            return bound_str
+        try:
+            return SCXML_DATA_STR_TO_TYPE[data_type](bound_str)
+        except ValueError:
+            # Keep the original string, reported by the validity check
+            return bound_str
+
     def __init__(
             self, id_   : str, expr: str, data_type: str,
             lower_bound: Any = None, upper_bound: Any = None):
@@ -64,6 +75,12 @@ class ScxmlData(ScxmlBase):
     def get_expr(self) -> str:
         return self._expr
 
+    def get_bounds(self) -> Optional[Tuple[Any, Any]]:
+        """Get the lower and upper bounds (included) of the data, None if it is unbounded."""
+        if self._lower_bound is None and self._upper_bound is None:
+            return None
+        return self._lower_bound, self._upper_bound
+
     def check_validity(self) -> bool:
         validity = True
         # ID
@@ -98,7 +115,7 @@ class ScxmlData(ScxmlBase):
         return validity
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "SCXML: found invalid data object."
+        assert self.is_valid(), "SCXML: found invalid data object."
         xml_data = ET.Element(ScxmlData.get_tag_name(),
                               {"id": self._id, "expr": self._expr, "type": self._data_type})
         if self._lower_bound is not None:
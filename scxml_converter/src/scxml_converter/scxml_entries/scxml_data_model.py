@@ -56,7 +56,7 @@ class ScxmlDataModel(ScxmlBase):
             if valid_data_entries:
                 for data_entry in self._data_entries:
                     valid_data_entry = isinstance(data_entry, ScxmlData) and \
-                        data_entry.check_validity()
+                        data_entry.is_valid()
                     if not valid_data_entry:
                         valid_data_entries = False
                         break
@@ -65,7 +65,7 @@ class ScxmlDataModel(ScxmlBase):
         return valid_data_entries
 
     def as_xml(self) -> Optional[ET.Element]:
-        assert self.check_validity(), "SCXML: found invalid datamodel object."
+        assert self.is_valid(), "SCXML: found invalid datamodel object."
         if self._data_entries is None or len(self._data_entries) == 0:
             return None
         xml_datamodel = ET.Element(ScxmlDataModel.get_tag_name())
@@ -136,7 +136,7 @@ class ScxmlIf(ScxmlBase):
 
     def as_xml(self) -> ET.Element:
         # Based on example in https://www.w3.org/TR/scxml/#if
-        assert self.check_validity(), "SCXML: found invalid if object."
+        assert self.is_valid(), "SCXML: found invalid if object."
         first_conditional_execution = self._conditional_executions[0]
         xml_if = ET.Element(ScxmlIf.get_tag_name(), {"cond": first_conditional_execution[0]})
         append_execution_body_to_xml(xml_if, first_conditional_execution[1])
@@ -186,7 +186,7 @@ class ScxmlSend(ScxmlBase):
         valid_event = isinstance(self._event, str) and len(self._event) > 0
         valid_params = True
         for param in self._params:
-            valid_param = isinstance(param, ScxmlParam) and param.check_validity()
+            valid_param = isinstance(param, ScxmlParam) and param.is_valid()
             valid_params = valid_params and valid_param
         if not valid_event:
             print("Error: SCXML send: event is not valid.")
@@ -202,12 +202,13 @@ class ScxmlSend(ScxmlBase):
     def append_param(self, param: ScxmlParam) -> None:
         assert isinstance(param, ScxmlParam), "Error: SCXML send: invalid param."
         self._params.append(param)
+        self._notify_modification()
 
     def as_plain_scxml(self, _) -> "ScxmlSend":
         return self
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "SCXML: found invalid send object."
+        assert self.is_valid(), "SCXML: found invalid send object."
         xml_send = ET.Element(ScxmlSend.get_tag_name(), {"event": self._event})
         for param in self._params:
             xml_send.append(param.as_xml())
@@ -268,7 +269,7 @@ class ScxmlAssign(ScxmlBase):
         return ScxmlAssign(self._location, expr)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "SCXML: found invalid assign object."
+        assert self.is_valid(), "SCXML: found invalid assign object."
         return ET.Element(ScxmlAssign.get_tag_name(), {
             "location": self._location, "expr": self._expr})
 
@@ -295,7 +296,7 @@ def valid_execution_body(execution_body: ScxmlExecutionBody) -> bool:
             print(f"Error: SCXML execution body: entry type {type(entry)} not in valid set "
                   f" {_ResolvedScxmlExecutableEntry}.")
             break
-        if not entry.check_validity():
+        if not entry.is_valid():
             valid = False
             print("Error: SCXML execution body: invalid entry content found.")
             break
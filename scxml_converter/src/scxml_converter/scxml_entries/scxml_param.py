@@ -82,7 +82,7 @@ class ScxmlParam(ScxmlBase):
         return valid_name and (valid_expr or valid_location)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "SCXML: found invalid param."
+        assert self.is_valid(), "SCXML: found invalid param."
         xml_param = ET.Element(ScxmlParam.get_tag_name(), {"name": self._name})
         if self._expr is not None:
             xml_param.set("expr", self._expr)
@@ -134,6 +134,7 @@ class ScxmlRoot(ScxmlBase):
     def add_state(self, state: ScxmlState, *, initial: bool = False):
         """Append a state to the list of states. If initial is True, set it as the initial state."""
         self._states.append(state)
+        self._notify_modification()
         if initial:
             assert self._initial_state is None, "Error: SCXML root: Initial state already set"
             self._initial_state = state.get_id()
@@ -145,17 +146,18 @@ class ScxmlRoot(ScxmlBase):
     def add_ros_declaration(self, ros_declaration: ScxmlRosDeclarations):
         assert isinstance(ros_declaration, get_args(ScxmlRosDeclarations)), \
             "Error: SCXML root: invalid ROS declaration type."
-        assert ros_declaration.check_validity(), "Error: SCXML root: invalid ROS declaration."
+        assert ros_declaration.is_valid(), "Error: SCXML root: invalid ROS declaration."
         if self._ros_declarations is None:
             self._ros_declarations = []
         self._ros_declarations.append(ros_declaration)
+        self._notify_modification()
 
     def _generate_ros_declarations_helper(self) -> Optional[ScxmlRosDeclarationsContainer]:
         """Generate a HelperRosDeclarations object from the existing ROS declarations."""
         ros_decl_container = ScxmlRosDeclarationsContainer(self._name)
         if self._ros_declarations is not None:
             for ros_declaration in self._ros_declarations:
-                if not ros_declaration.check_validity():
+                if not ros_declaration.is_valid():
                     return None
                 if isinstance(ros_declaration, RosTimeRate):
                     ros_decl_container.append_timer(ros_declaration.get_name(),
@@ -182,10 +184,10 @@ class ScxmlRoot(ScxmlBase):
         valid_states = isinstance(self._states, list) and len(self._states) > 0
         if valid_states:
             for state in self._states:
-                valid_states = isinstance(state, ScxmlState) and state.check_validity()
+                valid_states = isinstance(state, ScxmlState) and state.is_valid()
                 if not valid_states:
                     break
-        valid_data_model = self._data_model is None or self._data_model.check_validity()
+        valid_data_model = self._data_model is None or self._data_model.is_valid()
         if not valid_name:
             print("Error: SCXML root: name is not valid.")
         if not valid_initial_state:
@@ -214,7 +216,7 @@ class ScxmlRoot(ScxmlBase):
 
     def is_plain_scxml(self) -> bool:
         """Check whether there are ROS specific features or all entries are plain SCXML."""
-        assert self.check_validity(), "SCXML: found invalid root object."
+        assert self.is_valid(), "SCXML: found invalid root object."
         # If this is a valid scxml object, checking the absence of declarations is enough
         return self._ros_declarations is None or len(self._ros_declarations) == 0
 
@@ -239,7 +241,7 @@ class ScxmlRoot(ScxmlBase):
         return (plain_root, ros_declarations)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "SCXML: found invalid root object."
+        assert self.is_valid(), "SCXML: found invalid root object."
         assert self._initial_state is not None, "Error: SCXML root: no initial state set."
         xml_root = ET.Element("scxml", {
             "name": self._name,
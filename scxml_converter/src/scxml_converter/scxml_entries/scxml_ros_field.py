@@ -26,7 +26,7 @@ class RosField(ScxmlParam):
     def __init__(self, name: str, expr: str):
         self._name = name
         self._expr = expr
-        assert self.check_validity(), "Error: SCXML topic publish field: invalid parameters."
+        assert self.is_valid(), "Error: SCXML topic publish field: invalid parameters."
 
     @staticmethod
     def get_tag_name() -> str:
@@ -58,6 +58,6 @@ class RosField(ScxmlParam):
         return ScxmlParam(self._name, expr=replace_ros_interface_expression(self._expr))
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML topic publish field: invalid parameters."
+        assert self.is_valid(), "Error: SCXML topic publish field: invalid parameters."
         xml_field = ET.Element(RosField.get_tag_name(), {"name": self._name, "expr": self._expr})
         return xml_field
@@ -85,7 +85,7 @@ class RosServiceServer(ScxmlBase):
         raise RuntimeError("Error: SCXML ROS declarations cannot be converted to plain SCXML.")
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML Service Server: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Server: invalid parameters."
         xml_srv_server = ET.Element(
             RosServiceServer.get_tag_name(),
             {"service_name": self._srv_name, "type": self._srv_type})
@@ -142,7 +142,7 @@ class RosServiceClient(ScxmlBase):
         raise RuntimeError("Error: SCXML ROS declarations cannot be converted to plain SCXML.")
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML Service Client: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Client: invalid parameters."
         xml_srv_server = ET.Element(
             RosServiceClient.get_tag_name(),
             {"service_name": self._srv_name, "type": self._srv_type})
@@ -189,12 +189,12 @@ class RosServiceSendRequest(ScxmlSend):
         if fields is None:
             fields = []
         self._fields = fields
-        assert self.check_validity(), "Error: SCXML Service Send Request: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Send Request: invalid parameters."
 
     def check_validity(self) -> bool:
         valid_name = isinstance(self._srv_name, str) and len(self._srv_name) > 0
         valid_fields = self._fields is None or \
-            all([isinstance(field, RosField) and field.check_validity() for field in self._fields])
+            all([isinstance(field, RosField) and field.is_valid() for field in self._fields])
         if not valid_name:
             print("Error: SCXML service request: service name is not valid.")
         if not valid_fields:
@@ -225,7 +225,7 @@ class RosServiceSendRequest(ScxmlSend):
         return ScxmlSend(event_name, event_params)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML Service Send Request: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Send Request: invalid parameters."
         xml_srv_request = ET.Element(RosServiceSendRequest.get_tag_name(),
                                      {"service_name": self._srv_name})
         if self._fields is not None:
@@ -273,7 +273,7 @@ class RosServiceHandleRequest(ScxmlTransition):
             self._service_name = service_decl
         self._target = target
         self._body = body
-        assert self.check_validity(), "Error: SCXML Service Handle Request: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Handle Request: invalid parameters."
 
     def check_validity(self) -> bool:
         valid_name = isinstance(self._service_name, str) and len(self._service_name) > 0
@@ -310,7 +310,7 @@ class RosServiceHandleRequest(ScxmlTransition):
         return ScxmlTransition(target, [event_name], None, body)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML Service Handle Request: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Handle Request: invalid parameters."
         xml_srv_request = ET.Element(RosServiceHandleRequest.get_tag_name(),
                                      {"service_name": self._service_name, "target": self._target})
         if self._body is not None:
@@ -359,12 +359,12 @@ class RosServiceSendResponse(ScxmlSend):
                 "Error: SCXML Service Send Response: invalid service name."
             self._service_name = service_name
         self._fields = fields if fields is not None else []
-        assert self.check_validity(), "Error: SCXML Service Send Response: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Send Response: invalid parameters."
 
     def check_validity(self) -> bool:
         valid_name = isinstance(self._service_name, str) and len(self._service_name) > 0
         valid_fields = self._fields is None or \
-            all([isinstance(field, RosField) and field.check_validity() for field in self._fields])
+            all([isinstance(field, RosField) and field.is_valid() for field in self._fields])
         if not valid_name:
             print("Error: SCXML service response: service name is not valid.")
         if not valid_fields:
@@ -394,7 +394,7 @@ class RosServiceSendResponse(ScxmlSend):
         return ScxmlSend(event_name, event_params)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML Service Send Response: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Send Response: invalid parameters."
         xml_srv_response = ET.Element(RosServiceSendResponse.get_tag_name(),
                                       {"service_name": self._service_name})
         if self._fields is not None:
@@ -441,7 +441,7 @@ class RosServiceHandleResponse(ScxmlTransition):
             self._service_name = service_decl
         self._target = target
         self._body = body
-        assert self.check_validity(), "Error: SCXML Service Handle Response: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Handle Response: invalid parameters."
 
     def check_validity(self) -> bool:
         valid_name = isinstance(self._service_name, str) and len(self._service_name) > 0
@@ -479,7 +479,7 @@ class RosServiceHandleResponse(ScxmlTransition):
         return ScxmlTransition(target, [event_name], None, body)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML Service Handle Response: invalid parameters."
+        assert self.is_valid(), "Error: SCXML Service Handle Response: invalid parameters."
         xml_srv_response = ET.Element(RosServiceHandleResponse.get_tag_name(),
                                       {"service_name": self._service_name, "target": self._target})
         if self._body is not None:
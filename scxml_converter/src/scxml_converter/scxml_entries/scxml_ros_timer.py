@@ -72,7 +72,7 @@ class RosTimeRate(ScxmlBase):
         raise RuntimeError("Error: SCXML ROS declarations cannot be converted to plain SCXML.")
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML rate timer: invalid parameters."
+        assert self.is_valid(), "Error: SCXML rate timer: invalid parameters."
         xml_time_rate = ET.Element(
             RosTimeRate.get_tag_name(), {"rate_hz": str(self._rate_hz), "name": self._name})
         return xml_time_rate
@@ -119,7 +119,7 @@ class RosRateCallback(ScxmlTransition):
         self._target = target
         self._condition = condition
         self._body = body
-        assert self.check_validity(), "Error: SCXML rate callback: invalid parameters."
+        assert self.is_valid(), "Error: SCXML rate callback: invalid parameters."
 
     def check_validity(self) -> bool:
         valid_timer = isinstance(self._timer_name, str) and len(self._timer_name) > 0
@@ -159,7 +159,7 @@ class RosRateCallback(ScxmlTransition):
         return ScxmlTransition(target, [event_name], cond, body)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML rate callback: invalid parameters."
+        assert self.is_valid(), "Error: SCXML rate callback: invalid parameters."
         xml_rate_callback = ET.Element(
             "ros_rate_callback", {"name": self._timer_name, "target": self._target})
         if self._condition is not None:
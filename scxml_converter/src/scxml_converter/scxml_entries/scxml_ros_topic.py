@@ -75,7 +75,7 @@ class RosTopicPublisher(ScxmlBase):
         raise RuntimeError("Error: SCXML ROS declarations cannot be converted to plain SCXML.")
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML topic subscriber: invalid parameters."
+        assert self.is_valid(), "Error: SCXML topic subscriber: invalid parameters."
         xml_topic_publisher = ET.Element(
             RosTopicPublisher.get_tag_name(), {"topic": self._topic_name, "type": self._topic_type})
         return xml_topic_publisher
@@ -123,7 +123,7 @@ class RosTopicSubscriber(ScxmlBase):
         raise RuntimeError("Error: SCXML ROS declarations cannot be converted to plain SCXML.")
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML topic subscriber: invalid parameters."
+        assert self.is_valid(), "Error: SCXML topic subscriber: invalid parameters."
         xml_topic_subscriber = ET.Element(
             RosTopicSubscriber.get_tag_name(),
             {"topic": self._topic_name, "type": self._topic_type})
@@ -167,7 +167,7 @@ class RosTopicCallback(ScxmlTransition):
             self._topic = topic
         self._target = target
         self._body = body
-        assert self.check_validity(), "Error: SCXML topic callback: invalid parameters."
+        assert self.is_valid(), "Error: SCXML topic callback: invalid parameters."
 
     def check_validity(self) -> bool:
         valid_topic = isinstance(self._topic, str) and len(self._topic) > 0
@@ -204,7 +204,7 @@ class RosTopicCallback(ScxmlTransition):
         return ScxmlTransition(target, [event_name], None, body)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML topic callback: invalid parameters."
+        assert self.is_valid(), "Error: SCXML topic callback: invalid parameters."
         xml_topic_callback = ET.Element(
             "ros_topic_callback", {"topic": self._topic, "target": self._target})
         if self._body is not None:
@@ -244,12 +244,12 @@ class RosTopicPublish(ScxmlSend):
             assert isinstance(topic, str), "Error: SCXML topic publish: invalid topic type."
             self._topic = topic
         self._fields = fields
-        assert self.check_validity(), "Error: SCXML topic publish: invalid parameters."
+        assert self.is_valid(), "Error: SCXML topic publish: invalid parameters."
 
     def check_validity(self) -> bool:
         valid_topic = isinstance(self._topic, str) and len(self._topic) > 0
         valid_fields = self._fields is None or \
-            all([isinstance(field, RosField) and field.check_validity() for field in self._fields])
+            all([isinstance(field, RosField) and field.is_valid() for field in self._fields])
         if not valid_topic:
             print("Error: SCXML topic publish: topic name is not valid.")
         if not valid_fields:
@@ -276,6 +276,7 @@ class RosTopicPublish(ScxmlSend):
         if self._fields is None:
             self._fields = []
         self._fields.append(field)
+        self._notify_modification()
 
     def as_plain_scxml(self, ros_declarations: ScxmlRosDeclarationsContainer) -> ScxmlSend:
         assert self.check_valid_ros_instantiations(ros_declarations), \
@@ -286,7 +287,7 @@ class RosTopicPublish(ScxmlSend):
         return ScxmlSend(event_name, params)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "Error: SCXML topic publish: invalid parameters."
+        assert self.is_valid(), "Error: SCXML topic publish: invalid parameters."
         xml_topic_publish = ET.Element(RosTopicPublish.get_tag_name(), {"topic": self._topic})
         if self._fields is not None:
             for field in self._fields:
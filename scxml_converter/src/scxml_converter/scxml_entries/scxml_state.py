@@ -105,12 +105,15 @@ class ScxmlState(ScxmlBase):
 
     def add_transition(self, transition: ScxmlTransition):
         self._body.append(transition)
+        self._notify_modification()
 
     def append_on_entry(self, executable_entry: ScxmlExecutableEntry):
         self._on_entry.append(executable_entry)
+        self._notify_modification()
 
     def append_on_exit(self, executable_entry: ScxmlExecutableEntry):
         self._on_exit.append(executable_entry)
+        self._notify_modification()
 
     def check_validity(self) -> bool:
         valid_id = isinstance(self._id, str) and len(self._id) > 0
@@ -122,7 +125,7 @@ class ScxmlState(ScxmlBase):
             if valid_body:
                 for transition in self._body:
                     valid_transition = isinstance(
-                        transition, ScxmlTransition) and transition.check_validity()
+                        transition, ScxmlTransition) and transition.is_valid()
                     if not valid_transition:
                         valid_body = False
                         break
@@ -165,7 +168,7 @@ class ScxmlState(ScxmlBase):
         return ScxmlState(self._id, on_entry=plain_entry, on_exit=plain_exit, body=plain_body)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "SCXML: found invalid state object."
+        assert self.is_valid(), "SCXML: found invalid state object."
         xml_state = ET.Element(ScxmlState.get_tag_name(), {"id": self._id})
         if len(self._on_entry) > 0:
             xml_on_entry = ET.Element('onentry')
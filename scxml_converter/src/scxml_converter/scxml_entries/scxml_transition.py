@@ -90,11 +90,13 @@ class ScxmlTransition(ScxmlBase):
 
     def add_event(self, event: str):
         self._events.append(event)
+        self._notify_modification()
 
     def append_body_executable_entry(self, exec_entry: ScxmlExecutableEntry):
         if self._body is None:
             self._body = []
         self._body.append(exec_entry)
+        self._notify_modification()
         assert valid_execution_body(self._body), \
             "Error SCXML transition: invalid body after extension."
 
@@ -135,7 +137,7 @@ class ScxmlTransition(ScxmlBase):
         return ScxmlTransition(self._target, self._events, self._condition, new_body)
 
     def as_xml(self) -> ET.Element:
-        assert self.check_validity(), "SCXML: found invalid transition."
+        assert self.is_valid(), "SCXML: found invalid transition."
         xml_transition = ET.Element(ScxmlTransition.get_tag_name(), {"target": self._target})
         if len(self._events) > 0:
             xml_transition.set("event", " ".join(self._events))
@@ -17,6 +17,7 @@
 
 from typing import Dict, List, Optional, Tuple
 
+from scxml_converter.ros_interfaces_registry import get_ros_interfaces_registry
 from scxml_converter.scxml_entries.scxml_ros_field import RosField
 
 MSG_TYPE_SUBSTITUTIONS = {
@@ -46,16 +47,8 @@ def is_ros_type_known(type_definition: str, ros_interface: str) -> bool:
 
     :param type_definition: The type definition to check (e.g. std_msgs/Empty).
     """
-    if not (isinstance(type_definition, str) and type_definition.count("/") == 1):
-        return False
-    interface_ns, interface_type = type_definition.split("/")
-    if len(interface_ns) == 0 or len(interface_type) == 0:
-        return False
     assert ros_interface in ["msg", "srv"], "Error: SCXML ROS declarations: unknown ROS interface."
-    try:
-        interface_importer = __import__(interface_ns + f'.{ros_interface}', fromlist=[''])
-        _ = getattr(interface_importer, interface_type)
-    except (ImportError, AttributeError):
+    if not get_ros_interfaces_registry().is_type_known(type_definition, ros_interface):
         print(f"Error: SCXML ROS declarations: topic type {type_definition} not found.")
         return False
     return True
@@ -77,19 +70,13 @@ def get_srv_type_params(service_definition: str) -> Tuple[Dict[str, str], Dict[s
     """
     assert is_srv_type_known(service_definition), \
         "Error: SCXML ROS declarations: service type not found."
-    interface_ns, interface_type = service_definition.split("/")
-    srv_module = __import__(interface_ns + '.srv', fromlist=[''])
-    srv_class = getattr(srv_module, interface_type)
-
-    # TODO: Fields can be nested. Look AS2FM/scxml_converter/src/scxml_converter/scxml_converter.py
-    req = srv_class.Request.get_fields_and_field_types()
+    # Nested fields are flattened, e.g. pose.x
+    req, res = get_ros_interfaces_registry().get_srv_fields(service_definition)
     for key in req.keys():
-        # TODO: Support nested fields
         assert req[key] in BASIC_FIELD_TYPES, \
             f"Error: SCXML ROS declarations: service request type {req[key]} isn't a basic field."
         req[key] = MSG_TYPE_SUBSTITUTIONS.get(req[key], req[key])
 
-    res = srv_class.Response.get_fields_and_field_types()
     for key in res.keys():
         assert res[key] in BASIC_FIELD_TYPES, \
             "Error: SCXML ROS declarations: service response type contains non-basic fields."
@@ -213,6 +200,18 @@ class ScxmlRosDeclarationsContainer:
     def get_timers(self) -> Dict[str, float]:
         return self._timers
 
+    def get_publishers(self) -> Dict[str, str]:
+        return self._publishers
+
+    def get_subscribers(self) -> Dict[str, str]:
+        return self._subscribers
+
+    def get_service_clients(self) -> Dict[str, str]:
+        return self._service_clients
+
+    def get_service_servers(self) -> Dict[str, str]:
+        return self._service_servers
+
     def is_service_client_defined(self, service_name: str) -> bool:
         return service_name in self._service_clients
 
@@ -0,0 +1,128 @@
+# Copyright (c) 2024 - for information on the respective copyright owner
+# see the NOTICE file
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+
+from scxml_converter.ros_interfaces_parser import parse_srv_content
+from scxml_converter.ros_interfaces_registry import RosInterfacesRegistry
+
+ROS_INTERFACES_PATH = os.path.join(os.path.dirname(__file__), '_test_data', 'ros_interfaces')
+
+
+def test_srv_fields_are_cached():
+    """The service fields are resolved once, and the returned dictionaries can be modified."""
+    registry = RosInterfacesRegistry()
+    req_fields, res_fields = registry.get_srv_fields("example_interfaces/AddTwoInts")
+    assert req_fields == {"a": "int64", "b": "int64"}
+    assert res_fields == {"sum": "int64"}
+    req_fields.pop("a")
+    assert registry.get_srv_fields("example_interfaces/AddTwoInts")[0] == \
+        {"a": "int64", "b": "int64"}
+    assert registry.get_stats() == "ROS interfaces registry: 1 hits, 2 misses."
+
+
+def test_nested_msg_fields():
+    """The fields of nested messages are flattened."""
+    registry = RosInterfacesRegistry()
+    assert registry.get_msg_fields("std_msgs/Header") == {
+        "stamp.sec": "int32", "stamp.nanosec": "uint32", "frame_id": "string"}
+
+
+def test_unknown_interfaces():
+    """Unknown interfaces are reported as such, also when looked up again."""
+    registry = RosInterfacesRegistry()
+    for _ in range(2):
+        assert not registry.is_type_known("std_msgs/NotExisting", "msg")
+        assert not registry.is_type_known("not_a_type", "srv")
+    assert registry.is_type_known("std_msgs/Int32", "msg")
+
+
+def test_offline_interface_definitions():
+    """The interfaces are parsed from the definition files, without importing ROS packages."""
+    registry = RosInterfacesRegistry([ROS_INTERFACES_PATH])
+    assert registry.get_msg_fields("as2fm_test_interfaces/StampedPoint") == {
+        "stamp.sec": "int32", "stamp.nanosec": "uint32", "frame_id": "string<10>",
+        "point.x": "double", "point.y": "double", "valid": "boolean",
+        "history": "sequence<int16>", "color": "float[3]", "flags": "sequence<uint8, 4>"}
+    assert registry.get_srv_fields("as2fm_test_interfaces/SetTarget") == (
+        {"target.x": "double", "target.y": "double", "timeout": "int32"}, {"success": "boolean"})
+    assert not registry.is_type_known("as2fm_test_interfaces/Point2D", "srv")
+    assert not registry.is_type_known("as2fm_test_interfaces/NotExisting", "msg")
+
+
+def test_invalid_srv_definition():
+    """A service definition requires exactly one request/response separator."""
+    assert parse_srv_content("---\n", "pkg") == ({}, {})
+    for srv_content in ["int32 a\n", "int32 a\n---\n---\n"]:
+        try:
+            parse_srv_content(srv_content, "pkg")
+        except AssertionError:
+            continue
+        assert False, f"Invalid service definition accepted: {srv_content}"
+
+
+def test_schema_export():
+    """The resolved interfaces are stored in a schema, and loaded without the definition files."""
+    registry = RosInterfacesRegistry([ROS_INTERFACES_PATH])
+    expected_fields = registry.get_srv_fields("as2fm_test_interfaces/SetTarget")
+    loaded_registry = RosInterfacesRegistry()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        schema_path = os.path.join(tmp_dir, "ros_interfaces.json")
+        registry.save_schema(schema_path)
+        loaded_registry.load_schema(schema_path)
+    assert loaded_registry.get_srv_fields("as2fm_test_interfaces/SetTarget") == expected_fields
+    assert loaded_registry.export_schema() == registry.export_schema()
+
+
+def test_schema_invalidation():
+    """The stored interfaces are resolved again if their definition files change."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        interfaces_path = os.path.join(tmp_dir, "ros_interfaces")
+        shutil.copytree(ROS_INTERFACES_PATH, interfaces_path)
+        schema_path = os.path.join(tmp_dir, "ros_interfaces.json")
+        registry = RosInterfacesRegistry([interfaces_path])
+        assert registry.get_msg_fields("as2fm_test_interfaces/Point2D") == \
+            {"x": "double", "y": "double"}
+        registry.save_schema(schema_path)
+        # Unchanged definitions are taken from the schema
+        loaded_registry = RosInterfacesRegistry([interfaces_path])
+        loaded_registry.load_schema(schema_path)
+        assert loaded_registry.export_schema() == registry.export_schema()
+        # Changed definitions are parsed again
+        with open(os.path.join(interfaces_path, "as2fm_test_interfaces", "msg", "Point2D.msg"),
+                  "w", encoding="utf-8") as f:
+            f.write("float32 x\nfloat32 y\nfloat32 z\n")
+        loaded_registry = RosInterfacesRegistry([interfaces_path])
+        loaded_registry.load_schema(schema_path)
+        assert loaded_registry.get_msg_fields("as2fm_test_interfaces/Point2D") == \
+            {"x": "float", "y": "float", "z": "float"}
+        # The definitions in the search paths override the ones from the ROS packages
+        schema = registry.export_schema()
+        schema["msg"]["as2fm_test_interfaces/Point2D"]["source"] = None
+        loaded_registry = RosInterfacesRegistry([interfaces_path])
+        loaded_registry.import_schema(schema)
+        assert loaded_registry.get_msg_fields("as2fm_test_interfaces/Point2D")["z"] == "float"
+
+
+if __name__ == '__main__':
+    test_srv_fields_are_cached()
+    test_nested_msg_fields()
+    test_unknown_interfaces()
+    test_offline_interface_definitions()
+    test_invalid_srv_definition()
+    test_schema_export()
+    test_schema_invalidation()
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import os
+from xml.etree import ElementTree as ET
 
 from test_utils import canonicalize_xml, remove_empty_lines
 
@@ -23,7 +24,8 @@ from scxml_converter.scxml_entries import (RosField, RosRateCallback,
                                            RosTopicSubscriber, ScxmlAssign,
                                            ScxmlData, ScxmlDataModel,
                                            ScxmlParam, ScxmlRoot, ScxmlSend,
-                                           ScxmlState, ScxmlTransition)
+                                           ScxmlState, ScxmlTransition,
+                                           set_trust_inputs)
 
 
 def test_battery_drainer_from_code():
@@ -166,6 +168,41 @@ def test_xml_parsing_invalid_bt_topic_action_xml():
                                    'invalid_xmls', 'bt_topic_action.scxml'), valid_xml=False)
 
 
+def test_validity_cache():
+    """Test the validity checks are cached, and updated when an entry is modified."""
+    scxml_root = ScxmlRoot("CacheTest")
+    idle_state = ScxmlState("idle", body=[ScxmlTransition("idle", ["start"])])
+    scxml_root.add_state(idle_state, initial=True)
+    assert scxml_root.is_valid()
+    invalid_assign = ScxmlAssign("", "0")
+    idle_state.append_on_entry(invalid_assign)
+    assert not scxml_root.is_valid()
+    assert not scxml_root.is_valid()
+    # Fixing a nested entry updates the validity of the whole model
+    invalid_assign._location = "counter"
+    assert scxml_root.is_valid()
+    set_trust_inputs(True)
+    try:
+        idle_state.append_on_exit(ScxmlAssign("", "0"))
+        assert scxml_root.is_valid()
+    finally:
+        set_trust_inputs(False)
+    assert not scxml_root.is_valid()
+
+
+def test_data_bounds_from_xml():
+    """Test the data bounds are converted to the data type when loaded from XML."""
+    data_xml = ET.fromstring(
+        '<data id="counter" expr="0" type="int16" lower_bound_incl="-1" upper_bound_incl="10"/>')
+    scxml_data = ScxmlData.from_xml_tree(data_xml)
+    assert scxml_data.check_validity()
+    assert scxml_data.get_bounds() == (-1, 10)
+    assert ScxmlData.from_xml_tree(scxml_data.as_xml()).get_bounds() == (-1, 10)
+    assert ScxmlData("counter", "0", "int16").get_bounds() is None
+    invalid_xml = ET.fromstring('<data id="counter" expr="0" type="int16" lower_bound_incl="a"/>')
+    assert not ScxmlData.from_xml_tree(invalid_xml).check_validity()
+
+
 if __name__ == '__main__':
     test_battery_drainer_from_code()
     test_battery_drainer_ros_from_code()
@@ -173,3 +210,5 @@ if __name__ == '__main__':
     test_xml_parsing_bt_topic_condition()
     test_xml_parsing_invalid_battery_drainer_xml()
     test_xml_parsing_invalid_bt_topic_action_xml()
+    test_validity_cache()
+    test_data_bounds_from_xml()